@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
+from fastapi.responses import StreamingResponse
+from typing import List, Dict, Any, Iterator
 from ..schemas.models import (
+    Model,
     ModelsRequest,
     ModelsResponse,
 )
@@ -15,66 +17,168 @@ from ..schemas.common import (
 )
 from ..core.models import (
     get_models_from_project,
+    get_model_rows_from_project,
     get_models_with_schema_info,
+    apply_manifest_relations,
+    split_manifest_rows,
+    query_project_models,
+    query_models,
+    needs_warehouse_view,
+    MODEL_SORT_FIELDS,
+    DEFAULT_MODEL_SORT,
+    iter_models_with_schema_info,
     find_schema_file,
-    add_test_to_schema,
-    remove_test_from_schema,
+    apply_add_test_to_schema,
+    apply_remove_test_from_schema,
+)
+from ..core.write_behind import submit_mutation
+from ..core.fs_executor import run_fs_task, ProjectBusyError
+from ..core.pagination import check_list_query
+from ..core.warehouse import (
+    get_client_for_target,
+    aget_client_for_target,
+    get_profile_name_from_dbt_project,
 )
-from ..core.warehouse import get_client_for_target, get_profile_name_from_dbt_project
 from ..core.tests import get_available_model_test_types
 import os
 
 router = APIRouter()
 
 
+async def _match_with_warehouse(request: ModelsRequest, models: List[Model]) -> None:
+    """Fill in schema and table of models by matching them with warehouse tables."""
+    try:
+        # Get profile name from dbt_project.yml if not provided
+        profile_name = get_profile_name_from_dbt_project(request.dbt_project_path)
+
+        if not profile_name:
+            raise ValueError(
+                "Could not determine profile name from dbt_project.yml"
+            )
+
+        # Get warehouse client; creating it may import the driver
+        client = await aget_client_for_target(
+            request.profiles_yml_path, profile_name, request.target_name
+        )
+
+        if not client:
+            raise ValueError("Failed to create warehouse client")
+
+        # Get all schemas and tables from the warehouse in one go
+        schemas = await client.aget_catalog()
+        await client.adisconnect()
+
+        # Match models with schemas and tables
+        get_models_with_schema_info(request.dbt_project_path, models, schemas)
+    except Exception as e:
+        # If we fail to connect to the warehouse, we still return the models
+        # but without schema and table information
+        print(f"Warning: Could not get schema information: {str(e)}")
+
+
 @router.post("/models", response_model=ModelsResponse)
 async def get_models(request: ModelsRequest):
     try:
-        # First get all models from the project
-        models = get_models_from_project(request.dbt_project_path)
-
-        # Try to connect to the warehouse and get schema information
-        try:
-            # Get profile name from dbt_project.yml if not provided
-            profile_name = get_profile_name_from_dbt_project(request.dbt_project_path)
-
-            if not profile_name:
-                raise ValueError(
-                    "Could not determine profile name from dbt_project.yml"
-                )
-
-            # Get warehouse client
-            client = get_client_for_target(
-                request.profiles_yml_path, profile_name, request.target_name
+        check_list_query(request, MODEL_SORT_FIELDS, DEFAULT_MODEL_SORT)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        warehouse_view = needs_warehouse_view(request)
+        if warehouse_view:
+            # Sorting or filtering on schema needs every model matched first
+            models = await run_fs_task(
+                request.dbt_project_path, get_models_from_project, request.dbt_project_path
+            )
+        else:
+            # Page through the project index; only the page is matched below
+            models, next_cursor, total = await run_fs_task(
+                request.dbt_project_path, query_project_models, request.dbt_project_path, request
             )
 
-            if not client:
-                raise ValueError("Failed to create warehouse client")
+        # Models in target/manifest.json get their relation from it; only
+        # the others are matched against the warehouse catalog
+        unresolved = await run_fs_task(
+            request.dbt_project_path, apply_manifest_relations, request.dbt_project_path, models
+        )
+        if unresolved:
+            await _match_with_warehouse(request, unresolved)
 
-            # Get schemas and tables from the warehouse
-            schemas_list = client.get_schemas()
-            schemas = []
+        if warehouse_view:
+            models, next_cursor, total = query_models(models, request)
 
-            # For each schema, get its tables
-            for schema_name in schemas_list:
-                tables = client.get_tables(schema_name)
-                schemas.append({"schema": schema_name, "tables": tables})
+        return ModelsResponse(models=models, next_cursor=next_cursor, total=total)
+    except ProjectBusyError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-            client.disconnect()
 
-            # Match models with schemas and tables
-            models = get_models_with_schema_info(
-                request.dbt_project_path, models, schemas
-            )
-        except Exception as e:
-            # If we fail to connect to the warehouse, we still return the models
-            # but without schema and table information
-            print(f"Warning: Could not get schema information: {str(e)}")
+def _iter_warehouse_schemas(client) -> Iterator[Dict[str, Any]]:
+    """
+    Yield each warehouse schema with its tables. The tables of a schema are
+    only listed once the models matched in the previous one have been sent.
+    """
+    try:
+        for schema in client.get_schemas():
+            yield {'schema': schema, 'tables': client.get_tables(schema)}
+    except Exception as e:
+        print(f"Warning: Could not get schema information: {str(e)}")
+    finally:
+        client.disconnect()
+
+
+def _stream_models(request: ModelsRequest, rows) -> Iterator[str]:
+    # Models with a relation in manifest.json are sent right away
+    resolved, unresolved = split_manifest_rows(request.dbt_project_path, rows)
+    for model in resolved:
+        yield model.model_dump_json() + "\n"
+    if not unresolved:
+        return
+
+    schemas: Iterator[Dict[str, Any]] = iter(())
+    try:
+        profile_name = get_profile_name_from_dbt_project(request.dbt_project_path)
+        if not profile_name:
+            raise ValueError("Could not determine profile name from dbt_project.yml")
+
+        client = get_client_for_target(
+            request.profiles_yml_path, profile_name, request.target_name
+        )
+        if not client:
+            raise ValueError("Failed to create warehouse client")
 
-        return ModelsResponse(models=models)
+        schemas = _iter_warehouse_schemas(client)
+    except Exception as e:
+        # Models are still streamed, without schema and table information
+        print(f"Warning: Could not get schema information: {str(e)}")
+
+    # Each Model is only built when its line is sent
+    for model in iter_models_with_schema_info(unresolved, schemas):
+        yield model.model_dump_json() + "\n"
+
+
+@router.post("/models/stream")
+async def stream_models(request: ModelsRequest):
+    """
+    Stream models as NDJSON, one model per line. Models found in
+    manifest.json come first, the others as soon as their warehouse table is
+    matched; unmatched models follow at the end.
+    """
+    try:
+        rows = await run_fs_task(
+            request.dbt_project_path, get_model_rows_from_project, request.dbt_project_path
+        )
+    except ProjectBusyError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    # A sync iterator is consumed in the threadpool, off the event loop
+    return StreamingResponse(
+        _stream_models(request, rows), media_type="application/x-ndjson"
+    )
+
 
 @router.get("/models/test-types", response_model=TestTypesResponse)
 async def get_model_test_types():
@@ -96,8 +200,8 @@ async def get_table_columns(request: TableColumnsRequest):
         if not profile_name:
             raise ValueError("Could not determine profile name from dbt_project.yml")
 
-        # Get warehouse client
-        client = get_client_for_target(
+        # Get warehouse client; creating it may import the driver
+        client = await aget_client_for_target(
             request.profiles_yml_path, profile_name, request.target_name
         )
 
@@ -105,8 +209,8 @@ async def get_table_columns(request: TableColumnsRequest):
             raise ValueError("Failed to create warehouse client")
 
         # Get table info which includes column information
-        table_info = client.get_table_info(request.schema, request.table)
-        client.disconnect()
+        table_info = await client.aget_table_info(request.schema, request.table)
+        await client.adisconnect()
 
         if not table_info:
             raise ValueError(f"Table {request.schema}.{request.table} not found")
@@ -129,15 +233,23 @@ async def add_test(request: AddTestRequest):
     """Add a new test to a model"""
     try:
         # Find or create the schema.yml file for the model
-        schema_path = find_schema_file(request.model_path, request.dbt_project_path)
+        schema_path = await run_fs_task(
+            request.dbt_project_path, find_schema_file, request.model_path, request.dbt_project_path
+        )
 
         # Extract model name from the SQL file path
         model_filename = os.path.basename(request.model_path)
         model_name = os.path.splitext(model_filename)[0]  # Remove extension
 
-        # Add the test to the schema
-        success = add_test_to_schema(
-            schema_path, model_name, request.test_config, request.column_name
+        def add(schema: Dict[str, Any]) -> bool:
+            apply_add_test_to_schema(
+                schema, model_name, request.test_config, request.column_name
+            )
+            return True
+
+        # Add the test to the schema, merged with other edits of the file
+        success = await submit_mutation(
+            request.dbt_project_path, schema_path, add, default_flow_style=False
         )
 
         if not success:
@@ -147,6 +259,8 @@ async def add_test(request: AddTestRequest):
             success=True,
             message=f"Test added successfully to {request.schema}.{request.table}",
         )
+    except ProjectBusyError:
+        raise
     except Exception as e:
         return OperationResponse(success=False, message=str(e))
 
@@ -156,7 +270,9 @@ async def remove_test(request: RemoveTestRequest):
     """Remove a test from a model"""
     try:
         # Find the schema.yml file for the model
-        schema_path = find_schema_file(request.model_path, request.dbt_project_path)
+        schema_path = await run_fs_task(
+            request.dbt_project_path, find_schema_file, request.model_path, request.dbt_project_path
+        )
 
         # Extract model name from the SQL file path
         model_filename = os.path.basename(request.model_path)
@@ -172,9 +288,14 @@ async def remove_test(request: RemoveTestRequest):
             column_name = parts[0]
             test_name = parts[1]
 
-        # Remove the test from the schema
-        success = remove_test_from_schema(
-            schema_path, model_name, test_name, column_name
+        # Remove the test from the schema, merged with other edits of the file
+        success = await submit_mutation(
+            request.dbt_project_path,
+            schema_path,
+            lambda schema: apply_remove_test_from_schema(
+                schema, model_name, test_name, column_name
+            ),
+            default_flow_style=False,
         )
 
         if not success:
@@ -183,5 +304,7 @@ async def remove_test(request: RemoveTestRequest):
         return OperationResponse(
             success=True, message=f"Test removed successfully from {model_name}"
         )
+    except ProjectBusyError:
+        raise
     except Exception as e:
         return OperationResponse(success=False, message=str(e))
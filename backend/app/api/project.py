@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
-from ..core.models import get_models_from_project
-from ..core.sources import get_sources_from_project 
+from ..core.project_index import get_project_snapshot
+from ..core.fs_executor import run_fs_task, ProjectBusyError
 from ..schemas.project import ProjectSettings
 
 router = APIRouter()
@@ -11,11 +11,10 @@ async def get_models_and_sources(settings: ProjectSettings):
     try:
         project_path = settings.dbt_project_path
         
-        # Get models using existing function
-        models = get_models_from_project(project_path)
-        
-        # Get sources using existing function
-        sources = get_sources_from_project(project_path)
+        # Walk and parse the project once for both models and sources
+        snapshot = await run_fs_task(project_path, get_project_snapshot, project_path)
+        models = snapshot.get_models()
+        sources = snapshot.sources
         
         # Format models with ref() syntax
         formatted_models = [
@@ -46,5 +45,7 @@ async def get_models_and_sources(settings: ProjectSettings):
             "sources": formatted_sources
         }
         
+    except ProjectBusyError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Response
 from app.schemas.project import ProjectSettings
+from app.core.project_watcher import start_project_watcher
 
 router = APIRouter()
 
@@ -11,6 +12,8 @@ project_settings = None
 async def save_project_settings(settings: ProjectSettings, response: Response):
     global project_settings
     project_settings = settings
+    # Keep the project index in sync with the newly configured project
+    await start_project_watcher(settings.dbt_project_path)
     response.status_code = 201
     return {"message": "Project settings saved successfully"}
 
@@ -1,6 +1,8 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import List, Dict, Any
 from ..schemas.sources import (
+    Source,
     SourcesRequest,
     SourcesResponse,
     UpdateSourceRequest,
@@ -17,12 +19,18 @@ from ..schemas.common import (
 )
 from ..core.sources import (
     get_sources_from_project,
-    add_test_to_source,
-    remove_test_from_source,
-    find_source_file,
+    query_project_sources,
+    SOURCE_SORT_FIELDS,
+    DEFAULT_SOURCE_SORT,
+    apply_add_test_to_source,
+    apply_remove_test_from_source,
+    find_source_location,
     update_source,
     delete_source
 )
+from ..core.pagination import check_list_query
+from ..core.write_behind import submit_mutation, flush_writes
+from ..core.fs_executor import run_fs_task, ProjectBusyError
 from ..core.warehouse import get_client_for_target, get_profile_name_from_dbt_project
 from ..core.tests import get_available_source_test_types
 import os
@@ -32,32 +40,66 @@ router = APIRouter()
 @router.post("/sources", response_model=SourcesResponse)
 async def get_sources(request: SourcesRequest):
     try:
-        sources = get_sources_from_project(request.dbt_project_path)
-        return SourcesResponse(sources=sources)
+        check_list_query(request, SOURCE_SORT_FIELDS, DEFAULT_SOURCE_SORT)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        sources, next_cursor, total = await run_fs_task(
+            request.dbt_project_path, query_project_sources, request.dbt_project_path, request
+        )
+        return SourcesResponse(sources=sources, next_cursor=next_cursor, total=total)
+    except ProjectBusyError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/sources/stream")
+async def stream_sources(request: SourcesRequest):
+    """Stream sources as NDJSON, one source table per line."""
+    try:
+        sources = await run_fs_task(
+            request.dbt_project_path, get_sources_from_project, request.dbt_project_path
+        )
+    except ProjectBusyError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return StreamingResponse(
+        (Source(**source).model_dump_json() + "\n" for source in sources),
+        media_type="application/x-ndjson"
+    )
+
 @router.post("/sources/add-test", response_model=OperationResponse)
 async def add_source_test(request: AddTestRequest):
     """Add a new test to a source table"""
     try:
         # Find the source file
-        source_file = find_source_file(
+        location = await run_fs_task(
+            request.dbt_project_path,
+            find_source_location,
             request.dbt_project_path,
             request.source,
             request.table
         )
         
-        if not source_file:
+        if not location:
             raise ValueError(f"Source file not found for {request.source}.{request.table}")
         
-        # Add the test to the source
-        success = add_test_to_source(
-            source_file,
-            request.source,
-            request.table,
-            request.test_config,
-            request.column_name
+        # Add the test to the source, merged with other edits of the file
+        success = await submit_mutation(
+            request.dbt_project_path,
+            location.path,
+            lambda data: apply_add_test_to_source(
+                data,
+                request.source,
+                request.table,
+                request.test_config,
+                request.column_name,
+                (location.source_index, location.table_index)
+            ),
+            sort_keys=False
         )
         
         if not success:
@@ -67,6 +109,8 @@ async def add_source_test(request: AddTestRequest):
             success=True,
             message=f"Test added successfully to {request.source}.{request.table}"
         )
+    except ProjectBusyError:
+        raise
     except Exception as e:
         return OperationResponse(
             success=False,
@@ -78,22 +122,30 @@ async def remove_source_test(request: RemoveTestRequest):
     """Remove a test from a source table"""
     try:
         # Find the source file
-        source_file = find_source_file(
+        location = await run_fs_task(
+            request.dbt_project_path,
+            find_source_location,
             request.dbt_project_path,
             request.source_name,
             request.table_name
         )
         
-        if not source_file:
+        if not location:
             raise ValueError(f"Source file not found for {request.source_name}.{request.table_name}")
         
-        # Remove the test from the source
-        success = remove_test_from_source(
-            source_file,
-            request.source_name,
-            request.table_name,
-            request.test_name,
-            request.column_name
+        # Remove the test from the source, merged with other edits of the file
+        success = await submit_mutation(
+            request.dbt_project_path,
+            location.path,
+            lambda data: apply_remove_test_from_source(
+                data,
+                request.source_name,
+                request.table_name,
+                request.test_name,
+                request.column_name,
+                (location.source_index, location.table_index)
+            ),
+            sort_keys=False
         )
         
         if not success:
@@ -103,6 +155,8 @@ async def remove_source_test(request: RemoveTestRequest):
             success=True,
             message=f"Test removed successfully from {request.source_name}.{request.table_name}"
         )
+    except ProjectBusyError:
+        raise
     except Exception as e:
         return OperationResponse(
             success=False,
@@ -112,7 +166,11 @@ async def remove_source_test(request: RemoveTestRequest):
 @router.put("/sources", response_model=OperationResponse)
 async def update_source_endpoint(request: UpdateSourceRequest):
     try:
-        success = update_source(
+        # Rewrites below read the file from disk, so write deferred edits first
+        await flush_writes(request.dbt_project_path)
+        success = await run_fs_task(
+            request.dbt_project_path,
+            update_source,
             request.dbt_project_path,
             request.original_source,
             request.original_table,
@@ -129,13 +187,18 @@ async def update_source_endpoint(request: UpdateSourceRequest):
                 success=False,
                 message="Failed to update source. Check logs for details."
             )
+    except ProjectBusyError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/sources", response_model=OperationResponse)
 async def delete_source_endpoint(request: DeleteSourceRequest):
     try:
-        success = delete_source(
+        await flush_writes(request.dbt_project_path)
+        success = await run_fs_task(
+            request.dbt_project_path,
+            delete_source,
             request.dbt_project_path,
             request.source,
             request.table
@@ -151,6 +214,8 @@ async def delete_source_endpoint(request: DeleteSourceRequest):
                 success=False,
                 message="Failed to delete source. Check logs for details."
             )
+    except ProjectBusyError:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
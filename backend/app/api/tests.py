@@ -0,0 +1,22 @@
+from fastapi import APIRouter, HTTPException
+from ..core.batch import apply_test_batch
+from ..core.write_behind import flush_writes
+from ..core.fs_executor import run_fs_task, ProjectBusyError
+from ..schemas.common import BatchTestRequest, BatchTestResponse
+
+router = APIRouter()
+
+@router.post("/tests/batch", response_model=BatchTestResponse)
+async def apply_tests_batch(request: BatchTestRequest):
+    """Add and remove tests on many models and sources, writing each file once"""
+    try:
+        # The batch reads files from disk, so write deferred edits first
+        await flush_writes(request.dbt_project_path)
+        results, files_written = await run_fs_task(
+            request.dbt_project_path, apply_test_batch, request.dbt_project_path, request.operations
+        )
+        return BatchTestResponse(results=results, files_written=files_written)
+    except ProjectBusyError:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
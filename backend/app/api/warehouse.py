@@ -4,13 +4,20 @@ from ..schemas.warehouse import (
     SchemaResponse,
     TablesResponse,
     CreateSourcesRequest,
-    OperationResponse
+    OperationResponse,
+    CatalogCacheInvalidateRequest,
+    CatalogCacheStatsResponse
 )
 from ..core.warehouse import (
-    get_client_for_target,
-    get_profile_name_from_dbt_project
+    aget_client_for_target,
+    get_target_key,
+    get_profile_name_from_dbt_project,
+    invalidate_catalog_cache,
+    get_catalog_cache_stats
 )
 from ..core.sources import create_sources
+from ..core.write_behind import flush_writes
+from ..core.fs_executor import run_fs_task, ProjectBusyError
 
 router = APIRouter()
 
@@ -27,7 +34,7 @@ async def get_schemas(request: WarehouseConnectionRequest):
         if not profile_name:
             raise HTTPException(status_code=400, detail="Profile name not provided and could not be determined from dbt_project.yml")
         
-        client = get_client_for_target(
+        client = await aget_client_for_target(
             request.profiles_yml_path,
             profile_name,
             request.target_name
@@ -36,8 +43,8 @@ async def get_schemas(request: WarehouseConnectionRequest):
         if not client:
             raise HTTPException(status_code=500, detail="Failed to connect to warehouse. Check profiles.yml configuration.")
         
-        schemas = client.get_schemas()
-        client.disconnect()
+        schemas = await client.aget_schemas()
+        await client.adisconnect()
         
         return SchemaResponse(schemas=schemas)
     except Exception as e:
@@ -56,7 +63,7 @@ async def get_tables(request: WarehouseConnectionRequest, schema: str):
         if not profile_name:
             raise HTTPException(status_code=400, detail="Profile name not provided and could not be determined from dbt_project.yml")
         
-        client = get_client_for_target(
+        client = await aget_client_for_target(
             request.profiles_yml_path,
             profile_name,
             request.target_name
@@ -65,8 +72,8 @@ async def get_tables(request: WarehouseConnectionRequest, schema: str):
         if not client:
             raise HTTPException(status_code=500, detail="Failed to connect to warehouse. Check profiles.yml configuration.")
         
-        tables = client.get_tables(schema)
-        client.disconnect()
+        tables = await client.aget_tables(schema)
+        await client.adisconnect()
         
         return TablesResponse(tables=tables)
     except Exception as e:
@@ -76,7 +83,11 @@ async def get_tables(request: WarehouseConnectionRequest, schema: str):
 async def create_new_sources(request: CreateSourcesRequest):
     """Create new sources in a dbt project."""
     try:
-        success = create_sources(
+        # create_sources reads the file from disk, so write deferred edits first
+        await flush_writes(request.dbt_project_path)
+        success = await run_fs_task(
+            request.dbt_project_path,
+            create_sources,
             request.dbt_project_path,
             request.source_name,
             request.schema_name,
@@ -93,5 +104,41 @@ async def create_new_sources(request: CreateSourcesRequest):
                 success=False,
                 message="Failed to create sources. Check logs for details."
             )
+    except ProjectBusyError:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/warehouse/cache", response_model=CatalogCacheStatsResponse)
+async def catalog_cache_stats():
+    """Report the size and hit/miss counts of the warehouse metadata cache."""
+    return CatalogCacheStatsResponse(**get_catalog_cache_stats())
+
+@router.post("/warehouse/cache/invalidate", response_model=CatalogCacheStatsResponse)
+async def invalidate_catalog(request: CatalogCacheInvalidateRequest):
+    """Drop cached warehouse metadata for a target, schema or table, or all of it."""
+    try:
+        target_key = None
+        if request.profiles_yml_path and request.target_name:
+            profile_name = request.profile_name
+            if not profile_name and request.dbt_project_path:
+                profile_name = get_profile_name_from_dbt_project(request.dbt_project_path)
+            
+            if not profile_name:
+                raise HTTPException(status_code=400, detail="Profile name not provided and could not be determined from dbt_project.yml")
+            
+            target_key = get_target_key(request.profiles_yml_path, profile_name, request.target_name)
+            if not target_key:
+                raise HTTPException(status_code=400, detail="Target not found in profiles.yml")
+        elif request.schema_name or request.table_name:
+            raise HTTPException(status_code=400, detail="profiles_yml_path and target_name are required to invalidate a schema or table")
+        
+        if request.table_name and not request.schema_name:
+            raise HTTPException(status_code=400, detail="schema_name is required to invalidate a table")
+        
+        invalidated = invalidate_catalog_cache(target_key, request.schema_name, request.table_name)
+        return CatalogCacheStatsResponse(invalidated=invalidated, **get_catalog_cache_stats())
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, HTTPException
+from ..core.write_behind import flush_writes, get_write_status
+from ..schemas.writes import FlushRequest, WriteStatusResponse
+
+router = APIRouter()
+
+@router.get("/writes/status", response_model=WriteStatusResponse)
+async def write_status():
+    """Report edits that are not yet written to disk"""
+    return WriteStatusResponse(**get_write_status())
+
+@router.post("/writes/flush", response_model=WriteStatusResponse)
+async def flush(request: FlushRequest):
+    """Write pending edits now and report what is left"""
+    try:
+        await flush_writes(request.dbt_project_path)
+        return WriteStatusResponse(**get_write_status())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,8 +1,91 @@
 """
 Central configuration file for constants used across the application.
 """
+import os
 
 # Default key to use for storing tests in YAML files
 # Can be either 'tests' or 'data_tests'
 # If there is already defined in yml files for test, things will be append to it
-TESTS_YAML_KEY = 'tests' 
\ No newline at end of file
+TESTS_YAML_KEY = 'tests'
+
+# Watch the configured project's models directory and push changes into the
+# project index, so requests never walk or stat the tree themselves
+WATCH_PROJECT_FILES = os.getenv('WATCH_PROJECT_FILES', 'true').lower() == 'true'
+
+# Quiet period in milliseconds used to batch bursts of file events
+# (e.g. a branch checkout) into a single re-parse
+WATCH_DEBOUNCE_MS = int(os.getenv('WATCH_DEBOUNCE_MS', '1600'))
+
+# Number of worker processes used to parse YAML files when the project index
+# is built cold; 1 disables the process pool
+PARSE_WORKERS = int(os.getenv('PARSE_WORKERS', str(os.cpu_count() or 1)))
+
+# Below this many files to parse, parsing in-process is cheaper than
+# shipping the work to the pool
+PARSE_POOL_MIN_FILES = int(os.getenv('PARSE_POOL_MIN_FILES', '200'))
+
+# Persist the extracted per-file records of the project index on disk, so a
+# fresh process does not have to re-parse unchanged YAML files
+INDEX_CACHE_ENABLED = os.getenv('INDEX_CACHE_ENABLED', 'true').lower() == 'true'
+INDEX_CACHE_DIR = os.getenv(
+    'INDEX_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'dbt-project-manager')
+)
+# A cold build saves the cache right away; incremental changes are saved at
+# most once per INDEX_CACHE_SAVE_DELAY_S, and at shutdown
+INDEX_CACHE_SAVE_DELAY_S = float(os.getenv('INDEX_CACHE_SAVE_DELAY_S', '30'))
+
+# Write-behind mode for test edits: apply them in memory and to the project
+# index immediately, and write the YAML file once it has been quiet for
+# WRITE_BEHIND_DELAY_MS (but no later than WRITE_BEHIND_MAX_DELAY_MS after
+# its first unwritten edit). Unflushed edits are lost if the process dies.
+WRITE_BEHIND_ENABLED = os.getenv('WRITE_BEHIND_ENABLED', 'false').lower() == 'true'
+WRITE_BEHIND_DELAY_MS = int(os.getenv('WRITE_BEHIND_DELAY_MS', '2000'))
+WRITE_BEHIND_MAX_DELAY_MS = int(os.getenv('WRITE_BEHIND_MAX_DELAY_MS', '10000'))
+
+# Per-schema table listing when a warehouse catalog cannot be read in one
+# query: number of schemas fetched concurrently, and how long to wait in
+# total before returning the schemas that did finish
+CATALOG_FETCH_WORKERS = int(os.getenv('CATALOG_FETCH_WORKERS', '8'))
+CATALOG_FETCH_TIMEOUT_S = float(os.getenv('CATALOG_FETCH_TIMEOUT_S', '30'))
+
+# Process-wide Postgres connection pools, one per distinct target config.
+# Idle connections above the minimum are closed after PG_POOL_IDLE_TIMEOUT_S;
+# a connection idle for longer than PG_POOL_HEALTHCHECK_AFTER_S is checked
+# with a trivial query before being handed out.
+PG_POOL_MIN_SIZE = int(os.getenv('PG_POOL_MIN_SIZE', '1'))
+PG_POOL_MAX_SIZE = int(os.getenv('PG_POOL_MAX_SIZE', '10'))
+PG_POOL_IDLE_TIMEOUT_S = float(os.getenv('PG_POOL_IDLE_TIMEOUT_S', '300'))
+PG_POOL_HEALTHCHECK_AFTER_S = float(os.getenv('PG_POOL_HEALTHCHECK_AFTER_S', '30'))
+PG_POOL_WAIT_TIMEOUT_S = float(os.getenv('PG_POOL_WAIT_TIMEOUT_S', '30'))
+
+# In-memory cache of warehouse metadata, keyed by target config. Entries are
+# fresh for their level's TTL; after that they are still served for up to
+# CATALOG_CACHE_STALE_S while a background refresh fetches a new copy. At
+# most CATALOG_CACHE_MAX_ENTRIES entries are kept, least recently used first
+# out. Empty results (an empty warehouse, or an error a client swallowed)
+# are cached for the shorter CATALOG_CACHE_EMPTY_TTL_S. Set
+# CATALOG_CACHE_ENABLED=false to always query the warehouse.
+CATALOG_CACHE_ENABLED = os.getenv('CATALOG_CACHE_ENABLED', 'true').lower() == 'true'
+CATALOG_CACHE_SCHEMAS_TTL_S = float(os.getenv('CATALOG_CACHE_SCHEMAS_TTL_S', '600'))
+CATALOG_CACHE_TABLES_TTL_S = float(os.getenv('CATALOG_CACHE_TABLES_TTL_S', '300'))
+CATALOG_CACHE_COLUMNS_TTL_S = float(os.getenv('CATALOG_CACHE_COLUMNS_TTL_S', '300'))
+CATALOG_CACHE_EMPTY_TTL_S = float(os.getenv('CATALOG_CACHE_EMPTY_TTL_S', '30'))
+CATALOG_CACHE_STALE_S = float(os.getenv('CATALOG_CACHE_STALE_S', '3600'))
+CATALOG_CACHE_MAX_ENTRIES = int(os.getenv('CATALOG_CACHE_MAX_ENTRIES', '2000'))
+CATALOG_CACHE_REFRESH_WORKERS = int(os.getenv('CATALOG_CACHE_REFRESH_WORKERS', '2'))
+
+# Threads running blocking warehouse driver calls (psycopg2, BigQuery) for
+# async route handlers. At most this many warehouse calls run at once; more
+# wait for a free thread instead of blocking the event loop.
+WAREHOUSE_WORKERS = int(os.getenv('WAREHOUSE_WORKERS', '16'))
+
+# Filesystem-heavy request work (walking the project, parsing YAML) runs on
+# a dedicated pool of FS_WORKERS threads. Each project runs at most
+# FS_PROJECT_CONCURRENCY such tasks at once with up to FS_PROJECT_QUEUE_DEPTH
+# more waiting; requests beyond that get a 503 with a Retry-After of
+# FS_RETRY_AFTER_S seconds instead of piling up.
+FS_WORKERS = int(os.getenv('FS_WORKERS', '4'))
+FS_PROJECT_CONCURRENCY = int(os.getenv('FS_PROJECT_CONCURRENCY', '2'))
+FS_PROJECT_QUEUE_DEPTH = int(os.getenv('FS_PROJECT_QUEUE_DEPTH', '8'))
+FS_RETRY_AFTER_S = int(os.getenv('FS_RETRY_AFTER_S', '1'))
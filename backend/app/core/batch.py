@@ -0,0 +1,122 @@
+"""
+Batch application of test operations across models and sources.
+
+Operations are grouped by the YAML file they touch. Each file is read
+once under its write lock, every operation for it is applied in memory in
+request order, and the file is atomically written once if anything changed.
+An operation that fails leaves no part of its edit in the written file.
+"""
+import os
+from typing import Any, Dict, List, Optional, Tuple
+from ..schemas.common import TestOperation
+from .models import find_schema_file, apply_add_test_to_schema, apply_remove_test_from_schema
+from .sources import find_source_location, apply_add_test_to_source, apply_remove_test_from_source
+from .yaml_writes import update_yaml_file_many
+
+
+def _resolve_operation(dbt_project_path: str, op: TestOperation) -> Tuple[str, Optional[Tuple[int, int]]]:
+    """
+    Return (yaml path, position hint) for an operation, raising ValueError
+    if the operation is incomplete or its target cannot be found.
+    """
+    if op.action == 'add' and not op.test_config:
+        raise ValueError("test_config is required to add a test")
+    if op.action == 'remove' and not op.test_name:
+        raise ValueError("test_name is required to remove a test")
+
+    if op.target == 'model':
+        if not op.model_path:
+            raise ValueError("model_path is required for model tests")
+        return find_schema_file(op.model_path, dbt_project_path), None
+
+    if not op.source_name or not op.table_name:
+        raise ValueError("source_name and table_name are required for source tests")
+    location = find_source_location(dbt_project_path, op.source_name, op.table_name)
+    if not location:
+        raise ValueError(f"Source file not found for {op.source_name}.{op.table_name}")
+    return location.path, (location.source_index, location.table_index)
+
+
+def _apply_operation(data: Dict[str, Any], op: TestOperation, position: Optional[Tuple[int, int]]) -> bool:
+    """Apply one operation to a parsed YAML document. Returns True on success."""
+    if op.target == 'model':
+        model_name = os.path.splitext(os.path.basename(op.model_path))[0]
+        if op.action == 'add':
+            apply_add_test_to_schema(data, model_name, op.test_config, op.column_name)
+            return True
+
+        # Same "column: test" convention as /models/remove-test
+        column_name, test_name = op.column_name, op.test_name
+        if not column_name and ": " in test_name:
+            column_name, test_name = test_name.split(": ", 1)
+        return apply_remove_test_from_schema(data, model_name, test_name, column_name)
+
+    if op.action == 'add':
+        return apply_add_test_to_source(
+            data, op.source_name, op.table_name, op.test_config, op.column_name, position
+        )
+    return apply_remove_test_from_source(
+        data, op.source_name, op.table_name, op.test_name, op.column_name, position
+    )
+
+
+def _describe(op: TestOperation) -> str:
+    if op.target == 'model':
+        return os.path.splitext(os.path.basename(op.model_path))[0]
+    return f"{op.source_name}.{op.table_name}"
+
+
+def apply_test_batch(
+    dbt_project_path: str, operations: List[TestOperation]
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Apply test operations with one read and at most one write per file.
+    Returns (results, files_written), with one result dict per operation.
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(operations)
+    groups: Dict[str, List[Tuple[int, TestOperation, Optional[Tuple[int, int]]]]] = {}
+
+    for i, op in enumerate(operations):
+        try:
+            path, position = _resolve_operation(dbt_project_path, op)
+        except Exception as e:
+            results[i] = {'index': i, 'success': False, 'message': str(e)}
+            continue
+        groups.setdefault(path, []).append((i, op, position))
+
+    files_written = []
+    for path, group in groups.items():
+        # Keep source files in declaration order, as the single-test endpoints do
+        if any(op.target == 'source' for _i, op, _position in group):
+            dump_kwargs = {'sort_keys': False}
+        else:
+            dump_kwargs = {'default_flow_style': False}
+
+        mutations = [
+            lambda data, op=op, position=position: _apply_operation(data, op, position)
+            for _i, op, position in group
+        ]
+        try:
+            outcomes = update_yaml_file_many(path, mutations, **dump_kwargs)
+        except Exception as e:
+            print(f"Error updating {path}: {str(e)}")
+            for i, _op, _position in group:
+                results[i] = {'index': i, 'success': False, 'message': f"Error updating {path}: {str(e)}"}
+            continue
+
+        for (i, op, _position), (ok, result) in zip(group, outcomes):
+            if not ok:
+                print(f"Error applying test operation {i}: {str(result)}")
+            success = ok and result
+            if success:
+                verb = 'added to' if op.action == 'add' else 'removed from'
+                message = f"Test {verb} {_describe(op)}"
+            elif op.action == 'add':
+                message = f"Failed to add test to {_describe(op)}"
+            else:
+                message = f"Test not found on {_describe(op)}"
+            results[i] = {'index': i, 'success': success, 'message': message}
+        if any(ok and result for ok, result in outcomes):
+            files_written.append(path)
+
+    return results, files_written
@@ -0,0 +1,81 @@
+"""
+Bounded executor and admission control for filesystem-heavy request work.
+
+Walking a project and parsing its YAML blocks the calling thread, so route
+handlers await run_fs_task instead of doing it on the event loop. Work runs
+on FS_WORKERS threads; per project, at most FS_PROJECT_CONCURRENCY tasks run
+at once and at most FS_PROJECT_QUEUE_DEPTH wait for a slot. A request that
+would queue beyond that fails fast with ProjectBusyError, which the app turns
+into a 503 with Retry-After, so bursts from many browser tabs cannot build a
+backlog that every later request has to wait through.
+"""
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+from ..config.constants import FS_WORKERS, FS_PROJECT_CONCURRENCY, FS_PROJECT_QUEUE_DEPTH, FS_RETRY_AFTER_S
+
+
+class ProjectBusyError(Exception):
+    """Raised when a project already has as much filesystem work queued as allowed."""
+
+    def __init__(self, dbt_project_path: str, retry_after: int = FS_RETRY_AFTER_S):
+        super().__init__(f"Too many requests in progress for {dbt_project_path}, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class _ProjectSlots:
+    """Running and waiting filesystem tasks of one project."""
+
+    def __init__(self):
+        self.semaphore = asyncio.Semaphore(max(1, FS_PROJECT_CONCURRENCY))
+        self.admitted = 0
+
+
+_slots: Dict[str, _ProjectSlots] = {}
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_fs_executor() -> ThreadPoolExecutor:
+    """Return the process-wide filesystem executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max(1, FS_WORKERS), thread_name_prefix='fs')
+        return _executor
+
+
+async def run_fs_task(dbt_project_path: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """
+    Run blocking filesystem work for a project on the filesystem executor.
+    Raises ProjectBusyError if the project's queue is full.
+    """
+    key = os.path.abspath(dbt_project_path)
+    slots = _slots.get(key)
+    if slots is None:
+        slots = _slots[key] = _ProjectSlots()
+    if slots.admitted >= max(1, FS_PROJECT_CONCURRENCY) + FS_PROJECT_QUEUE_DEPTH:
+        raise ProjectBusyError(dbt_project_path)
+
+    slots.admitted += 1
+    try:
+        async with slots.semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                get_fs_executor(), functools.partial(fn, *args, **kwargs)
+            )
+    finally:
+        slots.admitted -= 1
+        if not slots.admitted and _slots.get(key) is slots:
+            del _slots[key]
+
+
+def shutdown_fs_executor() -> None:
+    """Stop the filesystem executor. Called on application shutdown."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor:
+        executor.shutdown(wait=False, cancel_futures=True)
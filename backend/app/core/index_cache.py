@@ -0,0 +1,112 @@
+"""
+On-disk cache of the FileRecords extracted by the project index.
+
+After a restart or deploy the index loads this cache and re-parses only the
+YAML files whose (mtime, size) changed and whose content hash no longer
+matches. Records are stored with pickle, which loads a large project in
+milliseconds. The cache is versioned with the record format and a
+fingerprint of app/schemas, so changes to either invalidate it.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Dict, Optional, Tuple
+from ..config.constants import INDEX_CACHE_DIR
+
+# Bump whenever FileRecord or the extraction logic changes shape
+RECORD_FORMAT_VERSION = 1
+
+SCHEMAS_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'schemas')
+
+# path -> ((mtime_ns, size), record)
+CacheEntries = Dict[str, Tuple[Tuple[int, int], object]]
+
+_cache_version: Optional[str] = None
+
+
+def content_digest(content: bytes) -> str:
+    """Hash used to recognise unchanged file contents."""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def cache_version() -> str:
+    """Version key combining the record format and the app/schemas sources."""
+    global _cache_version
+    if _cache_version is None:
+        digest = hashlib.blake2b(str(RECORD_FORMAT_VERSION).encode(), digest_size=16)
+        for name in sorted(os.listdir(SCHEMAS_DIR)):
+            if name.endswith('.py'):
+                with open(os.path.join(SCHEMAS_DIR, name), 'rb') as f:
+                    digest.update(name.encode())
+                    digest.update(f.read())
+        _cache_version = digest.hexdigest()
+    return _cache_version
+
+
+class IndexCache:
+    """Persistent FileRecord cache for one dbt project."""
+
+    def __init__(self, dbt_project_path: str, cache_dir: str = INDEX_CACHE_DIR):
+        key = hashlib.blake2b(os.path.abspath(dbt_project_path).encode(), digest_size=16).hexdigest()
+        self.path = os.path.join(cache_dir, f"index-{key}.pickle")
+
+    def load(self) -> CacheEntries:
+        """Load cached entries, or nothing if the cache is missing or outdated."""
+        try:
+            with open(self.path, 'rb') as f:
+                payload = pickle.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"Error loading index cache {self.path}: {str(e)}")
+            return {}
+
+        if not isinstance(payload, dict) or payload.get('version') != cache_version():
+            return {}
+        return payload.get('entries', {})
+
+    def save(self, entries: CacheEntries) -> None:
+        """Atomically replace the cache with the given entries."""
+        try:
+            directory = os.path.dirname(self.path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(
+                        {'version': cache_version(), 'entries': entries},
+                        f,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            print(f"Error saving index cache {self.path}: {str(e)}")
+
+
+def reuse_cached_record(entries: CacheEntries, path: str, signature: Tuple[int, int]):
+    """
+    Return the cached record for path if the file is unchanged: either its
+    (mtime, size) matches, or its size matches and its content hash does
+    (e.g. a fresh checkout that only touched mtimes). Otherwise None.
+    """
+    entry = entries.get(path)
+    if entry is None:
+        return None
+
+    cached_signature, record = entry
+    if cached_signature == signature:
+        return record
+    if cached_signature[1] != signature[1]:
+        return None
+
+    try:
+        with open(path, 'rb') as f:
+            if content_digest(f.read()) == record.digest:
+                return record
+    except OSError:
+        pass
+    return None
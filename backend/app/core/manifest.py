@@ -0,0 +1,371 @@
+"""
+Model relations and project metadata from dbt's manifest.json.
+
+After `dbt compile`/`run`/`parse`, target/manifest.json records where every
+model is built: its database, schema and alias, with custom schemas and
+aliases already applied. Reading those is much cheaper than listing every
+table in the warehouse, and correct where matching table names against
+file names is not.
+
+Manifests of large projects reach hundreds of megabytes, mostly compiled
+SQL, macros and dependency maps we never use, so they are not json.load-ed.
+read_manifest scans the file in chunks: only the "nodes" and "sources"
+objects are decoded, one entry at a time, each entry is reduced to a
+compact record, and every other top-level value is skipped without being
+built. Peak memory follows the largest single node, not the file size.
+
+A manifest is re-ingested only when its content hash changes; a rewrite
+with identical content (dbt does this on every parse) costs one hash pass.
+"""
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+from typing import Any, Dict, IO, Iterator, List, NamedTuple, Optional, Tuple
+from .warehouse.config_cache import load_dbt_project
+
+CHUNK_SIZE = 1 << 20
+
+# Path of the model's SQL file relative to models/ -> relation
+Relations = Dict[str, Dict[str, Optional[str]]]
+
+# Rest of a JSON string after its opening quote, up to and including the closing one
+_STRING_TAIL = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+# Characters that matter when skipping over a nested value
+_STRUCTURE = re.compile(r'["{}\[\]]')
+# A number, true, false or null
+_SCALAR = re.compile(r'[^\s,}\]]+')
+_WHITESPACE = re.compile(r'\s*')
+
+
+class ManifestModel(NamedTuple):
+    unique_id: str
+    name: str
+    package_name: str
+    original_file_path: str
+    database: Optional[str]
+    schema: str
+    alias: str
+    columns: Tuple[str, ...]
+
+
+class ManifestSource(NamedTuple):
+    unique_id: str
+    source_name: str
+    name: str
+    package_name: str
+    database: Optional[str]
+    schema: str
+    identifier: str
+    columns: Tuple[str, ...]
+
+
+class ManifestTest(NamedTuple):
+    unique_id: str
+    name: str
+    test_name: Optional[str]
+    attached_node: Optional[str]
+    column_name: Optional[str]
+
+
+class ManifestIndex:
+    """The parts of a manifest the project manager uses, as compact records."""
+
+    def __init__(self, digest: str):
+        self.digest = digest
+        self.models: List[ManifestModel] = []
+        self.sources: List[ManifestSource] = []
+        self.tests: List[ManifestTest] = []
+        # Relations per project path, derived on first use
+        self._relations: Dict[str, Relations] = {}
+
+    def relations(self, dbt_project_path: str) -> Relations:
+        """Relation of every model of the project itself (not of installed packages)."""
+        relations = self._relations.get(dbt_project_path)
+        if relations is None:
+            relations = self._relations[dbt_project_path] = _model_relations(self.models, dbt_project_path)
+        return relations
+
+
+def _intern(value: Any) -> Any:
+    # Databases, schemas and package names repeat across thousands of records
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _column_names(node: Dict[str, Any]) -> Tuple[str, ...]:
+    return tuple((node.get('columns') or {}).keys())
+
+
+def _add_node(index: ManifestIndex, unique_id: str, node: Dict[str, Any]) -> None:
+    resource_type = node.get('resource_type')
+    if resource_type == 'model':
+        index.models.append(ManifestModel(
+            unique_id=unique_id,
+            name=node.get('name') or '',
+            package_name=_intern(node.get('package_name') or ''),
+            original_file_path=node.get('original_file_path') or '',
+            database=_intern(node.get('database')),
+            schema=_intern(node.get('schema') or ''),
+            alias=node.get('alias') or node.get('name') or '',
+            columns=_column_names(node),
+        ))
+    elif resource_type == 'test':
+        index.tests.append(ManifestTest(
+            unique_id=unique_id,
+            name=node.get('name') or '',
+            test_name=_intern((node.get('test_metadata') or {}).get('name')),
+            attached_node=node.get('attached_node'),
+            column_name=node.get('column_name'),
+        ))
+
+
+def _add_source(index: ManifestIndex, unique_id: str, node: Dict[str, Any]) -> None:
+    index.sources.append(ManifestSource(
+        unique_id=unique_id,
+        source_name=_intern(node.get('source_name') or ''),
+        name=node.get('name') or '',
+        package_name=_intern(node.get('package_name') or ''),
+        database=_intern(node.get('database')),
+        schema=_intern(node.get('schema') or ''),
+        identifier=node.get('identifier') or node.get('name') or '',
+        columns=_column_names(node),
+    ))
+
+
+class _Scanner:
+    """Pull-style JSON reader over a text file that keeps only a window of it in memory."""
+
+    def __init__(self, f: IO[str], chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Drop what was consumed and read more. Returns False at end of file."""
+        if self.eof:
+            return False
+        # Read at least as much as is buffered, so retrying a long value stays linear
+        chunk = self.f.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of manifest")
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"Expected '{char}' in manifest at offset {self.pos}")
+        self.pos += 1
+
+    def _skip_string_tail(self) -> None:
+        """Skip a string whose opening quote was consumed."""
+        while True:
+            match = _STRING_TAIL.match(self.buf, self.pos)
+            if match:
+                self.pos = match.end()
+                return
+            if not self.fill():
+                raise ValueError("Unterminated string in manifest")
+
+    def read_string(self) -> str:
+        self.expect('"')
+        start = self.pos - 1
+        while True:
+            match = _STRING_TAIL.match(self.buf, start + 1)
+            if match:
+                self.pos = match.end()
+                return json.loads(self.buf[start:self.pos])
+            # Keep the opening quote in the buffer while reading more
+            self.pos = start
+            if not self.fill():
+                raise ValueError("Unterminated string in manifest")
+            start = 0
+
+    def decode_value(self) -> Any:
+        """Decode the next value; the buffer grows only as far as that value."""
+        decoder = json.JSONDecoder()
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            if end == len(self.buf) and self.fill():
+                # A number may continue in the next chunk
+                continue
+            self.pos = end
+            return value
+
+    def skip_value(self) -> None:
+        """Move past the next value without building it."""
+        char = self.peek()
+        if char == '"':
+            self.pos += 1
+            self._skip_string_tail()
+            return
+        if char not in '{[':
+            while True:
+                match = _SCALAR.match(self.buf, self.pos)
+                if match.end() < len(self.buf) or not self.fill():
+                    self.pos = match.end()
+                    return
+
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(self.buf, self.pos)
+            if not match:
+                self.pos = len(self.buf)
+                if not self.fill():
+                    raise ValueError("Unexpected end of manifest")
+                continue
+            self.pos = match.end()
+            char = match.group()
+            if char == '"':
+                self._skip_string_tail()
+            elif char in '{[':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Yield the keys of the object at the current position. The caller must
+        consume each key's value (decode_value or skip_value) before resuming.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            key = self.read_string()
+            self.expect(':')
+            yield key
+            char = self.peek()
+            self.pos += 1
+            if char == '}':
+                return
+            if char != ',':
+                raise ValueError(f"Expected ',' or '}}' in manifest at offset {self.pos - 1}")
+
+
+def file_digest(path: str) -> str:
+    """Content hash of a file, read in chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def read_manifest(path: str, digest: str = '', chunk_size: int = CHUNK_SIZE) -> ManifestIndex:
+    """Stream a manifest.json into a ManifestIndex."""
+    index = ManifestIndex(digest)
+    with open(path, 'r', encoding='utf-8') as f:
+        scanner = _Scanner(f, chunk_size)
+        for key in scanner.iter_object():
+            if key == 'nodes':
+                for unique_id in scanner.iter_object():
+                    _add_node(index, unique_id, scanner.decode_value())
+            elif key == 'sources':
+                for unique_id in scanner.iter_object():
+                    _add_source(index, unique_id, scanner.decode_value())
+            else:
+                scanner.skip_value()
+    return index
+
+
+def manifest_path(dbt_project_path: str) -> str:
+    """Location of manifest.json, honouring target-path in dbt_project.yml."""
+    target_path = 'target'
+    try:
+        target_path = load_dbt_project(dbt_project_path).get('target-path') or target_path
+    except Exception:
+        pass
+    return os.path.join(dbt_project_path, target_path, 'manifest.json')
+
+
+def _project_name(dbt_project_path: str) -> Optional[str]:
+    try:
+        return load_dbt_project(dbt_project_path).get('name')
+    except Exception:
+        return None
+
+
+def _model_relations(models: List[ManifestModel], dbt_project_path: str) -> Relations:
+    models_dir = os.path.join(dbt_project_path, 'models')
+    project_name = _project_name(dbt_project_path)
+    relations: Relations = {}
+    for model in models:
+        if not model.original_file_path:
+            continue
+        if project_name and model.package_name != project_name:
+            continue
+        sql_path = os.path.relpath(os.path.join(dbt_project_path, model.original_file_path), models_dir)
+        if sql_path.startswith(os.pardir):
+            continue
+        relations[sql_path] = {
+            'database': model.database,
+            'schema': model.schema,
+            'table': model.alias,
+        }
+    return relations
+
+
+# manifest path -> ((mtime, size, inode), index)
+_cache: Dict[str, Tuple[Tuple[int, int, int], ManifestIndex]] = {}
+_lock = threading.Lock()
+
+
+def load_manifest(dbt_project_path: str) -> Optional[ManifestIndex]:
+    """
+    The project's manifest as a ManifestIndex, or None if there is none or it
+    cannot be read. Re-ingested only when the file's content hash changes.
+    """
+    path = manifest_path(dbt_project_path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    with _lock:
+        cached = _cache.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        digest = file_digest(path)
+        if cached is not None and cached[1].digest == digest:
+            index = cached[1]
+        else:
+            index = read_manifest(path, digest)
+    except Exception as e:
+        print(f"Error reading {path}: {str(e)}")
+        return None
+
+    with _lock:
+        _cache[path] = (signature, index)
+    return index
+
+
+def get_manifest_relations(dbt_project_path: str) -> Relations:
+    """Relations of the project's models from its manifest.json; empty without one."""
+    index = load_manifest(dbt_project_path)
+    return index.relations(dbt_project_path) if index else {}
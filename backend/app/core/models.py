@@ -1,49 +1,87 @@
 import os
-import glob
-from typing import List, Dict, Optional, Any
-import yaml
+from typing import List, Dict, Optional, Any, Iterable, Iterator, Tuple
 import re
 from ..schemas.models import Model
+from ..schemas.common import ListQuery
 from ..config.constants import TESTS_YAML_KEY
+from .manifest import get_manifest_relations
+from .project_index import get_project_index, get_project_snapshot, collect_tests, notify_written, MODEL_SORT_KEYS, ModelRow
+from .pagination import paginate, build_filter, count_matches, filter_key
+from .yaml_io import load_yaml
+from .yaml_writes import update_yaml_file, write_yaml_atomic
 
 
 def get_models_from_project(dbt_project_path: str) -> List[Model]:
     """
     Get all SQL files from models directory
     """
-    models_dir = os.path.join(dbt_project_path, 'models')
-    if not os.path.exists(models_dir):
-        raise ValueError(f"Models directory not found at {models_dir}")
-    
-    # Find all SQL files in the models directory recursively
-    sql_files = glob.glob(os.path.join(models_dir, '**', '*.sql'), recursive=True)
-    
-    # Get test definitions
-    test_mapping = _get_tests_for_models(dbt_project_path)
-    
-    models = []
-    for sql_file in sql_files:
-        # Get the relative path from the models directory
-        relative_path = os.path.relpath(sql_file, models_dir)
-        file_name = os.path.basename(sql_file)
-        file_name_without_ext = os.path.splitext(file_name)[0]
-        
-        # Find tests for this model if any
-        tests = test_mapping.get(file_name_without_ext, [])
-        
-        # Create a unique ID for the model
-        model_id = f"model_{len(models) + 1}"
-        
-        models.append(Model(
-            id=model_id,
-            name=file_name_without_ext,
-            schema="",  # Will be populated later by get_models_with_schema_info
-            table="",   # Will be populated later by get_models_with_schema_info
-            tests=tests,
-            sql_path=relative_path
-        ))
-    
-    return models
+    # Serve from the project index, which only re-parses changed files
+    return get_project_snapshot(dbt_project_path).get_models()
+
+
+def get_model_rows_from_project(dbt_project_path: str) -> List[ModelRow]:
+    """
+    Get the index rows of all SQL files, for callers that build Model
+    objects one at a time
+    """
+    return get_project_snapshot(dbt_project_path).model_rows
+
+
+# Sort fields that are only known after matching models with the warehouse
+WAREHOUSE_SORT_KEYS = {
+    'schema': lambda m: (m.schema.lower(), m.name.lower(), m.sql_path),
+    'table': lambda m: (m.table.lower(), m.sql_path),
+}
+
+MODEL_SORT_FIELDS = list(MODEL_SORT_KEYS) + list(WAREHOUSE_SORT_KEYS)
+DEFAULT_MODEL_SORT = 'sql_path'
+
+
+def _model_filter(query: ListQuery):
+    return build_filter(
+        query,
+        name_of=lambda m: m.name,
+        schema_of=lambda m: getattr(m, 'schema', ''),
+        path_of=lambda m: m.sql_path,
+        tests_of=lambda m: m.tests,
+    )
+
+
+def needs_warehouse_view(query: ListQuery) -> bool:
+    """Whether sorting or filtering depends on warehouse schema information."""
+    return query.sort_by in WAREHOUSE_SORT_KEYS or query.schema_name is not None
+
+
+def query_project_models(dbt_project_path: str, query: ListQuery) -> Tuple[List[Model], Optional[str], int]:
+    """
+    Page through the precomputed sorted views of the project index.
+    Only the returned page is materialized as Model objects.
+    Returns (models, next_cursor, total).
+    """
+    snapshot = get_project_snapshot(dbt_project_path)
+    sort_by = query.sort_by or DEFAULT_MODEL_SORT
+    rows, keys = snapshot.sorted_models(sort_by)
+    predicate = _model_filter(query)
+    total = snapshot.count('models', filter_key(query), lambda: count_matches(rows, predicate))
+    page, next_cursor, total = paginate(
+        rows, keys, predicate, query.limit, query.cursor, query.sort_desc,
+        sort_by=sort_by, total=total
+    )
+    return [row.to_model() for row in page], next_cursor, total
+
+
+def query_models(models: List[Model], query: ListQuery) -> Tuple[List[Model], Optional[str], int]:
+    """
+    Sort, filter and page models that already carry warehouse schema
+    information. Returns (models, next_cursor, total).
+    """
+    sort_by = query.sort_by or DEFAULT_MODEL_SORT
+    key = WAREHOUSE_SORT_KEYS.get(sort_by) or MODEL_SORT_KEYS[sort_by]
+    pairs = sorted(((key(m), m) for m in models), key=lambda pair: pair[0])
+    return paginate(
+        [m for _key, m in pairs], [k for k, _m in pairs],
+        _model_filter(query), query.limit, query.cursor, query.sort_desc, sort_by=sort_by
+    )
 
 
 def find_schema_file(model_path: str, project_root: str) -> str:
@@ -79,12 +117,181 @@ def find_schema_file(model_path: str, project_root: str) -> str:
     os.makedirs(os.path.dirname(new_schema_path), exist_ok=True)
     
     # Initialize with empty structure
-    with open(new_schema_path, 'w') as f:
-        yaml.dump({'version': 2, 'models': []}, f, default_flow_style=False)
+    write_yaml_atomic(new_schema_path, {'version': 2, 'models': []}, default_flow_style=False)
     
     return new_schema_path
 
 
+def apply_add_test_to_schema(
+    schema: Dict[str, Any],
+    model_name: str,
+    test_config: Dict,
+    column_name: Optional[str] = None
+) -> None:
+    """Add a test for a model to a parsed schema document, in place."""
+    # Build the test entry first, so an invalid config fails before any edit
+    test_type = test_config['test_type']
+    config = test_config.get('config', {})
+
+    # Handle simple tests (no config needed)
+    if not config:
+        test_entry = test_type
+    else:
+        # Process config based on field types
+        processed_config = {}
+        for field_name, field_value in config.items():
+            # If the value is already a list, use it as is
+            if isinstance(field_value, list):
+                processed_config[field_name] = field_value
+            elif isinstance(field_value, str):
+                processed_config[field_name] = field_value.strip()
+            else:
+                # The value should already be properly formatted (ref() or source())
+                processed_config[field_name] = field_value
+
+        test_entry = {test_type: processed_config}
+
+    # Ensure schema has version 2 (dbt standard)
+    if 'version' not in schema:
+        schema['version'] = 2
+
+    # Find or create models section
+    if 'models' not in schema:
+        schema['models'] = []
+
+    # Find or create model entry
+    model_entry = None
+    for model in schema['models']:
+        if model.get('name') == model_name:
+            model_entry = model
+            break
+
+    if not model_entry:
+        model_entry = {'name': model_name, 'description': ''}
+        schema['models'].append(model_entry)
+
+    # Add test to appropriate section
+    if column_name:
+        # Add column-level test
+        if 'columns' not in model_entry:
+            model_entry['columns'] = []
+
+        column_entry = None
+        for col in model_entry['columns']:
+            if col.get('name') == column_name:
+                column_entry = col
+                break
+
+        if not column_entry:
+            column_entry = {'name': column_name}
+            model_entry['columns'].append(column_entry)
+
+        # Determine which key to use for tests
+        test_key = 'tests' if 'tests' in column_entry else TESTS_YAML_KEY
+
+        if test_key not in column_entry:
+            column_entry[test_key] = []
+
+        column_entry[test_key].append(test_entry)
+    else:
+        # Determine which key to use for tests
+        test_key = 'tests' if 'tests' in model_entry else 'data_tests' if 'data_tests' in model_entry else TESTS_YAML_KEY
+
+        if test_key not in model_entry:
+            model_entry[test_key] = []
+
+        model_entry[test_key].append(test_entry)
+
+
+def apply_remove_test_from_schema(
+    schema: Dict[str, Any],
+    model_name: str,
+    test_name: str,
+    column_name: Optional[str] = None
+) -> bool:
+    """
+    Remove a test for a model from a parsed schema document, in place.
+    Returns True if the document was modified.
+    """
+    if 'models' not in schema:
+        return False
+
+    # Find the model entry
+    model_index = None
+    for i, model in enumerate(schema['models']):
+        if model.get('name') == model_name:
+            model_index = i
+            break
+
+    if model_index is None:
+        return False
+
+    model_entry = schema['models'][model_index]
+
+    # Remove the test from the appropriate section
+    modified = False
+
+    if column_name:
+        # Remove column-level test
+        if 'columns' in model_entry:
+            column_index = None
+            for i, col in enumerate(model_entry['columns']):
+                if col.get('name') == column_name:
+                    column_index = i
+                    break
+
+            if column_index is not None:
+                col_entry = model_entry['columns'][column_index]
+                # Check both test keys
+                for test_key in ['tests', 'data_tests']:
+                    if test_key in col_entry:
+                        # Find and remove the test
+                        for i, test in enumerate(col_entry[test_key]):
+                            if (isinstance(test, str) and test == test_name) or \
+                               (isinstance(test, dict) and test_name in test):
+                                col_entry[test_key].pop(i)
+                                modified = True
+                                break
+
+                        # If no tests left, remove the test key
+                        if not col_entry[test_key]:
+                            col_entry.pop(test_key)
+
+                # If column has no data left, remove it
+                if len(col_entry) <= 1:  # Only has 'name' left
+                    model_entry['columns'].pop(column_index)
+
+                # If no columns left, remove the columns key
+                if not model_entry['columns']:
+                    model_entry.pop('columns')
+    else:
+        # Remove model-level test
+        # Check both test keys
+        for test_key in ['tests', 'data_tests']:
+            if test_key in model_entry:
+                for i, test in enumerate(model_entry[test_key]):
+                    if (isinstance(test, str) and test == test_name) or \
+                       (isinstance(test, dict) and test_name in test):
+                        model_entry[test_key].pop(i)
+                        modified = True
+                        break
+
+                # If no tests left, remove the test key
+                if not model_entry[test_key]:
+                    model_entry.pop(test_key)
+
+    # Check if model has become empty (only has name and description)
+    if len(model_entry) <= 2 and 'name' in model_entry:
+        schema['models'].pop(model_index)
+        modified = True
+
+    # If no models left, keep an empty list
+    if not schema['models']:
+        schema['models'] = []
+
+    return modified
+
+
 def add_test_to_schema(
     schema_path: str,
     model_name: str,
@@ -92,92 +299,13 @@ def add_test_to_schema(
     column_name: Optional[str] = None
 ) -> bool:
     """Add a test to the schema.yml file for a model."""
-    try:
-        # Read existing schema.yml
-        with open(schema_path, 'r') as f:
-            schema = yaml.safe_load(f) or {}
-        
-        # Ensure schema has version 2 (dbt standard)
-        if 'version' not in schema:
-            schema['version'] = 2
-            
-        # Find or create models section
-        if 'models' not in schema:
-            schema['models'] = []
-            
-        # Find or create model entry
-        model_entry = None
-        for model in schema['models']:
-            if model.get('name') == model_name:
-                model_entry = model
-                break
-                
-        if not model_entry:
-            model_entry = {'name': model_name, 'description': ''}
-            schema['models'].append(model_entry)
-            
-        # Create test configuration based on config type
-        test_type = test_config['test_type']
-        config = test_config.get('config', {})
-        
-        # Handle simple tests (no config needed)
-        if not config:
-            test_entry = test_type
-        else:
-            # Process config based on field types
-            processed_config = {}
-            for field_name, field_value in config.items():
-                # If the value is already a list, use it as is
-                if isinstance(field_value, list):
-                    processed_config[field_name] = field_value
-                elif isinstance(field_value, str):
-                    processed_config[field_name] = field_value.strip()
-                else:
-                    # The value should already be properly formatted (ref() or source())
-                    processed_config[field_name] = field_value
-            
-            test_entry = {test_type: processed_config}
-        
-        # Add test to appropriate section
-        if column_name:
-            # Add column-level test
-            if 'columns' not in model_entry:
-                model_entry['columns'] = []
-                
-            column_entry = None
-            for col in model_entry['columns']:
-                if col.get('name') == column_name:
-                    column_entry = col
-                    break
-                    
-            if not column_entry:
-                column_entry = {'name': column_name}
-                model_entry['columns'].append(column_entry)
-                
-            # Determine which key to use for tests
-            test_key = 'tests' if 'tests' in column_entry else TESTS_YAML_KEY
-                
-            if test_key not in column_entry:
-                column_entry[test_key] = []
-                
-            column_entry[test_key].append(test_entry)
-        else:
-            # Determine which key to use for tests
-            test_key = 'tests' if 'tests' in model_entry else 'data_tests' if 'data_tests' in model_entry else TESTS_YAML_KEY
-                
-            if test_key not in model_entry:
-                model_entry[test_key] = []
-                
-            model_entry[test_key].append(test_entry)
-            
-        # Write updated schema.yml
-        print("wririntg out of add test back to yaml")
-        print(schema)
-        with open(schema_path, 'w') as f:
-            yaml.dump(schema, f, default_flow_style=False)
-            
+    def add(schema: Dict[str, Any]) -> bool:
+        apply_add_test_to_schema(schema, model_name, test_config, column_name)
         return True
-        
+
+    try:
+        # Read, update and atomically write back schema.yml under its lock
+        return update_yaml_file(schema_path, add, default_flow_style=False)
     except Exception as e:
         print(f"Error adding test to schema: {str(e)}")
         return False
@@ -191,93 +319,12 @@ def remove_test_from_schema(
 ) -> bool:
     """Remove a test from the schema.yml file for a model."""
     try:
-        # Read existing schema.yml
-        with open(schema_path, 'r') as f:
-            schema = yaml.safe_load(f) or {}
-        
-        if 'models' not in schema:
-            return False
-            
-        # Find the model entry
-        model_index = None
-        for i, model in enumerate(schema['models']):
-            if model.get('name') == model_name:
-                model_index = i
-                break
-                
-        if model_index is None:
-            return False
-            
-        model_entry = schema['models'][model_index]
-            
-        # Remove the test from the appropriate section
-        modified = False
-        
-        if column_name:
-            # Remove column-level test
-            if 'columns' in model_entry:
-                column_index = None
-                for i, col in enumerate(model_entry['columns']):
-                    if col.get('name') == column_name:
-                        column_index = i
-                        break
-                        
-                if column_index is not None:
-                    col_entry = model_entry['columns'][column_index]
-                    # Check both test keys
-                    for test_key in ['tests', 'data_tests']:
-                        if test_key in col_entry:
-                            # Find and remove the test
-                            for i, test in enumerate(col_entry[test_key]):
-                                if (isinstance(test, str) and test == test_name) or \
-                                   (isinstance(test, dict) and test_name in test):
-                                    col_entry[test_key].pop(i)
-                                    modified = True
-                                    break
-                                    
-                            # If no tests left, remove the test key
-                            if not col_entry[test_key]:
-                                col_entry.pop(test_key)
-                                
-                    # If column has no data left, remove it
-                    if len(col_entry) <= 1:  # Only has 'name' left
-                        model_entry['columns'].pop(column_index)
-                        
-                    # If no columns left, remove the columns key
-                    if not model_entry['columns']:
-                        model_entry.pop('columns')
-        else:
-            # Remove model-level test
-            # Check both test keys
-            for test_key in ['tests', 'data_tests']:
-                if test_key in model_entry:
-                    for i, test in enumerate(model_entry[test_key]):
-                        if (isinstance(test, str) and test == test_name) or \
-                           (isinstance(test, dict) and test_name in test):
-                            model_entry[test_key].pop(i)
-                            modified = True
-                            break
-                            
-                    # If no tests left, remove the test key
-                    if not model_entry[test_key]:
-                        model_entry.pop(test_key)
-                        
-        # Check if model has become empty (only has name and description)
-        if len(model_entry) <= 2 and 'name' in model_entry:
-            schema['models'].pop(model_index)
-            modified = True
-            
-        # If no models left, keep an empty list
-        if not schema['models']:
-            schema['models'] = []
-            
-        # Write updated schema.yml if modifications were made
-        if modified:
-            with open(schema_path, 'w') as f:
-                yaml.dump(schema, f, default_flow_style=False)
-                
-        return modified
-        
+        # Read, update and atomically write back schema.yml if modified
+        return update_yaml_file(
+            schema_path,
+            lambda schema: apply_remove_test_from_schema(schema, model_name, test_name, column_name),
+            default_flow_style=False
+        )
     except Exception as e:
         print(f"Error removing test from schema: {str(e)}")
         return False
@@ -287,43 +334,11 @@ def get_model_tests(schema_path: str, model_name: str) -> List[str]:
     """Get all tests configured for a model."""
     try:
         with open(schema_path, 'r') as f:
-            schema = yaml.safe_load(f) or {}
+            schema = load_yaml(f) or {}
             
         for model in schema.get('models', []):
             if model.get('name') == model_name:
-                tests = []
-                
-                # Add model-level tests from data_tests
-                for test in model.get('data_tests', []):
-                    if isinstance(test, str):
-                        tests.append(test)
-                    elif isinstance(test, dict):
-                        tests.append(list(test.keys())[0])
-                
-                # Add model-level tests from tests
-                for test in model.get('tests', []):
-                    if isinstance(test, str):
-                        tests.append(test)
-                    elif isinstance(test, dict):
-                        tests.append(list(test.keys())[0])
-                        
-                # Add column-level tests
-                for column in model.get('columns', []):
-                    # Add column-level tests from data_tests
-                    for test in column.get('data_tests', []):
-                        if isinstance(test, str):
-                            tests.append(f"{column['name']}: {test}")
-                        elif isinstance(test, dict):
-                            tests.append(f"{column['name']}: {list(test.keys())[0]}")
-                    
-                    # Add column-level tests from tests
-                    for test in column.get('tests', []):
-                        if isinstance(test, str):
-                            tests.append(f"{column['name']}: {test}")
-                        elif isinstance(test, dict):
-                            tests.append(f"{column['name']}: {list(test.keys())[0]}")
-                            
-                return tests
+                return collect_tests(model)
                 
         return []
         
@@ -334,89 +349,107 @@ def get_model_tests(schema_path: str, model_name: str) -> List[str]:
 
 def _get_tests_for_models(dbt_project_path: str) -> Dict[str, List[str]]:
     """
-    Parse schema.yml files to extract tests for models
+    Get the tests defined for each model across the project's schema files
     """
-    schema_files = glob.glob(os.path.join(dbt_project_path, 'models', '**', '*.yml'), recursive=True)
-    schema_files.extend(glob.glob(os.path.join(dbt_project_path, 'models', '**', '*.yaml'), recursive=True))
-    
-    test_mapping = {}
-    
-    for schema_file in schema_files:
-        try:
-            with open(schema_file, 'r') as f:
-                schema_data = yaml.safe_load(f)
-                
-            if schema_data and 'models' in schema_data:
-                for model in schema_data['models']:
-                    model_name = model.get('name')
-                    if not model_name:
-                        continue
-                    
-                    tests = []
-                    
-                    # Get model-level tests from data_tests
-                    for test in model.get('data_tests', []):
-                        if isinstance(test, str):
-                            tests.append(test)
-                        elif isinstance(test, dict):
-                            tests.append(list(test.keys())[0])
-                    
-                    # Get model-level tests from tests
-                    for test in model.get('tests', []):
-                        if isinstance(test, str):
-                            tests.append(test)
-                        elif isinstance(test, dict):
-                            tests.append(list(test.keys())[0])
-                    
-                    # Get column-level tests
-                    if 'columns' in model:
-                        for column in model['columns']:
-                            # Add column-level tests from data_tests
-                            for test in column.get('data_tests', []):
-                                if isinstance(test, str):
-                                    tests.append(f"{column['name']}: {test}")
-                                elif isinstance(test, dict):
-                                    tests.append(f"{column['name']}: {list(test.keys())[0]}")
-                            
-                            # Add column-level tests from tests
-                            for test in column.get('tests', []):
-                                if isinstance(test, str):
-                                    tests.append(f"{column['name']}: {test}")
-                                elif isinstance(test, dict):
-                                    tests.append(f"{column['name']}: {list(test.keys())[0]}")
-                    
-                    test_mapping[model_name] = tests
-        except Exception as e:
-            print(f"Error parsing schema file {schema_file}: {str(e)}")
-    
-    return test_mapping
+    return get_project_index(dbt_project_path).get_test_mapping()
 
 
-def get_models_with_schema_info(dbt_project_path: str, models: List[Model], schemas: List[Dict[str, Any]]) -> List[Model]:
+def _set_relation(model: Model, relation: Dict[str, Any]) -> None:
+    model.database = relation['database']
+    model.schema = relation['schema']
+    model.table = relation['table']
+
+
+def apply_manifest_relations(dbt_project_path: str, models: List[Model]) -> List[Model]:
     """
-    Match models with their schema and table information from the warehouse
+    Fill in database, schema and table of models found in the project's
+    manifest.json. Returns the models it has no entry for, which still need
+    to be matched against the warehouse.
     """
-    # Process models to get just the file name without extension
-    model_table_mapping = {}
+    relations = get_manifest_relations(dbt_project_path)
+    unresolved = []
     for model in models:
-        # Use model.name which is already the file name without extension
-        model_table_mapping[model.name.lower()] = model
-    
-    # Iterate through schemas and tables to find matches
+        relation = relations.get(os.path.normpath(model.sql_path))
+        if relation is None:
+            unresolved.append(model)
+            continue
+        _set_relation(model, relation)
+    return unresolved
+
+
+def split_manifest_rows(dbt_project_path: str, rows: List[ModelRow]) -> Tuple[Iterator[Model], List[ModelRow]]:
+    """
+    Row-based apply_manifest_relations: returns an iterator building the
+    models found in manifest.json one by one, and the rows it has no entry for.
+    """
+    relations = get_manifest_relations(dbt_project_path)
+    resolved = []
+    unresolved = []
+    for row in rows:
+        relation = relations.get(os.path.normpath(row.sql_path))
+        if relation is None:
+            unresolved.append(row)
+        else:
+            resolved.append((row, relation))
+
+    def build() -> Iterator[Model]:
+        for row, relation in resolved:
+            model = row.to_model()
+            _set_relation(model, relation)
+            yield model
+
+    return build(), unresolved
+
+
+def _match_warehouse_tables(models: list, schemas: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Any, str, str]]:
+    """
+    Match models (or model rows) with the warehouse tables named after them,
+    yielding (model, schema, table) when a model is matched. When several
+    schemas hold a table of the same name, the first one listed wins.
+    """
+    # Use model.name which is already the file name without extension
+    model_table_mapping = {model.name.lower(): model for model in models}
+    matched = set()
+
     for schema_info in schemas:
         schema_name = schema_info['schema']
         for table in schema_info.get('tables', []):
-            table_name = table['name'].lower()
-            
-            # Try to find a matching model
-            if table_name in model_table_mapping:
-                model = model_table_mapping[table_name]
-                model.schema = schema_name
-                model.table = table['name']
-    
+            model = model_table_mapping.get(table['name'].lower())
+            if model is not None and model.id not in matched:
+                matched.add(model.id)
+                yield model, schema_name, table['name']
+
+
+def get_models_with_schema_info(dbt_project_path: str, models: List[Model], schemas: List[Dict[str, Any]]) -> List[Model]:
+    """
+    Match models with their schema and table information from the warehouse
+    """
+    for model, schema_name, table_name in _match_warehouse_tables(models, schemas):
+        model.schema = schema_name
+        model.table = table_name
     return models
 
 
+def iter_models_with_schema_info(rows: List[ModelRow], schemas: Iterable[Dict[str, Any]]) -> Iterator[Model]:
+    """
+    Streaming variant of get_models_with_schema_info, matching by the same
+    rule. Builds and yields each model as soon as its warehouse table is
+    seen, then the models that matched no table. schemas may be a lazy
+    iterable.
+    """
+    sent = set()
+    for row, schema_name, table_name in _match_warehouse_tables(rows, schemas):
+        sent.add(row.id)
+        model = row.to_model()
+        model.schema = schema_name
+        model.table = table_name
+        yield model
+
+    for row in rows:
+        if row.id not in sent:
+            yield row.to_model()
+
+
 def update_model(dbt_project_path: str, sql_path: str, new_content: str) -> bool:
     """
     Update the SQL content of a model
@@ -428,6 +461,7 @@ def update_model(dbt_project_path: str, sql_path: str, new_content: str) -> bool
     try:
         with open(file_path, 'w') as f:
             f.write(new_content)
+        notify_written([file_path])
         return True
     except Exception as e:
         print(f"Error updating model {file_path}: {str(e)}")
@@ -444,6 +478,7 @@ def delete_model(dbt_project_path: str, sql_path: str) -> bool:
     
     try:
         os.remove(file_path)
+        notify_written([file_path])
         return True
     except Exception as e:
         print(f"Error deleting model {file_path}: {str(e)}")
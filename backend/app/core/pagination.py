@@ -0,0 +1,156 @@
+"""
+Cursor-based pagination over sorted views of models and sources.
+
+A view is a list of items sorted ascending by a unique key tuple. Cursors
+are opaque tokens encoding the key of the last item returned, so a page is
+found by bisecting the view instead of counting from the start, and pages
+stay stable while items are added or removed elsewhere in the view. A
+cursor also records the sort field and direction it was issued for, and is
+rejected when reused with another one.
+"""
+import base64
+import bisect
+import json
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+def encode_cursor(key: Tuple, sort_by: str, descending: bool) -> str:
+    """Encode a sort key, and the order it belongs to, as an opaque cursor."""
+    payload = {'key': list(key), 'sort_by': sort_by, 'desc': descending}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Tuple, str, bool]:
+    """Decode a cursor produced by encode_cursor into (key, sort_by, descending)."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return tuple(payload['key']), payload['sort_by'], bool(payload['desc'])
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def cursor_key(cursor: str, sort_by: str, descending: bool) -> Tuple:
+    """
+    Return the sort key of a cursor, raising ValueError if it was issued for
+    a different sort field or direction (its key would not compare).
+    """
+    key, cursor_sort_by, cursor_descending = decode_cursor(cursor)
+    if cursor_sort_by != sort_by or cursor_descending != descending:
+        raise ValueError(
+            f"Cursor was issued for sort_by={cursor_sort_by}, sort_desc={cursor_descending}; "
+            "request the first page again to change the sort order"
+        )
+    return key
+
+
+def count_matches(items: Sequence[T], predicate: Optional[Callable[[T], bool]]) -> int:
+    """Number of items matching predicate (all of them if it is None)."""
+    if predicate is None:
+        return len(items)
+    return sum(1 for item in items if predicate(item))
+
+
+def paginate(
+    items: Sequence[T],
+    keys: Sequence[Tuple],
+    predicate: Optional[Callable[[T], bool]] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    *,
+    sort_by: str,
+    total: Optional[int] = None,
+) -> Tuple[List[T], Optional[str], int]:
+    """
+    Return (page, next_cursor, total) from a sorted view.
+
+    items and keys are parallel sequences sorted ascending by the unique keys
+    of sort_by. predicate filters items; total is the number of items
+    matching it, counted here unless the caller already knows it.
+    next_cursor is None on the last page.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be a positive integer")
+
+    n = len(items)
+    if cursor is None:
+        start = n - 1 if descending else 0
+    else:
+        key = cursor_key(cursor, sort_by, descending)
+        start = bisect.bisect_left(keys, key) - 1 if descending else bisect.bisect_right(keys, key)
+    positions = range(start, -1, -1) if descending else range(start, n)
+
+    page: List[T] = []
+    last_index = None
+    next_cursor = None
+    for i in positions:
+        item = items[i]
+        if predicate and not predicate(item):
+            continue
+        if limit is not None and len(page) == limit:
+            # There is at least one more match: resume after the last item sent
+            next_cursor = encode_cursor(keys[last_index], sort_by, descending)
+            break
+        page.append(item)
+        last_index = i
+
+    if total is None:
+        total = count_matches(items, predicate)
+
+    return page, next_cursor, total
+
+
+def check_list_query(query, sort_fields: Sequence[str], default_sort: str) -> None:
+    """Validate the pagination options of a ListQuery, raising ValueError."""
+    if query.sort_by is not None and query.sort_by not in sort_fields:
+        raise ValueError(f"Cannot sort by '{query.sort_by}'. Valid fields: {', '.join(sort_fields)}")
+    if query.limit is not None and query.limit < 1:
+        raise ValueError("limit must be a positive integer")
+    if query.cursor is not None:
+        cursor_key(query.cursor, query.sort_by or default_sort, query.sort_desc)
+
+
+def _base_test_name(test: str) -> str:
+    """Strip the column prefix from a 'column: test' entry."""
+    return test.split(': ', 1)[1] if ': ' in test else test
+
+
+def filter_key(query) -> Tuple:
+    """The filters of a ListQuery as a hashable key, e.g. to cache match counts."""
+    return (query.name, query.schema_name, query.path_prefix, query.has_tests, query.test_type)
+
+
+def build_filter(
+    query,
+    name_of: Callable[[T], str],
+    schema_of: Callable[[T], str],
+    path_of: Callable[[T], str],
+    tests_of: Callable[[T], List[str]],
+) -> Optional[Callable[[T], bool]]:
+    """
+    Build a predicate from the filters of a ListQuery, using the accessors to
+    read an item's fields. Returns None when no filter is set.
+    """
+    conditions = []
+
+    if query.name:
+        needle = query.name.lower()
+        conditions.append(lambda item: needle in (name_of(item) or '').lower())
+    if query.schema_name is not None:
+        schema_name = query.schema_name.lower()
+        conditions.append(lambda item: (schema_of(item) or '').lower() == schema_name)
+    if query.path_prefix:
+        prefix = query.path_prefix.lstrip('/')
+        conditions.append(lambda item: path_of(item).startswith(prefix))
+    if query.has_tests is not None:
+        conditions.append(lambda item: bool(tests_of(item)) == query.has_tests)
+    if query.test_type:
+        conditions.append(
+            lambda item: any(_base_test_name(test) == query.test_type for test in tests_of(item))
+        )
+
+    if not conditions:
+        return None
+    return lambda item: all(condition(item) for condition in conditions)
@@ -0,0 +1,52 @@
+"""
+Process pool used to parse large batches of YAML files in parallel.
+
+The pool is created lazily on the first large batch (typically a cold index
+build) and reused afterwards. Workers are spawned rather than forked, since
+the server process runs threads (event loop executors, the project watcher).
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, List, Optional, TypeVar
+from ..config.constants import PARSE_WORKERS
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool(workers: int = PARSE_WORKERS) -> ProcessPoolExecutor:
+    """Return the shared pool, recreating it if a different size is requested."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown()
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn'),
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def map_in_pool(fn: Callable[[T], R], items: Iterable[T], workers: int = PARSE_WORKERS) -> List[R]:
+    """Apply fn to every item across the pool, preserving order."""
+    items = list(items)
+    # A few chunks per worker keeps IPC overhead low while balancing load
+    chunksize = max(1, len(items) // (workers * 4))
+    return list(get_parse_pool(workers).map(fn, items, chunksize=chunksize))
+
+
+def shutdown_parse_pool() -> None:
+    """Stop the pool's worker processes, if any."""
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+            _pool_workers = 0
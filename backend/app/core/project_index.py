@@ -0,0 +1,586 @@
+"""
+In-process index of the SQL and YAML files in a dbt project's models directory.
+
+One ProjectIndex is kept per dbt_project_path. Every refresh stats the files
+under models/ and re-parses only the YAML files whose (mtime, size) changed
+since the previous refresh, so repeated requests against a large project no
+longer pay for parsing the whole tree.
+
+Each YAML document is parsed exactly once into a FileRecord holding both its
+model tests and its source tables, and the aggregated ProjectSnapshot built
+from those records is shared by every route until something changes.
+"""
+import os
+import threading
+from typing import Callable, List, Dict, Any, Iterable, NamedTuple, Optional, Tuple
+from ..schemas.models import Model
+from .yaml_io import load_yaml
+from .parse_pool import map_in_pool
+from .index_cache import IndexCache, content_digest, reuse_cached_record
+from ..config.constants import (
+    PARSE_WORKERS,
+    PARSE_POOL_MIN_FILES,
+    INDEX_CACHE_ENABLED,
+    INDEX_CACHE_SAVE_DELAY_S,
+)
+
+SQL_EXTENSIONS = ('.sql',)
+YAML_EXTENSIONS = ('.yml', '.yaml')
+# Filter match counts kept per snapshot
+MAX_CACHED_TOTALS = 64
+
+
+def collect_tests(entry: Dict[str, Any]) -> List[str]:
+    """
+    Collect the test names defined on a model or source table entry,
+    including column-level tests prefixed with the column name.
+    """
+    tests = []
+
+    # Entity-level tests from data_tests, then tests
+    for test_key in ('data_tests', 'tests'):
+        for test in entry.get(test_key) or []:
+            if isinstance(test, str):
+                tests.append(test)
+            elif isinstance(test, dict):
+                tests.append(list(test.keys())[0])
+
+    # Column-level tests
+    for column in entry.get('columns') or []:
+        for test_key in ('data_tests', 'tests'):
+            for test in column.get(test_key) or []:
+                if isinstance(test, str):
+                    tests.append(f"{column['name']}: {test}")
+                elif isinstance(test, dict):
+                    tests.append(f"{column['name']}: {list(test.keys())[0]}")
+
+    return tests
+
+
+def extract_model_tests(data: Any) -> Dict[str, List[str]]:
+    """Extract a model name -> tests mapping from a parsed schema document."""
+    test_mapping = {}
+    if not data or not isinstance(data, dict) or 'models' not in data:
+        return test_mapping
+
+    for model in data['models'] or []:
+        model_name = model.get('name')
+        if not model_name:
+            continue
+        test_mapping[model_name] = collect_tests(model)
+
+    return test_mapping
+
+
+def extract_sources(data: Any) -> List[Dict[str, Any]]:
+    """Extract the flattened source tables from a parsed YAML document."""
+    if not data or not isinstance(data, dict) or 'sources' not in data:
+        return []
+
+    sources = []
+    for source in data['sources'] or []:
+        source_name = source.get('name', '')
+        schema = source.get('schema', '')
+
+        for table in source.get('tables', []):
+            sources.append({
+                'source': source_name,
+                'schema': schema,
+                'table': table.get('name', ''),
+                'tests': collect_tests(table),
+                'description': table.get('description', '')
+            })
+    return sources
+
+
+def extract_source_positions(data: Any) -> Dict[Tuple[str, str], Tuple[int, int]]:
+    """
+    Map each (source_name, table_name) declared in a parsed YAML document to
+    its (source index, table index) position within the document.
+    """
+    positions = {}
+    if not data or not isinstance(data, dict) or 'sources' not in data:
+        return positions
+
+    for source_index, source in enumerate(data['sources'] or []):
+        for table_index, table in enumerate(source.get('tables', [])):
+            key = (source.get('name'), table.get('name'))
+            # The first declaration wins, as in a top-to-bottom scan
+            positions.setdefault(key, (source_index, table_index))
+    return positions
+
+
+class FileRecord(NamedTuple):
+    """What the project manager needs from one YAML file."""
+    model_tests: Dict[str, List[str]]
+    sources: List[Dict[str, Any]]
+    source_positions: Dict[Tuple[str, str], Tuple[int, int]]
+    # Content hash of the file the record was extracted from
+    digest: str = ''
+
+
+EMPTY_RECORD = FileRecord({}, [], {})
+
+
+class SourceLocation(NamedTuple):
+    """Where a source table is declared: the file and its position hint."""
+    path: str
+    source_index: int
+    table_index: int
+
+
+def extract_file_record(data: Any, digest: str = '') -> FileRecord:
+    """Extract model tests and sources from a parsed YAML document in one pass."""
+    return FileRecord(
+        extract_model_tests(data),
+        extract_sources(data),
+        extract_source_positions(data),
+        digest,
+    )
+
+
+def parse_file_record(path: str) -> FileRecord:
+    """Parse a YAML file and extract its FileRecord."""
+    try:
+        with open(path, 'rb') as f:
+            content = f.read()
+        return extract_file_record(load_yaml(content), content_digest(content))
+    except Exception as e:
+        print(f"Error parsing schema file {path}: {str(e)}")
+        return EMPTY_RECORD
+
+
+def parse_file_records(paths: List[str], workers: int = PARSE_WORKERS) -> Dict[str, FileRecord]:
+    """
+    Parse a batch of YAML files into FileRecords. Large batches (e.g. a cold
+    index build) are fanned out across the parse process pool.
+    """
+    if workers > 1 and len(paths) >= PARSE_POOL_MIN_FILES:
+        try:
+            return dict(zip(paths, map_in_pool(parse_file_record, paths, workers)))
+        except Exception as e:
+            print(f"Error parsing in process pool, parsing in-process: {str(e)}")
+
+    return {path: parse_file_record(path) for path in paths}
+
+
+class ModelRow(NamedTuple):
+    """Lightweight model entry; Model objects are only built for what is returned."""
+    id: str
+    name: str
+    sql_path: str
+    tests: List[str]
+
+    def to_model(self) -> Model:
+        return Model(
+            id=self.id,
+            name=self.name,
+            schema="",  # Will be populated later by get_models_with_schema_info
+            table="",   # Will be populated later by get_models_with_schema_info
+            tests=self.tests,
+            sql_path=self.sql_path
+        )
+
+
+# Sort keys for the precomputed views. Every key ends with a unique
+# component so that keys can serve as pagination cursors.
+MODEL_SORT_KEYS = {
+    'name': lambda row: (row.name.lower(), row.sql_path),
+    'sql_path': lambda row: (row.sql_path,),
+    'tests': lambda row: (len(row.tests), row.sql_path),
+}
+
+SOURCE_SORT_KEYS = {
+    # Declaration order, file by file
+    'path': lambda i, s: (i,),
+    'source': lambda i, s: (str(s['source'] or ''), str(s['table'] or ''), i),
+    'table': lambda i, s: (str(s['table'] or ''), str(s['source'] or ''), i),
+    'schema': lambda i, s: (str(s['schema'] or ''), str(s['source'] or ''), str(s['table'] or ''), i),
+    'tests': lambda i, s: (len(s['tests']), str(s['source'] or ''), str(s['table'] or ''), i),
+}
+
+
+class ProjectSnapshot:
+    """
+    Models, test mapping and sources of a project at one index version.
+    Built once per change and shared by every route that reads the project,
+    along with the sorted views used for server-side pagination.
+    """
+
+    def __init__(self, models_dir: str, sql_files: List[str], records: List[Tuple[str, FileRecord]]):
+        self.models_dir = models_dir
+        self.sql_files = sql_files
+        self.test_mapping: Dict[str, List[str]] = {}
+        self.sources: List[Dict[str, Any]] = []
+        # Path (relative to models/) of the file declaring each source row
+        self.source_paths: List[str] = []
+        for path, record in records:
+            self.test_mapping.update(record.model_tests)
+            self.sources.extend(record.sources)
+            self.source_paths.extend([os.path.relpath(path, models_dir)] * len(record.sources))
+
+        self.model_rows: List[ModelRow] = []
+        for sql_file in sql_files:
+            file_name_without_ext = os.path.splitext(os.path.basename(sql_file))[0]
+            self.model_rows.append(ModelRow(
+                id=f"model_{len(self.model_rows) + 1}",
+                name=file_name_without_ext,
+                sql_path=os.path.relpath(sql_file, models_dir),
+                tests=self.test_mapping.get(file_name_without_ext, []),
+            ))
+
+        self._views: Dict[Tuple[str, str], Tuple[list, list]] = {}
+        # (kind, filter key) -> number of matching items
+        self._totals: Dict[Tuple[str, Tuple], int] = {}
+        self._views_lock = threading.Lock()
+
+    def get_models(self) -> List[Model]:
+        """Build fresh Model objects for every SQL file in the project."""
+        return [row.to_model() for row in self.model_rows]
+
+    def sorted_models(self, sort_by: str) -> Tuple[List[ModelRow], List[Tuple]]:
+        """Return model rows sorted by sort_by, with their sort keys."""
+        key = MODEL_SORT_KEYS[sort_by]
+        return self._view('models', sort_by, lambda: [(key(row), row) for row in self.model_rows])
+
+    def sorted_sources(self, sort_by: str) -> Tuple[List[int], List[Tuple]]:
+        """Return source row indices sorted by sort_by, with their sort keys."""
+        key = SOURCE_SORT_KEYS[sort_by]
+        return self._view('sources', sort_by, lambda: [(key(i, s), i) for i, s in enumerate(self.sources)])
+
+    def count(self, kind: str, filter_key: Tuple, count: Callable[[], int]) -> int:
+        """
+        Number of items matching a filter, counted once per snapshot rather
+        than on every page. Only the most recent filters are remembered.
+        """
+        with self._views_lock:
+            total = self._totals.get((kind, filter_key))
+        if total is None:
+            total = count()
+            with self._views_lock:
+                if len(self._totals) >= MAX_CACHED_TOTALS:
+                    self._totals.clear()
+                self._totals[(kind, filter_key)] = total
+        return total
+
+    def _view(self, kind: str, sort_by: str, build) -> Tuple[list, list]:
+        with self._views_lock:
+            view = self._views.get((kind, sort_by))
+            if view is None:
+                pairs = sorted(build(), key=lambda pair: pair[0])
+                view = ([item for _key, item in pairs], [k for k, _item in pairs])
+                self._views[(kind, sort_by)] = view
+            return view
+
+
+class ProjectIndex:
+    """
+    Incrementally refreshed view of the models directory of one dbt project.
+
+    Records (path, mtime, size) for every SQL and YAML file and keeps the
+    extracted FileRecord of each YAML file until the file changes on disk.
+    """
+
+    def __init__(self, dbt_project_path: str):
+        self.dbt_project_path = dbt_project_path
+        self.models_dir = os.path.join(dbt_project_path, 'models')
+        # path -> (mtime_ns, size)
+        self._files: Dict[str, Tuple[int, int]] = {}
+        # YAML path -> extracted record
+        self._records: Dict[str, FileRecord] = {}
+        # (source_name, table_name) -> YAML paths declaring it
+        self._source_files: Dict[Tuple[str, str], List[str]] = {}
+        # YAML path -> record including edits not yet written to disk
+        self._pending: Dict[str, FileRecord] = {}
+        self._lock = threading.RLock()
+        self._populated = False
+        # Bumped on every change; the cached snapshot is tied to it
+        self._version = 0
+        self._snapshot: Optional[ProjectSnapshot] = None
+        self._snapshot_version = -1
+        # Set while a ProjectWatcher pushes changes into this index, in which
+        # case refresh() can skip the directory walk and stat sweep
+        self.watched = False
+        self._cache = IndexCache(dbt_project_path) if INDEX_CACHE_ENABLED else None
+        # Records changed since the cache was last saved, and the pending save
+        self._cache_dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Walk the models directory and stat every SQL and YAML file."""
+        found = {}
+        for root, _dirs, files in os.walk(self.models_dir):
+            for name in files:
+                if not name.endswith(SQL_EXTENSIONS + YAML_EXTENSIONS):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                found[path] = (stat.st_mtime_ns, stat.st_size)
+        return found
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Bring the index up to date, re-parsing only changed YAML files.
+        While the index is watched the walk is skipped unless forced.
+        """
+        with self._lock:
+            if self.watched and self._populated and not force:
+                return
+
+            found = self._scan()
+
+            # A cold build starts from the on-disk cache of a previous process
+            cached = self._cache.load() if self._cache and not self._populated else {}
+
+            for path in list(self._files):
+                if path not in found:
+                    self._forget(path)
+
+            self._apply({
+                path: signature for path, signature in found.items()
+                if self._files.get(path) != signature
+            }, cached, cold=not self._populated)
+
+            self._populated = True
+
+    def _forget(self, path: str) -> None:
+        if self._files.pop(path, None) is not None:
+            self._set_record(path, None)
+            self._version += 1
+
+    def _set_record(self, path: str, record: Optional[FileRecord]) -> None:
+        """Replace the record of a YAML file, keeping the source lookup in sync."""
+        old = self._records.pop(path, None)
+        if old is not None:
+            for key in old.source_positions:
+                paths = self._source_files.get(key, [])
+                if path in paths:
+                    paths.remove(path)
+                if not paths:
+                    self._source_files.pop(key, None)
+
+        if record is not None:
+            self._records[path] = record
+            for key in record.source_positions:
+                self._source_files.setdefault(key, []).append(path)
+
+    def _apply(self, changed: Dict[str, Tuple[int, int]], cached: Optional[Dict] = None,
+               cold: bool = False) -> None:
+        """
+        Record new signatures and re-parse the changed YAML files as one batch,
+        reusing records from the on-disk cache where the file is unchanged.
+        """
+        if not changed:
+            return
+
+        records = {}
+        to_parse = []
+        for path, signature in changed.items():
+            if not path.endswith(YAML_EXTENSIONS):
+                continue
+            record = reuse_cached_record(cached, path, signature) if cached else None
+            if record is not None:
+                records[path] = record
+            else:
+                to_parse.append(path)
+        records.update(parse_file_records(to_parse))
+
+        for path, signature in changed.items():
+            self._files[path] = signature
+            if path in records:
+                self._set_record(path, records[path])
+        self._version += 1
+
+        if self._cache and (to_parse or cached):
+            self._cache_dirty = True
+            if cold:
+                self.save_cache()
+            elif self._save_timer is None:
+                # Later edits ride along with this save instead of each writing the cache
+                self._save_timer = threading.Timer(INDEX_CACHE_SAVE_DELAY_S, self.save_cache)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def save_cache(self) -> None:
+        """Write the records to the on-disk cache if they changed since the last save."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._cache or not self._cache_dirty:
+                return
+            self._cache_dirty = False
+            self._cache.save({
+                path: (self._files[path], record) for path, record in self._records.items()
+            })
+
+    def apply_changes(self, paths: Iterable[str]) -> None:
+        """
+        Update the index for a batch of changed paths reported by a watcher.
+        Directory-level events (e.g. a renamed folder) trigger a full refresh.
+        """
+        with self._lock:
+            if not self._populated:
+                self.refresh(force=True)
+                return
+
+            changed = {}
+            for path in paths:
+                if path.endswith(SQL_EXTENSIONS + YAML_EXTENSIONS):
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        self._forget(path)
+                        continue
+                    signature = (stat.st_mtime_ns, stat.st_size)
+                    if self._files.get(path) != signature:
+                        changed[path] = signature
+                elif os.path.isdir(path) or self._has_files_under(path):
+                    # A directory was created, moved or removed
+                    self.refresh(force=True)
+                    return
+
+            self._apply(changed)
+
+    def _has_files_under(self, directory: str) -> bool:
+        prefix = directory.rstrip(os.sep) + os.sep
+        return any(path.startswith(prefix) for path in self._files)
+
+    def _lookup_source(self, source_name: str, table_name: str) -> Optional[SourceLocation]:
+        paths = self._source_files.get((source_name, table_name))
+        if not paths:
+            return None
+        path = min(paths)
+        source_index, table_index = self._records[path].source_positions[(source_name, table_name)]
+        return SourceLocation(path, source_index, table_index)
+
+    def find_source(self, source_name: str, table_name: str) -> Optional[SourceLocation]:
+        """
+        Look up the file declaring a source table in O(1). The candidate file is
+        re-validated with a single stat so an edit that has not reached the index
+        yet (e.g. still within the watcher's debounce window) is picked up. The
+        project is walked only if the index is cold or the lookup misses.
+        """
+        with self._lock:
+            walked = not self._populated
+            if walked:
+                self.refresh(force=True)
+
+            location = self._lookup_source(source_name, table_name)
+            if location is not None:
+                self.apply_changes([location.path])
+                location = self._lookup_source(source_name, table_name)
+
+            if location is None and not walked:
+                # The declaration may live in a file the index has not seen yet
+                self.refresh(force=True)
+                location = self._lookup_source(source_name, table_name)
+
+            return location
+
+    def set_pending_record(self, path: str, record: Optional[FileRecord]) -> None:
+        """
+        Overlay the record of a YAML file with edits that have not been written
+        yet (see write_behind). Passing None drops the overlay. Overlays only
+        affect snapshots; they are never saved to the on-disk cache.
+        """
+        with self._lock:
+            if record is None:
+                if self._pending.pop(path, None) is None:
+                    return
+            else:
+                self._pending[path] = record
+            self._version += 1
+
+    def snapshot(self) -> ProjectSnapshot:
+        """Return the aggregated view of the project at the current version."""
+        with self._lock:
+            if self._snapshot is None or self._snapshot_version != self._version:
+                sql_files = sorted(p for p in self._files if p.endswith(SQL_EXTENSIONS))
+                current = {**self._records, **self._pending}
+                records = [(path, current[path]) for path in sorted(current)]
+                self._snapshot = ProjectSnapshot(self.models_dir, sql_files, records)
+                self._snapshot_version = self._version
+            return self._snapshot
+
+    def get_test_mapping(self) -> Dict[str, List[str]]:
+        """Return the model name -> tests mapping across all schema files."""
+        return self.snapshot().test_mapping
+
+    def get_models(self) -> List[Model]:
+        """Build Model objects for every SQL file in the project."""
+        return self.snapshot().get_models()
+
+    def get_sources(self) -> List[Dict[str, Any]]:
+        """Return the source tables declared in the project's YAML files."""
+        return list(self.snapshot().sources)
+
+
+_indexes: Dict[str, ProjectIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_project_index(dbt_project_path: str, refresh: bool = True) -> ProjectIndex:
+    """
+    Return the ProjectIndex for a dbt project, creating it on first use.
+    By default the index is refreshed before being returned.
+    """
+    key = os.path.abspath(dbt_project_path)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = ProjectIndex(key)
+            _indexes[key] = index
+
+    if refresh:
+        index.refresh()
+    return index
+
+
+def get_project_snapshot(dbt_project_path: str) -> ProjectSnapshot:
+    """
+    Refresh the project's index once and return the shared snapshot of its
+    models, test mapping and sources.
+    """
+    models_dir = os.path.join(dbt_project_path, 'models')
+    if not os.path.exists(models_dir):
+        raise ValueError(f"Models directory not found at {models_dir}")
+
+    return get_project_index(dbt_project_path).snapshot()
+
+
+def notify_written(paths: Iterable[str]) -> None:
+    """
+    Push files the app itself wrote or deleted into the indexes covering them,
+    so a read straight after a write sees it even while a watcher (whose
+    events arrive only after its debounce) keeps the index from walking.
+    """
+    paths = [os.path.abspath(path) for path in paths]
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        prefix = os.path.join(index.models_dir, '')
+        mine = [path for path in paths if path.startswith(prefix)]
+        # A cold index reads the files anyway on its first refresh
+        if mine and index._populated:
+            index.apply_changes(mine)
+
+
+def flush_index_caches() -> None:
+    """Save every index's unsaved records to its on-disk cache. Called on shutdown."""
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        index.save_cache()
+
+
+def clear_project_indexes(dbt_project_path: Optional[str] = None) -> None:
+    """Drop the cached index for one project, or for all projects."""
+    with _indexes_lock:
+        if dbt_project_path is None:
+            _indexes.clear()
+        else:
+            _indexes.pop(os.path.abspath(dbt_project_path), None)
@@ -0,0 +1,120 @@
+"""
+Background watcher that pushes filesystem changes of the configured dbt
+project into its ProjectIndex.
+
+While the watcher runs, requests read the index without walking or
+stat-ing the models directory. Bursts of events (e.g. a branch checkout
+touching thousands of files) are debounced by watchfiles into a single
+batch, which is then applied as one re-parse off the event loop.
+"""
+import asyncio
+import os
+from typing import Optional
+from .project_index import get_project_index
+from ..config.constants import WATCH_PROJECT_FILES, WATCH_DEBOUNCE_MS
+
+try:
+    from watchfiles import awatch
+except ImportError:  # pragma: no cover - watchfiles is optional
+    awatch = None
+
+
+class ProjectWatcher:
+    """Watches the models directory of one dbt project."""
+
+    def __init__(self, dbt_project_path: str, debounce_ms: int = WATCH_DEBOUNCE_MS):
+        self.dbt_project_path = dbt_project_path
+        self.debounce_ms = debounce_ms
+        self.index = get_project_index(dbt_project_path, refresh=False)
+        self._stop_event = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """
+        Subscribe to changes, then build the index, so nothing written in
+        between is missed, and follow changes in the background.
+        """
+        subscribed = asyncio.Event()
+        self._task = asyncio.create_task(self._run(subscribed))
+        await subscribed.wait()
+        await asyncio.to_thread(self.index.refresh, True)
+        if self.running:
+            self.index.watched = True
+
+    async def stop(self) -> None:
+        """Stop watching and fall back to stat-validated refreshes."""
+        self._stop_event.set()
+        if self._task:
+            await self._task
+            self._task = None
+
+    async def _run(self, subscribed: asyncio.Event) -> None:
+        changes = awatch(
+            self.index.models_dir,
+            debounce=self.debounce_ms,
+            stop_event=self._stop_event,
+        )
+        next_batch = None
+        try:
+            # awatch subscribes to the directory as soon as it is first
+            # advanced, before it waits for events; events from then on are
+            # reported with its first batch
+            next_batch = asyncio.ensure_future(changes.__anext__())
+            await asyncio.sleep(0)
+            subscribed.set()
+            while True:
+                try:
+                    batch = await next_batch
+                except StopAsyncIteration:
+                    break
+                paths = {path for _change, path in batch}
+                await asyncio.to_thread(self.index.apply_changes, paths)
+                next_batch = asyncio.ensure_future(changes.__anext__())
+        except Exception as e:
+            print(f"Error watching {self.index.models_dir}: {str(e)}")
+        finally:
+            subscribed.set()
+            if next_batch is not None and not next_batch.done():
+                next_batch.cancel()
+            await changes.aclose()
+            # Without a watcher, requests must validate the index themselves
+            self.index.watched = False
+
+
+_watcher: Optional[ProjectWatcher] = None
+
+
+async def start_project_watcher(dbt_project_path: str) -> bool:
+    """
+    Start watching the given project, replacing any watcher for a
+    previously configured project. Returns True if a watcher is running.
+    """
+    global _watcher
+
+    if not WATCH_PROJECT_FILES or awatch is None:
+        return False
+
+    if not os.path.isdir(os.path.join(dbt_project_path, 'models')):
+        await stop_project_watcher()
+        return False
+
+    if _watcher and _watcher.running and \
+            os.path.abspath(_watcher.dbt_project_path) == os.path.abspath(dbt_project_path):
+        return True
+
+    await stop_project_watcher()
+    _watcher = ProjectWatcher(dbt_project_path)
+    await _watcher.start()
+    return True
+
+
+async def stop_project_watcher() -> None:
+    """Stop the active watcher, if any."""
+    global _watcher
+    if _watcher:
+        await _watcher.stop()
+        _watcher = None
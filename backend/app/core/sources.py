@@ -1,109 +1,108 @@
 import os
-import yaml
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from ..config.constants import TESTS_YAML_KEY
+from .project_index import get_project_index, get_project_snapshot, extract_sources, SourceLocation, SOURCE_SORT_KEYS
+from .pagination import paginate, build_filter, count_matches, filter_key
+from ..schemas.common import ListQuery
+from .yaml_io import load_yaml
+from .yaml_writes import update_yaml_file
 
 def parse_sources_from_yaml(yaml_content: str) -> List[Dict[str, Any]]:
     """Parse YAML content and extract sources information."""
     try:
-        data = yaml.safe_load(yaml_content)
-        if not data or 'sources' not in data:
-            return []
-        
-        sources = []
-        for source in data['sources']:
-            source_name = source.get('name', '')
-            schema = source.get('schema', '')
-            
-            for table in source.get('tables', []):
-                # Get all tests from both tests and data_tests fields
-                tests = []
-                
-                # Add table-level tests from data_tests
-                for test in table.get('data_tests', []):
-                    if isinstance(test, str):
-                        tests.append(test)
-                    elif isinstance(test, dict):
-                        tests.append(list(test.keys())[0])
-                
-                # Add table-level tests from tests
-                for test in table.get('tests', []):
-                    if isinstance(test, str):
-                        tests.append(test)
-                    elif isinstance(test, dict):
-                        tests.append(list(test.keys())[0])
-                
-                # Add column-level tests
-                for column in table.get('columns', []):
-                    # Add column-level tests from data_tests
-                    for test in column.get('data_tests', []):
-                        if isinstance(test, str):
-                            tests.append(f"{column['name']}: {test}")
-                        elif isinstance(test, dict):
-                            tests.append(f"{column['name']}: {list(test.keys())[0]}")
-                    
-                    # Add column-level tests from tests
-                    for test in column.get('tests', []):
-                        if isinstance(test, str):
-                            tests.append(f"{column['name']}: {test}")
-                        elif isinstance(test, dict):
-                            tests.append(f"{column['name']}: {list(test.keys())[0]}")
-                
-                sources.append({
-                    'source': source_name,
-                    'schema': schema,
-                    'table': table.get('name', ''),
-                    'tests': tests,
-                    'description': table.get('description', '')
-                })
-        return sources
+        data = load_yaml(yaml_content)
+        return extract_sources(data)
     except Exception as e:
         print(f"Error parsing YAML: {str(e)}")
         return []
 
 def get_sources_from_project(dbt_project_path: str) -> List[Dict[str, Any]]:
     """Scan models directory for YAML files and extract all sources."""
-    all_sources = []
     models_dir = Path(dbt_project_path) / 'models'
     
     if not models_dir.exists():
-        return all_sources
+        return []
     
-    for yaml_file in models_dir.rglob('*.yml'):
-        try:
-            with open(yaml_file, 'r') as f:
-                content = f.read()
-                sources = parse_sources_from_yaml(content)
-                all_sources.extend(sources)
-        except Exception as e:
-            print(f"Error reading file {yaml_file}: {str(e)}")
-            continue
+    # Serve from the project index, which only re-parses changed files
+    return get_project_index(dbt_project_path).get_sources()
+
+SOURCE_SORT_FIELDS = list(SOURCE_SORT_KEYS)
+DEFAULT_SOURCE_SORT = 'path'
+
+def query_project_sources(dbt_project_path: str, query: ListQuery) -> Tuple[List[Dict[str, Any]], Optional[str], int]:
+    """
+    Sort, filter and page the project's sources using the precomputed sorted
+    views of the project index. Returns (sources, next_cursor, total).
+    """
+    models_dir = Path(dbt_project_path) / 'models'
+    
+    if not models_dir.exists():
+        return [], None, 0
     
-    return all_sources
+    snapshot = get_project_snapshot(dbt_project_path)
+    sort_by = query.sort_by or DEFAULT_SOURCE_SORT
+    indices, keys = snapshot.sorted_sources(sort_by)
+    predicate = build_filter(
+        query,
+        name_of=lambda i: f"{snapshot.sources[i]['source']}.{snapshot.sources[i]['table']}",
+        schema_of=lambda i: snapshot.sources[i]['schema'],
+        path_of=lambda i: snapshot.source_paths[i],
+        tests_of=lambda i: snapshot.sources[i]['tests'],
+    )
+    total = snapshot.count('sources', filter_key(query), lambda: count_matches(indices, predicate))
+    page, next_cursor, total = paginate(
+        indices, keys, predicate, query.limit, query.cursor, query.sort_desc,
+        sort_by=sort_by, total=total
+    )
+    return [snapshot.sources[i] for i in page], next_cursor, total
 
-def find_source_file(dbt_project_path: str, source_name: str, table_name: str) -> Optional[Path]:
-    """Find the YAML file containing a specific source and table."""
+def find_source_location(dbt_project_path: str, source_name: str, table_name: str) -> Optional[SourceLocation]:
+    """
+    Find the YAML file declaring a specific source and table, together with
+    the table's (source index, table index) position hint in that file.
+    """
     models_dir = Path(dbt_project_path) / 'models'
     
     if not models_dir.exists():
         return None
     
-    for yaml_file in models_dir.rglob('*.yml'):
-        try:
-            with open(yaml_file, 'r') as f:
-                data = yaml.safe_load(f)
-                if not data or 'sources' not in data:
-                    continue
-                
-                for source in data['sources']:
-                    if source.get('name') == source_name:
-                        for table in source.get('tables', []):
-                            if table.get('name') == table_name:
-                                return yaml_file
-        except Exception as e:
-            print(f"Error reading file {yaml_file}: {str(e)}")
-            continue
+    # O(1) lookup in the project index instead of parsing files one by one;
+    # find_source re-validates its answer and walks the project only on a miss
+    return get_project_index(dbt_project_path, refresh=False).find_source(source_name, table_name)
+
+def find_source_file(dbt_project_path: str, source_name: str, table_name: str) -> Optional[Path]:
+    """Find the YAML file containing a specific source and table."""
+    location = find_source_location(dbt_project_path, source_name, table_name)
+    return Path(location.path) if location else None
+
+def _find_source_table(
+    data: Dict[str, Any],
+    source_name: str,
+    table_name: str,
+    position: Optional[Tuple[int, int]] = None
+) -> Optional[Tuple[Dict[str, Any], int]]:
+    """
+    Locate a source table in a parsed YAML document. Returns the source entry
+    and the table's index in it. A (source index, table index) position hint
+    is tried first and verified by name before falling back to a scan.
+    """
+    sources = data.get('sources') or []
+    
+    if position:
+        source_index, table_index = position
+        if source_index < len(sources):
+            source = sources[source_index]
+            tables = source.get('tables') or []
+            if source.get('name') == source_name and table_index < len(tables) \
+                    and tables[table_index].get('name') == table_name:
+                return source, table_index
+    
+    for source in sources:
+        if source.get('name') == source_name:
+            for i, table in enumerate(source.get('tables', [])):
+                if table.get('name') == table_name:
+                    return source, i
     
     return None
 
@@ -112,86 +111,82 @@ def update_source(dbt_project_path: str,
                  original_table: str, 
                  updated_source: Dict[str, Any]) -> bool:
     """Update a source table in the YAML file."""
-    source_file = find_source_file(dbt_project_path, original_source, original_table)
+    location = find_source_location(dbt_project_path, original_source, original_table)
     
-    if not source_file:
+    if not location:
         return False
     
-    try:
-        with open(source_file, 'r') as f:
-            data = yaml.safe_load(f)
-        
+    def update(data: Dict[str, Any]) -> bool:
         # Find and update the source table
-        for source in data['sources']:
-            if source.get('name') == original_source:
-                for i, table in enumerate(source.get('tables', [])):
-                    if table.get('name') == original_table:
-                        # Update table properties
-                        table['name'] = updated_source['table']
-                        table['description'] = updated_source.get('description', '')
-                        
-                        # If the source or schema name changed, we need to update those as well
-                        if updated_source['source'] != original_source:
-                            # Create a new source entry if it doesn't exist
-                            existing_source = None
-                            for s in data['sources']:
-                                if s.get('name') == updated_source['source']:
-                                    existing_source = s
-                                    break
-                            
-                            if existing_source:
-                                # Move the table to the existing source
-                                existing_source['tables'].append(table)
-                                source['tables'].pop(i)
-                            else:
-                                # Rename the source
-                                source['name'] = updated_source['source']
-                                source['schema'] = updated_source['schema']
-                        
-                        # Write the updated data back to the file
-                        with open(source_file, 'w') as f:
-                            yaml.dump(data, f, sort_keys=False)
-                        
-                        return True
+        located = _find_source_table(
+            data, original_source, original_table,
+            (location.source_index, location.table_index)
+        )
+        if not located:
+            return False
         
-        return False
+        source, i = located
+        table = source['tables'][i]
+        
+        # Update table properties
+        table['name'] = updated_source['table']
+        table['description'] = updated_source.get('description', '')
+        
+        # If the source or schema name changed, we need to update those as well
+        if updated_source['source'] != original_source:
+            # Create a new source entry if it doesn't exist
+            existing_source = None
+            for s in data['sources']:
+                if s.get('name') == updated_source['source']:
+                    existing_source = s
+                    break
+            
+            if existing_source:
+                # Move the table to the existing source
+                existing_source['tables'].append(table)
+                source['tables'].pop(i)
+            else:
+                # Rename the source
+                source['name'] = updated_source['source']
+                source['schema'] = updated_source['schema']
+        
+        return True
+    
+    try:
+        # Read, update and atomically write back the file under its lock
+        return update_yaml_file(location.path, update, sort_keys=False)
     except Exception as e:
         print(f"Error updating source: {str(e)}")
         return False
 
 def delete_source(dbt_project_path: str, source_name: str, table_name: str) -> bool:
     """Delete a source table from the YAML file."""
-    source_file = find_source_file(dbt_project_path, source_name, table_name)
+    location = find_source_location(dbt_project_path, source_name, table_name)
     
-    if not source_file:
+    if not location:
         return False
     
-    try:
-        with open(source_file, 'r') as f:
-            data = yaml.safe_load(f)
-        
+    def delete(data: Dict[str, Any]) -> bool:
         # Find and delete the source table
-        for source in data['sources']:
-            if source.get('name') == source_name:
-                for i, table in enumerate(source.get('tables', [])):
-                    if table.get('name') == table_name:
-                        # Remove the table
-                        source['tables'].pop(i)
-                        
-                        # If there are no tables left, remove the source
-                        if not source.get('tables'):
-                            for j, s in enumerate(data['sources']):
-                                if s.get('name') == source_name:
-                                    data['sources'].pop(j)
-                                    break
-                        
-                        # Write the updated data back to the file
-                        with open(source_file, 'w') as f:
-                            yaml.dump(data, f, sort_keys=False)
-                        
-                        return True
+        located = _find_source_table(
+            data, source_name, table_name,
+            (location.source_index, location.table_index)
+        )
+        if not located:
+            return False
         
-        return False
+        source, i = located
+        source['tables'].pop(i)
+        
+        # If there are no tables left, remove the source
+        if not source.get('tables'):
+            data['sources'].remove(source)
+        
+        return True
+    
+    try:
+        # Read, update and atomically write back the file under its lock
+        return update_yaml_file(location.path, delete, sort_keys=False)
     except Exception as e:
         print(f"Error deleting source: {str(e)}")
         return False
@@ -213,7 +208,7 @@ def create_sources(dbt_project_path: str, source_name: str, schema_name: str, ta
     for yaml_file in models_dir.rglob('*.y*ml'):  # Match both .yml and .yaml
         try:
             with open(yaml_file, 'r') as f:
-                data = yaml.safe_load(f)
+                data = load_yaml(f)
                 # Check if this file has sources
                 if data and 'sources' in data:
                     existing_source_file = yaml_file
@@ -223,40 +218,30 @@ def create_sources(dbt_project_path: str, source_name: str, schema_name: str, ta
             continue
     
     # If no existing file with sources found, create a new sources.yml
-    if not existing_source_file:
-        sources_file = models_dir / 'sources.yml'
-        data = {
-            'version': 2,
-            'sources': []
-        }
-    else:
-        sources_file = existing_source_file
-        try:
-            with open(sources_file, 'r') as f:
-                data = yaml.safe_load(f)
-                if 'sources' not in data:
-                    data['sources'] = []
-        except Exception as e:
-            print(f"Error reading existing sources file: {str(e)}")
-            return False
+    sources_file = existing_source_file or models_dir / 'sources.yml'
     
-    # Check if the source already exists
-    existing_source = None
-    for source in data['sources']:
-        if source.get('name') == source_name:
-            existing_source = source
-            break
+    # Handle tables whether they're dictionaries with get() or objects with attributes
+    def get_safe(item, key, default=''):
+        # Handle both dict.get() and object.attribute access
+        if hasattr(item, 'get') and callable(item.get):
+            return item.get(key, default)
+        elif hasattr(item, key):
+            return getattr(item, key, default)
+        else:
+            return default
     
-    try:
-        # Handle tables whether they're dictionaries with get() or objects with attributes
-        def get_safe(item, key, default=''):
-            # Handle both dict.get() and object.attribute access
-            if hasattr(item, 'get') and callable(item.get):
-                return item.get(key, default)
-            elif hasattr(item, key):
-                return getattr(item, key, default)
-            else:
-                return default
+    def add_tables(data: Dict[str, Any]) -> bool:
+        if not data:
+            data['version'] = 2
+        if 'sources' not in data:
+            data['sources'] = []
+        
+        # Check if the source already exists
+        existing_source = None
+        for source in data['sources']:
+            if source.get('name') == source_name:
+                existing_source = source
+                break
         
         # Create or update the source
         if existing_source:
@@ -288,88 +273,164 @@ def create_sources(dbt_project_path: str, source_name: str, schema_name: str, ta
             }
             data['sources'].append(new_source)
         
-        # Write the updated file
-        with open(sources_file, 'w') as f:
-            yaml.dump(data, f, sort_keys=False)
-        
         return True
+    
+    try:
+        # Read, update and atomically write back the file under its lock
+        return update_yaml_file(str(sources_file), add_tables, sort_keys=False)
     except Exception as e:
         print(f"Error creating sources: {str(e)}")
         return False
 
+def apply_add_test_to_source(
+    data: Dict[str, Any],
+    source_name: str,
+    table_name: str,
+    test_config: Dict[str, Any],
+    column_name: Optional[str] = None,
+    position: Optional[Tuple[int, int]] = None
+) -> bool:
+    """
+    Add a test to a source table in parsed sources YAML, in place.
+    Returns False if the source table is not declared in data.
+    """
+    # Create test configuration based on config type, before any edit
+    test_type = test_config['test_type']
+    config = test_config.get('config', {})
+
+    # Create the test entry
+    test_entry = {test_type: {'config': config}}
+
+    # Find the source and table
+    located = _find_source_table(data, source_name, table_name, position)
+    if not located:
+        return False
+
+    # Ensure version 2
+    if 'version' not in data:
+        data['version'] = 2
+
+    source, table_index = located
+    table = source['tables'][table_index]
+
+    # Add the test to the appropriate section
+    if column_name:
+        # Add column-level test
+        if 'columns' not in table:
+            table['columns'] = []
+
+        # Find or create column entry
+        column_entry = None
+        for col in table['columns']:
+            if col.get('name') == column_name:
+                column_entry = col
+                break
+
+        if not column_entry:
+            column_entry = {'name': column_name}
+            table['columns'].append(column_entry)
+
+        # Determine which key to use for tests
+        test_key = 'tests' if 'tests' in column_entry else TESTS_YAML_KEY
+
+        # Add tests array if it doesn't exist
+        if test_key not in column_entry:
+            column_entry[test_key] = []
+
+        # Add the test
+        column_entry[test_key].append(test_entry)
+    else:
+        # Determine which key to use for tests
+        test_key = 'tests' if 'tests' in table else 'data_tests' if 'data_tests' in table else TESTS_YAML_KEY
+
+        # Add tests array if it doesn't exist
+        if test_key not in table:
+            table[test_key] = []
+
+        # Add the test
+        table[test_key].append(test_entry)
+
+    return True
+
+def apply_remove_test_from_source(
+    data: Dict[str, Any],
+    source_name: str,
+    table_name: str,
+    test_name: str,
+    column_name: Optional[str] = None,
+    position: Optional[Tuple[int, int]] = None
+) -> bool:
+    """
+    Remove a test from a source table in parsed sources YAML, in place.
+    Returns True if data was modified.
+    """
+    # Find the source and table
+    located = _find_source_table(data, source_name, table_name, position)
+    if not located:
+        return False
+
+    source, table_index = located
+    table = source['tables'][table_index]
+
+    modified = False
+
+    if column_name:
+        # Remove column-level test
+        if 'columns' in table:
+            for column in table['columns']:
+                if column.get('name') == column_name:
+                    # Check both test keys
+                    for test_key in ['tests', 'data_tests']:
+                        if test_key in column:
+                            for i, test in enumerate(column[test_key]):
+                                if test_name in test:
+                                    column[test_key].pop(i)
+                                    modified = True
+                                    break
+
+                            # If no tests left, remove the test key
+                            if not column[test_key]:
+                                column.pop(test_key)
+
+                    # If column has become empty, remove it
+                    if len(column) == 1 and 'name' in column:
+                        table['columns'].remove(column)
+                        modified = True
+    else:
+        # Remove table-level test
+        # Check both test keys
+        for test_key in ['tests', 'data_tests']:
+            if test_key in table:
+                for i, test in enumerate(table[test_key]):
+                    if test_name in test:
+                        table[test_key].pop(i)
+                        modified = True
+                        break
+
+                # If no tests left, remove the test key
+                if not table[test_key]:
+                    table.pop(test_key)
+
+    return modified
+
 def add_test_to_source(
     source_file: Path,
     source_name: str,
     table_name: str,
     test_config: Dict[str, Any],
-    column_name: Optional[str] = None
+    column_name: Optional[str] = None,
+    position: Optional[Tuple[int, int]] = None
 ) -> bool:
-    """Add a test to a source table in the YAML file."""
+    """
+    Add a test to a source table in the YAML file.
+    position is an optional (source index, table index) hint from find_source_location.
+    """
     try:
-        # Read existing YAML file
-        with open(source_file, 'r') as f:
-            data = yaml.safe_load(f) or {}
-        
-        # Ensure version 2
-        if 'version' not in data:
-            data['version'] = 2
-            
-        # Find the source and table
-        for source in data.get('sources', []):
-            if source.get('name') == source_name:
-                for table in source.get('tables', []):
-                    if table.get('name') == table_name:
-                        # Create test configuration based on config type
-                        test_type = test_config['test_type']
-                        config = test_config.get('config', {})
-                        
-                        # Create the test entry
-                        test_entry = {test_type: {'config': config}}
-                        
-                        # Add the test to the appropriate section
-                        if column_name:
-                            # Add column-level test
-                            if 'columns' not in table:
-                                table['columns'] = []
-                                
-                            # Find or create column entry
-                            column_entry = None
-                            for col in table['columns']:
-                                if col.get('name') == column_name:
-                                    column_entry = col
-                                    break
-                                    
-                            if not column_entry:
-                                column_entry = {'name': column_name}
-                                table['columns'].append(column_entry)
-                                
-                            # Determine which key to use for tests
-                            test_key = 'tests' if 'tests' in column_entry else TESTS_YAML_KEY
-                            
-                            # Add tests array if it doesn't exist
-                            if test_key not in column_entry:
-                                column_entry[test_key] = []
-                                
-                            # Add the test
-                            column_entry[test_key].append(test_entry)
-                        else:
-                            # Determine which key to use for tests
-                            test_key = 'tests' if 'tests' in table else 'data_tests' if 'data_tests' in table else TESTS_YAML_KEY
-                            
-                            # Add tests array if it doesn't exist
-                            if test_key not in table:
-                                table[test_key] = []
-                                
-                            # Add the test
-                            table[test_key].append(test_entry)
-                        
-                        # Write the updated file
-                        with open(source_file, 'w') as f:
-                            yaml.dump(data, f, sort_keys=False)
-                            
-                        return True
-                        
-        return False
+        return update_yaml_file(
+            str(source_file),
+            lambda data: apply_add_test_to_source(data, source_name, table_name, test_config, column_name, position),
+            sort_keys=False
+        )
     except Exception as e:
         print(f"Error adding test to source: {str(e)}")
         return False
@@ -379,66 +440,19 @@ def remove_test_from_source(
     source_name: str,
     table_name: str,
     test_name: str,
-    column_name: Optional[str] = None
+    column_name: Optional[str] = None,
+    position: Optional[Tuple[int, int]] = None
 ) -> bool:
-    """Remove a test from a source table in the YAML file."""
+    """
+    Remove a test from a source table in the YAML file.
+    position is an optional (source index, table index) hint from find_source_location.
+    """
     try:
-        # Read existing YAML file
-        with open(source_file, 'r') as f:
-            data = yaml.safe_load(f) or {}
-            
-        # Find the source and table
-        for source in data.get('sources', []):
-            if source.get('name') == source_name:
-                for table in source.get('tables', []):
-                    if table.get('name') == table_name:
-                        modified = False
-                        
-                        if column_name:
-                            # Remove column-level test
-                            if 'columns' in table:
-                                for column in table['columns']:
-                                    if column.get('name') == column_name:
-                                        # Check both test keys
-                                        for test_key in ['tests', 'data_tests']:
-                                            if test_key in column:
-                                                for i, test in enumerate(column[test_key]):
-                                                    if test_name in test:
-                                                        column[test_key].pop(i)
-                                                        modified = True
-                                                        break
-                                                
-                                                # If no tests left, remove the test key
-                                                if not column[test_key]:
-                                                    column.pop(test_key)
-                                                    
-                                        # If column has become empty, remove it
-                                        if len(column) == 1 and 'name' in column:
-                                            table['columns'].remove(column)
-                                            modified = True
-                        else:
-                            # Remove table-level test
-                            # Check both test keys
-                            for test_key in ['tests', 'data_tests']:
-                                if test_key in table:
-                                    for i, test in enumerate(table[test_key]):
-                                        if test_name in test:
-                                            table[test_key].pop(i)
-                                            modified = True
-                                            break
-                                    
-                                    # If no tests left, remove the test key
-                                    if not table[test_key]:
-                                        table.pop(test_key)
-                        
-                        # If modifications were made, write the updated file
-                        if modified:
-                            with open(source_file, 'w') as f:
-                                yaml.dump(data, f, sort_keys=False)
-                                
-                        return modified
-                        
-        return False
+        return update_yaml_file(
+            str(source_file),
+            lambda data: apply_remove_test_from_source(data, source_name, table_name, test_name, column_name, position),
+            sort_keys=False
+        )
     except Exception as e:
         print(f"Error removing test from source: {str(e)}")
         return False
@@ -447,7 +461,7 @@ def get_source_tests(source_file: Path, source_name: str, table_name: str) -> Li
     """Get all tests configured for a source table."""
     try:
         with open(source_file, 'r') as f:
-            data = yaml.safe_load(f) or {}
+            data = load_yaml(f) or {}
             
         for source in data.get('sources', []):
             if source.get('name') == source_name:
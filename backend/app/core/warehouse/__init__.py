@@ -1,12 +1,15 @@
 from .base_client import WarehouseClient
-from .postgres_client import PostgresClient
-from .bigquery_client import BigQueryClient
 from .client_factory import (
     parse_profiles_yml, 
     get_target_config, 
     get_client_for_target, 
-    get_profile_name_from_dbt_project
+    aget_client_for_target,
+    get_target_key,
+    get_profile_name_from_dbt_project,
+    register_driver,
+    get_driver
 )
+from .catalog_cache import invalidate_catalog_cache, get_catalog_cache_stats
 
 __all__ = [
     'WarehouseClient', 
@@ -15,5 +18,20 @@ __all__ = [
     'parse_profiles_yml',
     'get_target_config',
     'get_client_for_target',
-    'get_profile_name_from_dbt_project'
-] 
\ No newline at end of file
+    'aget_client_for_target',
+    'get_target_key',
+    'get_profile_name_from_dbt_project',
+    'invalidate_catalog_cache',
+    'get_catalog_cache_stats',
+    'register_driver',
+    'get_driver'
+]
+
+def __getattr__(name):
+    # Client classes import their drivers, so load them only when asked for
+    if name == 'PostgresClient':
+        return get_driver('postgres')
+    if name == 'BigQueryClient':
+        return get_driver('bigquery')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+ 
\ No newline at end of file
@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
+from .executor import run_warehouse_call
 
 class WarehouseClient(ABC):
-    """Base interface for database warehouse clients."""
+    """
+    Base interface for database warehouse clients.
+    
+    The methods block on the warehouse; async code awaits their a-prefixed
+    counterparts, which run them on the bounded warehouse executor.
+    """
     
     @abstractmethod
     def connect(self) -> bool:
@@ -24,7 +30,39 @@ class WarehouseClient(ABC):
         """Get list of all tables in a schema with basic metadata."""
         pass
     
+    def get_catalog(self) -> List[Dict[str, Any]]:
+        """
+        Get every schema with its tables, as [{'schema': ..., 'tables': [...]}].
+        Clients that can read the whole catalog in one round trip override this.
+        The default lists schemas one at a time; clients whose get_tables is
+        thread-safe can use gather_catalog to list them concurrently.
+        """
+        return [
+            {'schema': schema, 'tables': self.get_tables(schema)}
+            for schema in self.get_schemas()
+        ]
+    
     @abstractmethod
     def get_table_info(self, schema: str, table: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific table."""
-        pass 
\ No newline at end of file
+        pass
+    
+    async def aget_schemas(self) -> List[str]:
+        """Awaitable get_schemas."""
+        return await run_warehouse_call(self.get_schemas)
+    
+    async def aget_tables(self, schema: str) -> List[Dict[str, Any]]:
+        """Awaitable get_tables."""
+        return await run_warehouse_call(self.get_tables, schema)
+    
+    async def aget_catalog(self) -> List[Dict[str, Any]]:
+        """Awaitable get_catalog."""
+        return await run_warehouse_call(self.get_catalog)
+    
+    async def aget_table_info(self, schema: str, table: str) -> Optional[Dict[str, Any]]:
+        """Awaitable get_table_info."""
+        return await run_warehouse_call(self.get_table_info, schema, table)
+    
+    async def adisconnect(self) -> None:
+        """Awaitable disconnect (returning a pooled connection may talk to the server)."""
+        await run_warehouse_call(self.disconnect)
@@ -1,65 +1,137 @@
 from google.cloud import bigquery
 from google.oauth2 import service_account
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import hashlib
 import json
 import os
-import tempfile
+import threading
 from .base_client import WarehouseClient
+from .catalog import gather_catalog
+
+def _parse_option_string(value: Optional[str]) -> str:
+    """
+    Decode a string option from INFORMATION_SCHEMA.TABLE_OPTIONS, which is
+    rendered as a quoted literal, e.g. '"Daily orders"'.
+    """
+    if not value:
+        return ''
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value.strip('"')
+
+def _fingerprint(info: Optional[Dict[str, Any]]) -> str:
+    """Hash of a service account key, identifying its credentials."""
+    if not info:
+        return 'default'
+    return hashlib.sha256(json.dumps(info, sort_keys=True).encode()).hexdigest()
+
+# Parsed keyfiles with their fingerprints, keyed by path and validated by
+# the (mtime, size, inode) they were read at
+_keyfiles: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any], str]] = {}
+_keyfiles_lock = threading.Lock()
+
+def _load_keyfile(keyfile: str) -> Tuple[Dict[str, Any], str]:
+    """Return the parsed key in a keyfile and its fingerprint, re-reading it only after it changed."""
+    path = os.path.abspath(keyfile)
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _keyfiles_lock:
+        cached = _keyfiles.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1], cached[2]
+    
+    with open(path, 'r') as f:
+        info = json.load(f)
+    fingerprint = _fingerprint(info)
+    with _keyfiles_lock:
+        _keyfiles[path] = (signature, info, fingerprint)
+    return info, fingerprint
+
+def _service_account_info(config: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    Return the service account key of a target as a dict, with its
+    fingerprint: read from keyfile, or taken from keyfile_json. None means
+    application default credentials. Treat the key as read-only.
+    """
+    keyfile = config.get('keyfile', '')
+    if keyfile:
+        try:
+            return _load_keyfile(keyfile)
+        except FileNotFoundError:
+            pass
+    
+    info = config.get('keyfile_json')
+    if isinstance(info, str):
+        info = json.loads(info)
+    info = info or None
+    return info, _fingerprint(info)
+
+# Long-lived clients shared across requests, keyed by (project, credential
+# fingerprint), so their HTTP sessions and access tokens are reused
+_clients: Dict[Tuple[str, str], Any] = {}
+_clients_lock = threading.Lock()
+
+def get_shared_client(project_id: str, info: Optional[Dict[str, Any]], fingerprint: Optional[str] = None):
+    """Return the cached bigquery.Client for a project and credentials, creating it once."""
+    key = (project_id or '', fingerprint or _fingerprint(info))
+    
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            credentials = (
+                service_account.Credentials.from_service_account_info(info)
+                if info else None
+            )
+            client = bigquery.Client(project=project_id or None, credentials=credentials)
+            _clients[key] = client
+        return client
+
+def close_shared_clients() -> None:
+    """Close every cached client, e.g. at shutdown."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            print(f"Error closing BigQuery client: {str(e)}")
 
 class BigQueryClient(WarehouseClient):
     """BigQuery warehouse client implementation."""
     
-    def __init__(self, config: Dict[str, Any]):
-        """Initialize with connection details."""
+    def __init__(self, config: Dict[str, Any], client: Optional[Any] = None):
+        """
+        Initialize with connection details. An already constructed client
+        (e.g. a fake in tests) can be passed in instead of connecting.
+        """
         self.config = config
-        self.client = None
+        self.client = client
         self.project_id = config.get('project', '')
         self.dataset = config.get('dataset', '')
         self.keyfile = config.get('keyfile', '')
-        self.credentials = None
-        self.temp_keyfile = None
     
     def connect(self) -> bool:
-        """Establish connection to BigQuery."""
+        """Get the shared BigQuery client for this target's project and credentials."""
+        if self.client is not None:
+            return True
+        
         try:
-            if self.keyfile and os.path.exists(self.keyfile):
-                # Use existing keyfile if provided
-                self.credentials = service_account.Credentials.from_service_account_file(
-                    self.keyfile
-                )
-            elif 'keyfile_json' in self.config:
-                # Create temporary file for service account credentials
-                with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-                    json.dump(self.config['keyfile_json'], f)
-                    self.temp_keyfile = f.name
-                
-                self.credentials = service_account.Credentials.from_service_account_file(
-                    self.temp_keyfile
-                )
-            else:
-                # Use application default credentials if no keyfile provided
-                self.credentials = None
-            
-            self.client = bigquery.Client(
-                project=self.project_id,
-                credentials=self.credentials
-            )
-            
+            # Credentials are built from the key in memory, never via a temp file
+            info, fingerprint = _service_account_info(self.config)
+            self.client = get_shared_client(self.project_id, info, fingerprint)
             return self.client is not None
         except Exception as e:
             print(f"Error connecting to BigQuery: {str(e)}")
             return False
     
     def disconnect(self) -> None:
-        """Close the BigQuery connection."""
-        if self.client:
-            self.client.close()
-        # Clean up temporary keyfile if it exists
-        if self.temp_keyfile and os.path.exists(self.temp_keyfile):
-            try:
-                os.unlink(self.temp_keyfile)
-            except Exception as e:
-                print(f"Error cleaning up temporary keyfile: {str(e)}")
+        """
+        Nothing to release: the shared client stays open for later requests
+        and is closed by close_shared_clients.
+        """
+        pass
     
     def get_schemas(self) -> List[str]:
         """Get list of all datasets (schemas) in BigQuery."""
@@ -74,17 +146,58 @@ class BigQueryClient(WarehouseClient):
             print(f"Error fetching BigQuery datasets: {str(e)}")
             return []
     
-    def get_tables(self, schema: str) -> List[Dict[str, Any]]:
-        """Get list of all tables in the specified dataset (schema)."""
+    def _dataset_path(self, schema: str) -> str:
+        """Fully qualified, quoted dataset for INFORMATION_SCHEMA queries."""
+        if '.' in schema:
+            return f"`{schema}`"
+        return f"`{self.project_id or self.client.project}.{schema}`"
+    
+    def _query_tables(self, schema: str) -> List[Dict[str, Any]]:
+        """Read names and descriptions of every table in a dataset with one query."""
+        dataset = self._dataset_path(schema)
+        query = f"""
+        SELECT t.table_name, o.option_value AS description
+        FROM {dataset}.INFORMATION_SCHEMA.TABLES AS t
+        LEFT JOIN {dataset}.INFORMATION_SCHEMA.TABLE_OPTIONS AS o
+            ON o.table_name = t.table_name AND o.option_name = 'description'
+        ORDER BY t.table_name
+        """
+        return [
+            {
+                'name': row['table_name'],
+                'description': _parse_option_string(row['description'])
+            }
+            for row in self.client.query(query).result()
+        ]
+    
+    def get_tables(self, schema: str, include_descriptions: bool = True) -> List[Dict[str, Any]]:
+        """
+        Get list of all tables in the specified dataset (schema).
+        
+        Descriptions come from one INFORMATION_SCHEMA query for the whole
+        dataset instead of one get_table call per table. Callers that only
+        need names pass include_descriptions=False, which lists the tables
+        without running a query; descriptions are then empty.
+        """
         if not self.client:
             if not self.connect():
                 return []
         
         try:
-            tables = list(self.client.list_tables(schema))
-            result = []
+            if not include_descriptions:
+                return [
+                    {'name': table.table_id, 'description': ''}
+                    for table in self.client.list_tables(schema)
+                ]
             
-            for table in tables:
+            try:
+                return self._query_tables(schema)
+            except Exception as e:
+                # e.g. no permission to run query jobs: read tables one by one
+                print(f"Falling back to per-table metadata for BigQuery dataset {schema}: {str(e)}")
+            
+            result = []
+            for table in self.client.list_tables(schema):
                 table_ref = self.client.get_table(table.reference)
                 result.append({
                     'name': table.table_id,
@@ -96,6 +209,21 @@ class BigQueryClient(WarehouseClient):
             print(f"Error fetching tables from BigQuery dataset {schema}: {str(e)}")
             return []
     
+    def get_catalog(self) -> List[Dict[str, Any]]:
+        """
+        Get every dataset with its tables. Only table names are fetched, with
+        one list call per dataset, run concurrently (the BigQuery client is
+        thread-safe); use get_tables for descriptions.
+        """
+        if not self.client:
+            if not self.connect():
+                return []
+        
+        return gather_catalog(
+            self.get_schemas(),
+            lambda schema: self.get_tables(schema, include_descriptions=False)
+        )
+    
     def get_table_info(self, schema: str, table: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific table."""
         if not self.client:
@@ -0,0 +1,51 @@
+"""
+Concurrent per-schema catalog fetching for warehouses whose catalog cannot
+be read in a single query.
+"""
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List
+from ...config.constants import CATALOG_FETCH_WORKERS, CATALOG_FETCH_TIMEOUT_S
+
+
+def gather_catalog(
+    schemas: Iterable[str],
+    fetch_tables: Callable[[str], List[Dict[str, Any]]],
+    max_workers: int = CATALOG_FETCH_WORKERS,
+    timeout: float = CATALOG_FETCH_TIMEOUT_S,
+) -> List[Dict[str, Any]]:
+    """
+    Call fetch_tables for every schema on a bounded thread pool and return
+    [{'schema': ..., 'tables': [...]}] in schema order, so latency follows the
+    slowest schema rather than the sum of all of them.
+
+    fetch_tables must be safe to call from several threads at once. Schemas
+    that fail or are still running after timeout seconds are returned with
+    no tables and 'incomplete': True instead of failing the whole catalog.
+    """
+    schemas = list(schemas)
+    if not schemas:
+        return []
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(schemas))),
+        thread_name_prefix='catalog',
+    )
+    try:
+        futures = [executor.submit(fetch_tables, schema) for schema in schemas]
+        wait(futures, timeout=timeout)
+    finally:
+        # Do not wait for stragglers; their results are dropped
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    catalog = []
+    for schema, future in zip(schemas, futures):
+        if future.done() and not future.cancelled() and future.exception() is None:
+            catalog.append({'schema': schema, 'tables': future.result()})
+            continue
+
+        if future.done() and not future.cancelled():
+            print(f"Error fetching tables from schema {schema}: {str(future.exception())}")
+        else:
+            print(f"Timed out fetching tables from schema {schema}")
+        catalog.append({'schema': schema, 'tables': [], 'incomplete': True})
+    return catalog
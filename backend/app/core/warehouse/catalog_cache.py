@@ -0,0 +1,306 @@
+"""
+In-memory cache of warehouse metadata.
+
+Schema lists, table lists and column details barely change between
+requests, but every request used to query the warehouse for them (and, on
+BigQuery, spend API quota doing so). CachedWarehouseClient wraps a
+WarehouseClient and answers those calls from a process-wide cache keyed by
+the target config:
+
+- each level (schemas, tables, columns) has its own TTL;
+- an expired entry is still served for up to CATALOG_CACHE_STALE_S while a
+  fresh copy is fetched in the background on a new client;
+- the cache holds at most CATALOG_CACHE_MAX_ENTRIES entries and evicts the
+  least recently used ones;
+- empty results are kept only for CATALOG_CACHE_EMPTY_TTL_S, since clients
+  also report failed lookups that way, and catalogs with schemas that could
+  not be read are not cached at all;
+- values are frozen (tuples and read-only mappings) when stored and shared
+  by every caller, so a hit costs no copy.
+
+invalidate_catalog_cache drops entries explicitly, and get_catalog_cache_stats
+reports hit and miss counts.
+"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .base_client import WarehouseClient
+from .executor import run_warehouse_call
+from ...config.constants import (
+    CATALOG_CACHE_ENABLED,
+    CATALOG_CACHE_SCHEMAS_TTL_S,
+    CATALOG_CACHE_TABLES_TTL_S,
+    CATALOG_CACHE_COLUMNS_TTL_S,
+    CATALOG_CACHE_EMPTY_TTL_S,
+    CATALOG_CACHE_STALE_S,
+    CATALOG_CACHE_MAX_ENTRIES,
+    CATALOG_CACHE_REFRESH_WORKERS,
+)
+
+# (target key, level, schema, table)
+CacheKey = Tuple[str, str, Optional[str], Optional[str]]
+
+_TTLS = {
+    'schemas': CATALOG_CACHE_SCHEMAS_TTL_S,
+    'tables': CATALOG_CACHE_TABLES_TTL_S,
+    'catalog': CATALOG_CACHE_TABLES_TTL_S,
+    'columns': CATALOG_CACHE_COLUMNS_TTL_S,
+}
+
+
+def _cacheable(level: str, value: Any) -> bool:
+    """Whether a result may be cached: catalogs missing a schema are not."""
+    if level == 'catalog' and value:
+        return not any(entry.get('incomplete') for entry in value)
+    return True
+
+
+def _ttl(level: str, value: Any) -> float:
+    # An empty result may be an error the client swallowed; keep it briefly
+    return _TTLS[level] if value else CATALOG_CACHE_EMPTY_TTL_S
+
+
+def freeze(value: Any) -> Any:
+    """Return value with lists turned into tuples and dicts into read-only mappings."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class CatalogCache:
+    """A bounded LRU of warehouse metadata with per-level TTLs."""
+
+    def __init__(self, max_entries: int = CATALOG_CACHE_MAX_ENTRIES, stale_for: float = CATALOG_CACHE_STALE_S):
+        self.max_entries = max_entries
+        self.stale_for = stale_for
+        # key -> (frozen value, fetched at, ttl)
+        self._entries: 'OrderedDict[CacheKey, Tuple[Any, float, float]]' = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stats = {
+            'hits': 0, 'stale_hits': 0, 'misses': 0,
+            'refreshes': 0, 'refresh_errors': 0, 'evictions': 0,
+        }
+
+    def lookup(self, key: CacheKey, refetch: Callable[[], Any]) -> Tuple[bool, Any]:
+        """
+        Return (True, value) if key is cached and (False, None) on a miss. The
+        value is frozen and shared with other callers. A stale value is
+        returned as is and refreshed in the background with refetch, which
+        must not depend on the caller's client staying usable.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, fetched_at, ttl = entry
+                age = now - fetched_at
+                if age <= ttl + self.stale_for:
+                    self._entries.move_to_end(key)
+                    if age <= ttl:
+                        self._stats['hits'] += 1
+                    else:
+                        self._stats['stale_hits'] += 1
+                        self._start_refresh(key, refetch)
+                    return True, value
+                del self._entries[key]
+            self._stats['misses'] += 1
+            return False, None
+
+    def get(self, key: CacheKey, fetch: Callable[[], Any], refetch: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling fetch on a miss."""
+        found, value = self.lookup(key, refetch)
+        if not found:
+            value = self.store(key, fetch())
+        return value
+
+    def store(self, key: CacheKey, value: Any) -> Any:
+        """Cache a freshly fetched value if it is cacheable; returns it frozen."""
+        value = freeze(value)
+        if not _cacheable(key[1], value):
+            return value
+        with self._lock:
+            self._entries[key] = (value, time.monotonic(), _ttl(key[1], value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+        return value
+
+    def _start_refresh(self, key: CacheKey, refetch: Callable[[], Any]) -> None:
+        """Refresh key in the background unless that is already happening. Holds the lock."""
+        if key in self._refreshing:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, CATALOG_CACHE_REFRESH_WORKERS), thread_name_prefix='catalog-refresh'
+            )
+        self._refreshing.add(key)
+        self._executor.submit(self._refresh, key, refetch)
+
+    def _refresh(self, key: CacheKey, refetch: Callable[[], Any]) -> None:
+        try:
+            value = freeze(refetch())
+            with self._lock:
+                entry = self._entries.get(key)
+                # Skip the store if the entry was invalidated meanwhile
+                if entry is not None:
+                    if _cacheable(key[1], value) and (value or not entry[0]):
+                        self._entries[key] = (value, time.monotonic(), _ttl(key[1], value))
+                        self._stats['refreshes'] += 1
+                    else:
+                        # Likely a failure: keep serving the stale copy until
+                        # its stale window runs out
+                        self._stats['refresh_errors'] += 1
+        except Exception as e:
+            print(f"Error refreshing warehouse metadata {key[1:]}: {str(e)}")
+            with self._lock:
+                self._stats['refresh_errors'] += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, target_key: Optional[str] = None, schema: Optional[str] = None,
+                   table: Optional[str] = None) -> int:
+        """
+        Drop cached entries and return how many were dropped: all of them,
+        those of one target, or those of one schema (or table) of a target,
+        together with the target's whole-catalog entry that contains it.
+        """
+        with self._lock:
+            doomed = []
+            for key in self._entries:
+                key_target, level, key_schema, key_table = key
+                if target_key is not None and key_target != target_key:
+                    continue
+                if schema is not None and level != 'catalog':
+                    if key_schema != schema:
+                        continue
+                    if table is not None and key_table not in (None, table):
+                        continue
+                doomed.append(key)
+            for key in doomed:
+                del self._entries[key]
+            return len(doomed)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats['hits'] + self._stats['stale_hits'] + self._stats['misses']
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'refreshing': len(self._refreshing),
+                'hit_rate': (self._stats['hits'] + self._stats['stale_hits']) / lookups if lookups else 0.0,
+                **self._stats,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_cache = CatalogCache()
+
+
+class CachedWarehouseClient(WarehouseClient):
+    """
+    A WarehouseClient answering metadata calls from the process-wide cache.
+    The wrapped client is only used on a miss; new_client creates another
+    client for the same target to refresh stale entries with. Results are
+    frozen and shared, so callers must not modify them.
+    """
+
+    def __init__(self, client: WarehouseClient, target_key: str, new_client: Callable[[], WarehouseClient]):
+        self.client = client
+        self.target_key = target_key
+        self.new_client = new_client
+        # Whether the wrapped client may hold a connection
+        self._used = False
+
+    def connect(self) -> bool:
+        self._used = True
+        return self.client.connect()
+
+    def disconnect(self) -> None:
+        self.client.disconnect()
+
+    def _key(self, level: str, schema: Optional[str] = None, table: Optional[str] = None) -> CacheKey:
+        return (self.target_key, level, schema, table)
+
+    def _refetch(self, method: str, *args) -> Callable[[], Any]:
+        def refetch():
+            client = self.new_client()
+            try:
+                return getattr(client, method)(*args)
+            finally:
+                client.disconnect()
+        return refetch
+
+    def get_schemas(self) -> List[str]:
+        return _cache.get(self._key('schemas'), self.client.get_schemas, self._refetch('get_schemas'))
+
+    def get_tables(self, schema: str) -> List[Dict[str, Any]]:
+        return _cache.get(
+            self._key('tables', schema),
+            lambda: self.client.get_tables(schema),
+            self._refetch('get_tables', schema),
+        )
+
+    def get_catalog(self) -> List[Dict[str, Any]]:
+        return _cache.get(self._key('catalog'), self.client.get_catalog, self._refetch('get_catalog'))
+
+    def get_table_info(self, schema: str, table: str) -> Optional[Dict[str, Any]]:
+        return _cache.get(
+            self._key('columns', schema, table),
+            lambda: self.client.get_table_info(schema, table),
+            self._refetch('get_table_info', schema, table),
+        )
+
+    # Hits are answered on the event loop; only misses go to the executor
+
+    async def _aget(self, key: CacheKey, method: str, *args) -> Any:
+        found, value = _cache.lookup(key, self._refetch(method, *args))
+        if not found:
+            self._used = True
+            value = _cache.store(key, await run_warehouse_call(getattr(self.client, method), *args))
+        return value
+
+    async def adisconnect(self) -> None:
+        if self._used:
+            await run_warehouse_call(self.client.disconnect)
+
+    async def aget_schemas(self) -> List[str]:
+        return await self._aget(self._key('schemas'), 'get_schemas')
+
+    async def aget_tables(self, schema: str) -> List[Dict[str, Any]]:
+        return await self._aget(self._key('tables', schema), 'get_tables', schema)
+
+    async def aget_catalog(self) -> List[Dict[str, Any]]:
+        return await self._aget(self._key('catalog'), 'get_catalog')
+
+    async def aget_table_info(self, schema: str, table: str) -> Optional[Dict[str, Any]]:
+        return await self._aget(self._key('columns', schema, table), 'get_table_info', schema, table)
+
+
+def invalidate_catalog_cache(target_key: Optional[str] = None, schema: Optional[str] = None,
+                             table: Optional[str] = None) -> int:
+    """Drop cached warehouse metadata; see CatalogCache.invalidate."""
+    return _cache.invalidate(target_key, schema, table)
+
+
+def get_catalog_cache_stats() -> Dict[str, Any]:
+    """Report the size of the cache and its hit and miss counts."""
+    return {'enabled': CATALOG_CACHE_ENABLED, **_cache.stats()}
+
+
+def shutdown_catalog_cache() -> None:
+    """Stop background refreshes. Called on application shutdown."""
+    _cache.shutdown()
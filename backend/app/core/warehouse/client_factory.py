@@ -1,18 +1,47 @@
-import yaml
-import os
-from typing import Dict, Any, Optional
+import functools
+import importlib
+import importlib.util
+import sys
+from typing import Dict, Any, Optional, Tuple, Type
 from .base_client import WarehouseClient
-from .postgres_client import PostgresClient
-from .bigquery_client import BigQueryClient
+from .config_cache import load_dbt_project, load_profiles, resolve_target
+from .catalog_cache import CachedWarehouseClient
+from .executor import run_warehouse_call
+from .postgres_pool import config_key
+from ...config.constants import CATALOG_CACHE_ENABLED
+
+# Warehouse type -> (module, client class, optional module-level shutdown
+# function). Module paths may be relative to this package. Modules are
+# imported on first use, so a deployment only pays
+# for the drivers (psycopg2, google-cloud-bigquery) of the warehouses it uses.
+_DRIVERS: Dict[str, Tuple[str, str, Optional[str]]] = {
+    'postgres': ('.postgres_client', 'PostgresClient', None),
+    'bigquery': ('.bigquery_client', 'BigQueryClient', 'close_shared_clients'),
+}
+
+def register_driver(warehouse_type: str, module: str, class_name: str, shutdown: Optional[str] = None) -> None:
+    """Register the client class for a warehouse type, by module path so it is imported lazily."""
+    _DRIVERS[warehouse_type.lower()] = (module, class_name, shutdown)
+
+def get_driver(warehouse_type: str) -> Type[WarehouseClient]:
+    """
+    Import and return the client class for a warehouse type. Raises KeyError
+    for unknown types and ImportError if the driver is not installed.
+    """
+    module, class_name, _shutdown = _DRIVERS[warehouse_type.lower()]
+    return getattr(importlib.import_module(module, __package__), class_name)
+
+def shutdown_drivers() -> None:
+    """Run the shutdown hooks of the drivers that were imported."""
+    for module, _class_name, shutdown in _DRIVERS.values():
+        loaded = sys.modules.get(importlib.util.resolve_name(module, __package__))
+        if shutdown and loaded:
+            getattr(loaded, shutdown)()
 
 def parse_profiles_yml(profiles_yml_path: str) -> Dict[str, Any]:
-    """Parse the profiles.yml file and return its contents."""
+    """Parse the profiles.yml file and return its contents, with env_var() resolved."""
     try:
-        if not os.path.exists(profiles_yml_path):
-            raise FileNotFoundError(f"Profiles file not found: {profiles_yml_path}")
-        
-        with open(profiles_yml_path, 'r') as f:
-            return yaml.safe_load(f)
+        return load_profiles(profiles_yml_path)
     except Exception as e:
         print(f"Error parsing profiles.yml: {str(e)}")
         return {}
@@ -20,30 +49,32 @@ def parse_profiles_yml(profiles_yml_path: str) -> Dict[str, Any]:
 def get_target_config(profiles_yml_path: str, profile_name: str, target_name: str) -> Optional[Dict[str, Any]]:
     """Get the configuration for a specific target."""
     try:
-        profiles = parse_profiles_yml(profiles_yml_path)
-        
-        if profile_name not in profiles:
-            raise KeyError(f"Profile '{profile_name}' not found in profiles.yml")
-        
-        profile = profiles[profile_name]
-        
-        if 'outputs' not in profile:
-            raise KeyError(f"No outputs found in profile '{profile_name}'")
-        
-        outputs = profile['outputs']
-        
-        if target_name not in outputs:
-            # Try using the default target
-            if 'target' in profile and profile['target'] in outputs:
-                target_name = profile['target']
-            else:
-                raise KeyError(f"Target '{target_name}' not found in profile '{profile_name}'")
-        
-        return outputs[target_name]
+        return resolve_target(profiles_yml_path, profile_name, target_name)
     except Exception as e:
         print(f"Error getting target config: {str(e)}")
         return None
 
+def create_client(target_config: Dict[str, Any]) -> Optional[WarehouseClient]:
+    """Create an uncached client for a target config."""
+    warehouse_type = target_config.get('type', '').lower()
+    
+    if warehouse_type not in _DRIVERS:
+        print(f"Unsupported warehouse type: {warehouse_type}")
+        return None
+    
+    try:
+        client_class = get_driver(warehouse_type)
+    except ImportError as e:
+        print(f"Driver for warehouse type '{warehouse_type}' is not installed: {str(e)}")
+        return None
+    
+    return client_class(target_config)
+
+def get_target_key(profiles_yml_path: str, profile_name: str, target_name: str) -> Optional[str]:
+    """Key identifying a target's entries in the warehouse metadata cache."""
+    target_config = get_target_config(profiles_yml_path, profile_name, target_name)
+    return config_key(target_config) if target_config else None
+
 def get_client_for_target(profiles_yml_path: str, profile_name: str, target_name: str) -> Optional[WarehouseClient]:
     """Create a client for the specified target."""
     target_config = get_target_config(profiles_yml_path, profile_name, target_name)
@@ -51,28 +82,27 @@ def get_client_for_target(profiles_yml_path: str, profile_name: str, target_name
     if not target_config:
         return None
     
-    warehouse_type = target_config.get('type', '').lower()
+    client = create_client(target_config)
     
-    if warehouse_type == 'postgres':
-        return PostgresClient(target_config)
-    elif warehouse_type == 'bigquery':
-        return BigQueryClient(target_config)
-    else:
-        print(f"Unsupported warehouse type: {warehouse_type}")
-        return None
+    if client is None or not CATALOG_CACHE_ENABLED:
+        return client
+    
+    # Serve metadata from the process-wide cache; refreshes use their own client
+    return CachedWarehouseClient(
+        client, config_key(target_config), functools.partial(create_client, dict(target_config))
+    )
+
+async def aget_client_for_target(profiles_yml_path: str, profile_name: str, target_name: str) -> Optional[WarehouseClient]:
+    """
+    Awaitable get_client_for_target. The first client of a warehouse type
+    imports its driver, which must not block the event loop.
+    """
+    return await run_warehouse_call(get_client_for_target, profiles_yml_path, profile_name, target_name)
 
 def get_profile_name_from_dbt_project(dbt_project_path: str) -> Optional[str]:
     """Extract profile name from dbt_project.yml file."""
     try:
-        project_file = os.path.join(dbt_project_path, 'dbt_project.yml')
-        
-        if not os.path.exists(project_file):
-            raise FileNotFoundError(f"DBT project file not found: {project_file}")
-        
-        with open(project_file, 'r') as f:
-            project_config = yaml.safe_load(f)
-            
-        return project_config.get('profile')
+        return load_dbt_project(dbt_project_path).get('profile')
     except Exception as e:
         print(f"Error extracting profile name: {str(e)}")
-        return None 
\ No newline at end of file
+        return None
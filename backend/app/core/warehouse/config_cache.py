@@ -0,0 +1,162 @@
+"""
+Stat-validated cache of parsed dbt_project.yml and profiles.yml files.
+
+Every warehouse request needs the project's profile name and the target's
+connection config. Parsed files are kept in memory together with the
+(mtime, size, inode) they were read at, so a request costs one os.stat per
+file and re-parses only after the file changed. env_var() calls in
+profiles.yml are resolved when the file is parsed, not on every request,
+and resolved targets are memoized per file version.
+"""
+import os
+import re
+import threading
+from typing import Any, Dict, Optional, Tuple
+from ..yaml_io import load_yaml
+
+# {{ env_var('NAME') }} or {{ env_var('NAME', 'default') }}, optionally piped
+# through one of the casts dbt profiles use for numbers and flags
+_ENV_VAR = re.compile(
+    r"""\{\{\s*env_var\(\s*(['"])(?P<name>[^'"]+)\1\s*"""
+    r"""(?:,\s*(['"])(?P<default>.*?)\3\s*)?\)\s*"""
+    r"""(?:\|\s*(?P<cast>int|as_number|as_bool)\s*)?\}\}"""
+)
+
+Signature = Tuple[int, int, int]
+
+
+class _CachedFile:
+    def __init__(self, signature: Signature, data: Any):
+        self.signature = signature
+        self.data = data
+        # Resolved targets of this version of a profiles.yml
+        self.targets: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+
+_files: Dict[Tuple[str, str], _CachedFile] = {}
+_lock = threading.Lock()
+
+
+def _signature(path: str) -> Signature:
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _cast(value: str, cast: Optional[str]) -> Any:
+    if cast == 'as_bool':
+        return value.strip().lower() in ('true', '1', 'yes')
+    if cast in ('int', 'as_number'):
+        try:
+            return int(value)
+        except ValueError:
+            return float(value) if cast == 'as_number' else value
+    return value
+
+
+def _render_env_vars(value: str) -> Any:
+    """
+    Substitute env_var() calls in one string value, as dbt does for profiles.
+    A call for an unset variable without a default is left as is.
+    """
+    missing = []
+
+    def lookup(match) -> str:
+        name, default = match.group('name'), match.group('default')
+        if name in os.environ:
+            return os.environ[name]
+        if default is not None:
+            return default
+        missing.append(name)
+        return match.group(0)
+
+    whole = _ENV_VAR.fullmatch(value.strip())
+    if whole:
+        # A value that is just the call keeps the cast's type
+        rendered = lookup(whole)
+        result = value if missing else _cast(rendered, whole.group('cast'))
+    else:
+        result = _ENV_VAR.sub(lookup, value)
+    for name in missing:
+        print(f"Warning: env var '{name}' used in profiles.yml is not set")
+    return result
+
+
+def resolve_env_vars(data: Any) -> Any:
+    """Return data with env_var() calls in its string values resolved."""
+    if isinstance(data, dict):
+        return {key: resolve_env_vars(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [resolve_env_vars(value) for value in data]
+    if isinstance(data, str) and 'env_var' in data:
+        return _render_env_vars(data)
+    return data
+
+
+def _load(kind: str, path: str) -> _CachedFile:
+    """Return the cached parse of path, re-reading it if it changed on disk."""
+    key = (kind, os.path.abspath(path))
+    signature = _signature(path)
+    with _lock:
+        cached = _files.get(key)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    with open(path, 'r') as f:
+        data = load_yaml(f) or {}
+    if kind == 'profiles':
+        data = resolve_env_vars(data)
+    cached = _CachedFile(signature, data)
+    with _lock:
+        _files[key] = cached
+    return cached
+
+
+def load_dbt_project(dbt_project_path: str) -> Dict[str, Any]:
+    """Parsed dbt_project.yml of a project. Treat the result as read-only."""
+    project_file = os.path.join(dbt_project_path, 'dbt_project.yml')
+    if not os.path.exists(project_file):
+        raise FileNotFoundError(f"DBT project file not found: {project_file}")
+    return _load('project', project_file).data
+
+
+def load_profiles(profiles_yml_path: str) -> Dict[str, Any]:
+    """Parsed profiles.yml with env_var() resolved. Treat the result as read-only."""
+    if not os.path.exists(profiles_yml_path):
+        raise FileNotFoundError(f"Profiles file not found: {profiles_yml_path}")
+    return _load('profiles', profiles_yml_path).data
+
+
+def resolve_target(profiles_yml_path: str, profile_name: str, target_name: str) -> Dict[str, Any]:
+    """
+    Return a copy of the output config for a target, falling back to the
+    profile's default target if the requested one does not exist. Raises
+    KeyError if neither does.
+    """
+    if not os.path.exists(profiles_yml_path):
+        raise FileNotFoundError(f"Profiles file not found: {profiles_yml_path}")
+    cached = _load('profiles', profiles_yml_path)
+    config = cached.targets.get((profile_name, target_name))
+    if config is None:
+        profiles = cached.data
+
+        if profile_name not in profiles:
+            raise KeyError(f"Profile '{profile_name}' not found in profiles.yml")
+
+        profile = profiles[profile_name]
+
+        if 'outputs' not in profile:
+            raise KeyError(f"No outputs found in profile '{profile_name}'")
+
+        outputs = profile['outputs']
+        resolved_name = target_name
+
+        if resolved_name not in outputs:
+            # Try using the default target
+            if 'target' in profile and profile['target'] in outputs:
+                resolved_name = profile['target']
+            else:
+                raise KeyError(f"Target '{target_name}' not found in profile '{profile_name}'")
+
+        config = cached.targets[(profile_name, target_name)] = outputs[resolved_name]
+    return dict(config)
+
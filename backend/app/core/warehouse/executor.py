@@ -0,0 +1,44 @@
+"""
+Bounded executor for blocking warehouse calls.
+
+psycopg2 and google-cloud-bigquery block the calling thread. Route handlers
+await run_warehouse_call instead of calling them directly, so a slow query
+occupies one of WAREHOUSE_WORKERS threads rather than the event loop, and
+concurrent requests (and /health) keep being served meanwhile.
+"""
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from ...config.constants import WAREHOUSE_WORKERS
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_warehouse_executor() -> ThreadPoolExecutor:
+    """Return the process-wide warehouse executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, WAREHOUSE_WORKERS), thread_name_prefix='warehouse'
+            )
+        return _executor
+
+
+async def run_warehouse_call(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking warehouse call on the warehouse executor and await its result."""
+    return await asyncio.get_running_loop().run_in_executor(
+        get_warehouse_executor(), functools.partial(fn, *args, **kwargs)
+    )
+
+
+def shutdown_warehouse_executor() -> None:
+    """Stop the warehouse executor. Called on application shutdown."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -1,7 +1,19 @@
+import functools
 import psycopg2
 from psycopg2 import sql
 from typing import List, Dict, Any, Optional
 from .base_client import WarehouseClient
+from .catalog import gather_catalog
+from .postgres_pool import get_pool
+
+def _open_connection(config: Dict[str, Any]):
+    return psycopg2.connect(
+        host=config.get('host', 'localhost'),
+        port=config.get('port', 5432),
+        user=config.get('user', ''),
+        password=config.get('password', ''),
+        dbname=config.get('dbname', '')
+    )
 
 class PostgresClient(WarehouseClient):
     """PostgreSQL warehouse client implementation."""
@@ -11,17 +23,13 @@ class PostgresClient(WarehouseClient):
         self.config = config
         self.connection = None
         self.cursor = None
+        # Connections are borrowed from the process-wide pool for this target
+        self.pool = get_pool(config, functools.partial(_open_connection, dict(config)))
     
     def connect(self) -> bool:
-        """Establish connection to PostgreSQL."""
+        """Borrow a PostgreSQL connection from the pool."""
         try:
-            self.connection = psycopg2.connect(
-                host=self.config.get('host', 'localhost'),
-                port=self.config.get('port', 5432),
-                user=self.config.get('user', ''),
-                password=self.config.get('password', ''),
-                dbname=self.config.get('dbname', '')
-            )
+            self.connection = self.pool.getconn()
             self.cursor = self.connection.cursor()
             return True
         except Exception as e:
@@ -29,11 +37,20 @@ class PostgresClient(WarehouseClient):
             return False
     
     def disconnect(self) -> None:
-        """Close the PostgreSQL connection."""
+        """Return the PostgreSQL connection to the pool."""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.connection:
-            self.connection.close()
+            self.pool.putconn(self.connection)
+            self.connection = None
+    
+    def __del__(self):
+        # Handlers that fail before disconnect() must not leak pool slots
+        try:
+            self.disconnect()
+        except Exception:
+            pass
     
     def get_schemas(self) -> List[str]:
         """Get list of all schemas in PostgreSQL."""
@@ -63,29 +80,90 @@ class PostgresClient(WarehouseClient):
                 return []
         
         try:
-            query = """
-            SELECT table_name, 
-                   obj_description(pgc.oid, 'pg_class') as table_description
-            FROM information_schema.tables t
-            JOIN pg_catalog.pg_class pgc ON t.table_name = pgc.relname
-            JOIN pg_catalog.pg_namespace pgn ON pgc.relnamespace = pgn.oid AND t.table_schema = pgn.nspname
-            WHERE table_schema = %s
-            AND table_type = 'BASE TABLE'
-            ORDER BY table_name;
-            """
-            self.cursor.execute(query, (schema,))
-            results = self.cursor.fetchall()
-            return [
-                {
-                    'name': row[0],
-                    'description': row[1] if row[1] else ''
-                } 
-                for row in results
-            ]
+            return self._fetch_tables(self.cursor, schema)
         except Exception as e:
             print(f"Error fetching tables from schema {schema}: {str(e)}")
             return []
     
+    def _fetch_tables(self, cursor, schema: str) -> List[Dict[str, Any]]:
+        query = """
+        SELECT table_name, 
+               obj_description(pgc.oid, 'pg_class') as table_description
+        FROM information_schema.tables t
+        JOIN pg_catalog.pg_class pgc ON t.table_name = pgc.relname
+        JOIN pg_catalog.pg_namespace pgn ON pgc.relnamespace = pgn.oid AND t.table_schema = pgn.nspname
+        WHERE table_schema = %s
+        AND table_type = 'BASE TABLE'
+        ORDER BY table_name;
+        """
+        cursor.execute(query, (schema,))
+        results = cursor.fetchall()
+        return [
+            {
+                'name': row[0],
+                'description': row[1] if row[1] else ''
+            } 
+            for row in results
+        ]
+    
+    def _fetch_tables_on_own_connection(self, schema: str) -> List[Dict[str, Any]]:
+        """List one schema's tables on a separately borrowed connection, so several can run at once."""
+        connection = self.pool.getconn()
+        try:
+            with connection.cursor() as cursor:
+                return self._fetch_tables(cursor, schema)
+        finally:
+            self.pool.putconn(connection)
+    
+    def get_catalog(self) -> List[Dict[str, Any]]:
+        """
+        Get every schema with its tables and descriptions in a single query
+        against pg_catalog, instead of one information_schema query per schema.
+        Applies the same visibility rules as information_schema.
+        """
+        if not self.cursor:
+            if not self.connect():
+                return []
+        
+        try:
+            query = """
+            SELECT pgn.nspname, pgc.relname, pgd.description
+            FROM pg_catalog.pg_namespace pgn
+            LEFT JOIN pg_catalog.pg_class pgc
+                ON pgc.relnamespace = pgn.oid
+                AND pgc.relkind IN ('r', 'p')
+                AND (pg_has_role(pgc.relowner, 'USAGE')
+                     OR has_table_privilege(pgc.oid, 'SELECT, INSERT, UPDATE, DELETE, TRUNCATE, REFERENCES, TRIGGER'))
+            LEFT JOIN pg_catalog.pg_description pgd
+                ON pgd.objoid = pgc.oid
+                AND pgd.classoid = 'pg_catalog.pg_class'::regclass
+                AND pgd.objsubid = 0
+            WHERE pgn.nspname NOT LIKE 'pg_%'
+            AND pgn.nspname != 'information_schema'
+            AND (pg_has_role(pgn.nspowner, 'USAGE')
+                 OR has_schema_privilege(pgn.oid, 'CREATE, USAGE'))
+            ORDER BY pgn.nspname, pgc.relname;
+            """
+            self.cursor.execute(query)
+            catalog = []
+            for schema_name, table_name, description in self.cursor.fetchall():
+                if not catalog or catalog[-1]['schema'] != schema_name:
+                    catalog.append({'schema': schema_name, 'tables': []})
+                # Schemas without tables come back as a single row of NULLs
+                if table_name is not None:
+                    catalog[-1]['tables'].append({
+                        'name': table_name,
+                        'description': description if description else ''
+                    })
+            return catalog
+        except Exception as e:
+            print(f"Error fetching catalog, listing schemas one by one: {str(e)}")
+            self.connection.rollback()
+        
+        # A psycopg2 connection runs one query at a time, so each concurrent
+        # schema listing gets its own connection
+        return gather_catalog(self.get_schemas(), self._fetch_tables_on_own_connection)
+    
     def get_table_info(self, schema: str, table: str) -> Optional[Dict[str, Any]]:
         """Get detailed information about a specific table."""
         if not self.cursor:
@@ -0,0 +1,188 @@
+"""
+Process-wide Postgres connection pools.
+
+Each distinct target config (as returned by get_target_config) gets one
+pool, so requests borrow an open connection instead of paying for TCP,
+TLS and authentication every time. Pools keep at least PG_POOL_MIN_SIZE
+idle connections, never open more than PG_POOL_MAX_SIZE, close surplus
+connections that stay idle past PG_POOL_IDLE_TIMEOUT_S, and check a
+connection that has been idle for a while before handing it out.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Tuple
+from ...config.constants import (
+    PG_POOL_MIN_SIZE,
+    PG_POOL_MAX_SIZE,
+    PG_POOL_IDLE_TIMEOUT_S,
+    PG_POOL_HEALTHCHECK_AFTER_S,
+    PG_POOL_WAIT_TIMEOUT_S,
+)
+
+
+def config_key(config: Dict[str, Any]) -> str:
+    """Stable hash of a target config, used to share one pool per target."""
+    encoded = json.dumps(config, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class PostgresPool:
+    """A bounded pool of connections to one Postgres target."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        min_size: int = PG_POOL_MIN_SIZE,
+        max_size: int = PG_POOL_MAX_SIZE,
+        idle_timeout: float = PG_POOL_IDLE_TIMEOUT_S,
+        healthcheck_after: float = PG_POOL_HEALTHCHECK_AFTER_S,
+    ):
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max(1, max_size)
+        self.idle_timeout = idle_timeout
+        self.healthcheck_after = healthcheck_after
+        # (connection, time it was returned); most recently used at the right
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._in_use = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        return len(self._idle) + self._in_use
+
+    def _healthy(self, connection, idle_since: float) -> bool:
+        if connection.closed:
+            return False
+        if time.monotonic() - idle_since < self.healthcheck_after:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            connection.rollback()
+            return True
+        except Exception:
+            return False
+
+    def getconn(self, timeout: float = PG_POOL_WAIT_TIMEOUT_S):
+        """Borrow a connection, opening one if the pool is below its maximum."""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Postgres pool is closed")
+                    if self._idle:
+                        connection, idle_since = self._idle.pop()
+                        break
+                    if self.size < self.max_size:
+                        connection = None
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._condition.wait(remaining):
+                        raise TimeoutError(f"No Postgres connection available after {timeout}s")
+                # Reserve the slot; connecting and health checks run unlocked
+                self._in_use += 1
+
+            try:
+                if connection is None:
+                    return self._connect()
+                if self._healthy(connection, idle_since):
+                    return connection
+            except BaseException:
+                self._release_slot()
+                raise
+
+            # A dead idle connection: drop it and try again
+            _close_quietly(connection)
+            self._release_slot()
+
+    def _release_slot(self) -> None:
+        with self._condition:
+            self._in_use -= 1
+            self._condition.notify()
+
+    def putconn(self, connection) -> None:
+        """Return a borrowed connection, ending any transaction it left open."""
+        healthy = not connection.closed
+        if healthy:
+            try:
+                connection.rollback()
+            except Exception:
+                healthy = False
+        with self._condition:
+            self._in_use -= 1
+            keep = healthy and not self._closed
+            if keep:
+                self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+        if not keep:
+            _close_quietly(connection)
+
+    def evict_idle(self) -> None:
+        """Close connections idle past the timeout, keeping min_size open."""
+        now = time.monotonic()
+        evicted = []
+        with self._condition:
+            while self._idle and self.size > self.min_size and now - self._idle[0][1] > self.idle_timeout:
+                evicted.append(self._idle.popleft()[0])
+        for connection in evicted:
+            _close_quietly(connection)
+
+    def close(self) -> None:
+        """Close every idle connection; borrowed ones are closed when returned."""
+        with self._condition:
+            idle = [connection for connection, _idle_since in self._idle]
+            self._idle.clear()
+            self._closed = True
+            self._condition.notify_all()
+        for connection in idle:
+            _close_quietly(connection)
+
+
+def _close_quietly(connection) -> None:
+    try:
+        connection.close()
+    except Exception:
+        pass
+
+
+_pools: Dict[str, PostgresPool] = {}
+_pools_lock = threading.Lock()
+_reaper = None
+
+
+def _reap_idle_connections() -> None:
+    while True:
+        time.sleep(max(1.0, PG_POOL_IDLE_TIMEOUT_S / 2))
+        with _pools_lock:
+            pools = list(_pools.values())
+        for pool in pools:
+            pool.evict_idle()
+
+
+def get_pool(config: Dict[str, Any], connect: Callable[[], Any]) -> PostgresPool:
+    """Return the pool for a target config, creating it with connect on first use."""
+    global _reaper
+    key = config_key(config)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = PostgresPool(connect)
+        if _reaper is None:
+            _reaper = threading.Thread(target=_reap_idle_connections, name='pg-pool-reaper', daemon=True)
+            _reaper.start()
+        return pool
+
+
+def close_all_pools() -> None:
+    """Close every pool, e.g. at shutdown."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
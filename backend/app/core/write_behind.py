@@ -0,0 +1,196 @@
+"""
+Optional write-behind mode for test edits.
+
+With WRITE_BEHIND_ENABLED, an edit is applied right away to an in-memory
+copy of its YAML file and to the project index, so the response and every
+following read reflect it, but the file itself is only written once it has
+been quiet for WRITE_BEHIND_DELAY_MS (and at most WRITE_BEHIND_MAX_DELAY_MS
+after its first unwritten edit), or when flush_writes is called. Ten tests
+added to one model in a few seconds then cost one write instead of ten.
+
+Unflushed edits live only in this process and are lost if it dies;
+get_write_status reports what is pending. Without write-behind, edits are
+written before submit_mutation returns.
+"""
+import asyncio
+import copy
+import os
+import time
+from typing import Any, Dict, List, Optional
+from .project_index import get_project_index, extract_file_record
+from .yaml_io import load_yaml
+from .yaml_writes import Mutation, mutate_yaml_file, run_mutations, update_yaml_file_many
+from ..config.constants import WRITE_BEHIND_ENABLED, WRITE_BEHIND_DELAY_MS, WRITE_BEHIND_MAX_DELAY_MS
+
+
+class _PendingFile:
+    """Unwritten edits of one YAML file and the in-memory result of applying them."""
+
+    def __init__(self, path: str, dbt_project_path: str, data: Dict[str, Any], dump_kwargs: Dict[str, Any]):
+        self.path = path
+        self.dbt_project_path = dbt_project_path
+        self.data = data
+        # The file as it was before the first edit, to rebuild data from when an edit fails
+        self.base = copy.deepcopy(data)
+        self.dump_kwargs = dump_kwargs
+        self.mutations: List[Mutation] = []
+        self.queued_at = time.time()
+        self.deadline = time.monotonic() + WRITE_BEHIND_MAX_DELAY_MS / 1000
+        self.due_at = self.deadline
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.flushed = asyncio.Event()
+
+    def restore(self) -> Dict[str, Any]:
+        """The in-memory copy rebuilt from the base and the edits applied so far."""
+        data = copy.deepcopy(self.base)
+        for mutation in self.mutations:
+            mutation(data)
+        return data
+
+
+_pending: Dict[str, _PendingFile] = {}
+_flushing: Dict[str, _PendingFile] = {}
+_tasks = set()
+_stats = {'flushes': 0, 'edits_flushed': 0, 'last_flush_at': None, 'last_error': None}
+
+
+def _load(path: str) -> Dict[str, Any]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r') as f:
+        return load_yaml(f) or {}
+
+
+def _schedule(entry: _PendingFile) -> None:
+    """(Re)start the debounce timer of a pending file."""
+    if entry.timer:
+        entry.timer.cancel()
+    now = time.monotonic()
+    delay = max(0.0, min(WRITE_BEHIND_DELAY_MS / 1000, entry.deadline - now))
+    entry.due_at = now + delay
+    entry.timer = asyncio.get_running_loop().call_later(delay, _start_flush, entry.path)
+
+
+def _queue(entry: _PendingFile) -> None:
+    """Show the in-memory state of a file through the index and debounce its flush."""
+    _schedule(entry)
+    get_project_index(entry.dbt_project_path, refresh=False).set_pending_record(
+        entry.path, extract_file_record(entry.data)
+    )
+
+
+def _start_flush(path: str) -> None:
+    task = asyncio.ensure_future(flush_path(path))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+async def submit_mutation(dbt_project_path: str, path: str, mutation: Mutation, **dump_kwargs) -> bool:
+    """
+    Apply a mutation to a YAML file of the project and return its result.
+    In write-behind mode the file is written later; otherwise now.
+    """
+    if not WRITE_BEHIND_ENABLED:
+        return await mutate_yaml_file(path, mutation, **dump_kwargs)
+
+    key = os.path.abspath(path)
+    entry = _pending.get(key)
+    if entry is None:
+        # Build on an in-flight flush of the same file rather than on the disk
+        flushing = _flushing.get(key)
+        data = copy.deepcopy(flushing.data) if flushing else await asyncio.to_thread(_load, key)
+        entry = _pending.get(key)
+        if entry is None:
+            entry = _pending[key] = _PendingFile(key, dbt_project_path, data, dump_kwargs)
+
+    # A failed edit leaves the in-memory copy as it was and is not replayed
+    entry.data, [(ok, changed)] = run_mutations(entry.data, [mutation], entry.restore)
+    if not ok or not changed:
+        if not entry.mutations and _pending.get(key) is entry:
+            del _pending[key]
+        if not ok:
+            raise changed
+        return False
+
+    entry.mutations.append(mutation)
+    _queue(entry)
+    return True
+
+
+async def flush_path(path: str) -> None:
+    """Write the pending edits of one file now."""
+    key = os.path.abspath(path)
+    entry = _pending.pop(key, None)
+    if entry is None:
+        return
+    if entry.timer:
+        entry.timer.cancel()
+
+    _flushing[key] = entry
+    index = get_project_index(entry.dbt_project_path, refresh=False)
+    try:
+        outcomes = await asyncio.to_thread(
+            update_yaml_file_many, key, entry.mutations, **entry.dump_kwargs
+        )
+        for ok, result in outcomes:
+            if not ok:
+                print(f"Error replaying edit of {key}: {str(result)}")
+        # Re-read the written file so the index no longer needs the overlay
+        await asyncio.to_thread(index.apply_changes, [key])
+        _stats['flushes'] += 1
+        _stats['edits_flushed'] += len(entry.mutations)
+        _stats['last_flush_at'] = time.time()
+    except Exception as e:
+        print(f"Error flushing {key}: {str(e)}")
+        _stats['last_error'] = f"{key}: {str(e)}"
+        # Keep the edits and try again later
+        newer = _pending.get(key)
+        if newer:
+            newer.mutations[:0] = entry.mutations
+        else:
+            _pending[key] = entry
+            _schedule(entry)
+        return
+    finally:
+        if _flushing.get(key) is entry:
+            del _flushing[key]
+        entry.flushed.set()
+
+    if key not in _pending:
+        index.set_pending_record(key, None)
+
+
+async def flush_writes(dbt_project_path: Optional[str] = None) -> None:
+    """
+    Write all pending edits, or those of one project, and wait for flushes
+    already in progress.
+    """
+    root = os.path.join(os.path.abspath(dbt_project_path), '') if dbt_project_path else ''
+    in_flight = [entry.flushed.wait() for key, entry in list(_flushing.items()) if key.startswith(root)]
+    await asyncio.gather(
+        *(flush_path(key) for key in list(_pending) if key.startswith(root)),
+        *in_flight,
+    )
+
+
+def get_write_status() -> Dict[str, Any]:
+    """Describe the write-behind queue and whether every edit is on disk."""
+    now = time.monotonic()
+    return {
+        'write_behind': WRITE_BEHIND_ENABLED,
+        'delay_ms': WRITE_BEHIND_DELAY_MS,
+        'max_delay_ms': WRITE_BEHIND_MAX_DELAY_MS,
+        'durable': not _pending and not _flushing,
+        'pending': [
+            {
+                'path': entry.path,
+                'dbt_project_path': entry.dbt_project_path,
+                'edits': len(entry.mutations),
+                'queued_at': entry.queued_at,
+                'flush_in_ms': max(0, int((entry.due_at - now) * 1000)),
+            }
+            for entry in _pending.values()
+        ],
+        'flushing': list(_flushing),
+        **_stats,
+    }
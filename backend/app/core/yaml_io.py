@@ -0,0 +1,29 @@
+"""
+Central YAML I/O for the application.
+
+Uses the libyaml-backed CSafeLoader/CSafeDumper when PyYAML was built with
+libyaml and falls back to the pure-Python SafeLoader/SafeDumper otherwise.
+All YAML reads and writes should go through load_yaml and dump_yaml.
+"""
+from typing import Any, IO, Optional, Union
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    LIBYAML_AVAILABLE = False
+
+
+def load_yaml(stream: Union[str, bytes, IO]) -> Any:
+    """Parse a YAML document from a string or file object."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def dump_yaml(data: Any, stream: Optional[IO] = None, **kwargs) -> Optional[str]:
+    """
+    Serialize data as YAML. Writes to stream if given, otherwise returns
+    the document as a string. Keyword arguments are passed to yaml.dump.
+    """
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
@@ -0,0 +1,277 @@
+"""
+Surgical patching of YAML files.
+
+Re-dumping a whole schema.yml to add one test is slow on large files,
+drops comments, reorders keys and produces huge diffs. patch_yaml instead
+diffs the edited data against the node tree of the original text, whose
+nodes carry their character offsets, and splices only the changed regions:
+new keys are rendered on their own and inserted after their last sibling,
+list items are aligned by name (or value) so new ones are inserted where
+they belong, removed keys and items are cut out line by line, and anything
+else that changed is re-rendered in place of its key or item.
+
+Documents it cannot patch safely (anchors and aliases, merge keys, a
+flow-style root collection) make it
+return None, and callers fall back to dumping the whole document.
+"""
+import difflib
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+import yaml
+from yaml.nodes import Node, MappingNode, SequenceNode
+from .yaml_io import SafeLoader, dump_yaml
+
+MERGE_TAG = 'tag:yaml.org,2002:merge'
+
+# (start, end, replacement) in character offsets of the original text
+Splice = Tuple[int, int, str]
+
+# What precedes a block sequence item on its line, e.g. "    - "
+_ITEM_PREFIX = re.compile(r'( *)- +')
+
+
+class _IndentedSequenceDumper(yaml.SafeDumper):
+    """Indents block sequences under their key ("key:\n  - item")."""
+
+    def increase_indent(self, flow=False, indentless=False):
+        return super().increase_indent(flow, False)
+
+
+class _Unpatchable(Exception):
+    """Raised when a change cannot be expressed as a splice at this level."""
+
+
+def compose_yaml(text: str) -> Tuple[Any, Optional[Node]]:
+    """
+    Parse a YAML document into (data, root node). The node tree keeps the
+    position of every key and value in text. Both are None for an empty
+    document.
+    """
+    loader = SafeLoader(text)
+    try:
+        node = loader.get_single_node()
+        data = loader.construct_document(node) if node is not None else None
+    finally:
+        loader.dispose()
+    return data, node
+
+
+def _is_tree(node: Node) -> bool:
+    """Whether the document has no aliases (shared nodes) and no merge keys."""
+    seen = set()
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            return False
+        seen.add(id(current))
+        if isinstance(current, MappingNode):
+            for key_node, value_node in current.value:
+                if key_node.tag == MERGE_TAG:
+                    return False
+                stack.append(key_node)
+                stack.append(value_node)
+        elif isinstance(current, SequenceNode):
+            stack.extend(current.value)
+    return True
+
+
+def _indents_sequences(node: Node) -> bool:
+    """Whether the first block sequence under a key is indented past the key."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, MappingNode):
+            for key_node, value_node in current.value:
+                if isinstance(value_node, SequenceNode) and not value_node.flow_style and value_node.value:
+                    return value_node.start_mark.column > key_node.start_mark.column
+            stack.extend(reversed([value_node for _key_node, value_node in current.value]))
+        elif isinstance(current, SequenceNode):
+            stack.extend(reversed(current.value))
+    return False
+
+
+def _changed(old: Any, new: Any) -> bool:
+    return type(old) is not type(new) or old != new
+
+
+def _item_key(value: Any) -> str:
+    """What identifies a list item when aligning lists: its name, else its value."""
+    if isinstance(value, dict) and isinstance(value.get('name'), str):
+        return 'name:' + value['name']
+    try:
+        return 'value:' + json.dumps(value, sort_keys=True, default=repr)
+    except TypeError:
+        return 'value:' + repr(value)
+
+
+class _Patcher:
+    """Computes the splices turning the original text into the edited data."""
+
+    def __init__(self, text: str, dump_kwargs: Dict[str, Any], indent_sequences: bool):
+        self.text = text
+        self.dump_kwargs = dump_kwargs
+        # Render new content in the sequence style the file already uses
+        self.indent_sequences = indent_sequences
+
+    def line_start(self, index: int) -> int:
+        return self.text.rfind('\n', 0, index) + 1
+
+    def line_end(self, index: int) -> int:
+        """Offset just past the line containing index (block scalars may already end there)."""
+        if index > 0 and self.text[index - 1] == '\n':
+            # Leave blank lines after a block scalar where they are
+            while index > 1 and self.text[index - 2] == '\n':
+                index -= 1
+            return index
+        newline = self.text.find('\n', index)
+        return len(self.text) if newline < 0 else newline + 1
+
+    def content_end(self, node: Node) -> int:
+        """Offset just past the last character of node's own content."""
+        while isinstance(node, (MappingNode, SequenceNode)) and not node.flow_style and node.value:
+            node = node.value[-1][1] if isinstance(node, MappingNode) else node.value[-1]
+        return node.end_mark.index
+
+    def render(self, value: Any, indent: int) -> str:
+        """Dump value as a block indented by indent columns."""
+        pad = ' ' * indent
+        if self.indent_sequences:
+            dumped = yaml.dump(value, Dumper=_IndentedSequenceDumper, **self.dump_kwargs)
+        else:
+            dumped = dump_yaml(value, **self.dump_kwargs)
+        return ''.join(
+            pad + line if line.strip() else line
+            for line in dumped.splitlines(True)
+        )
+
+    def insert(self, index: int, rendered: str) -> Splice:
+        if index == len(self.text) and self.text and not self.text.endswith('\n'):
+            rendered = '\n' + rendered
+        return index, index, rendered
+
+    def item_dash(self, item: Node) -> Tuple[int, int]:
+        """Return (offset, column) of the dash introducing a block sequence item."""
+        start = self.line_start(item.start_mark.index)
+        match = _ITEM_PREFIX.fullmatch(self.text, start, item.start_mark.index)
+        if not match:
+            raise _Unpatchable()
+        column = len(match.group(1))
+        return start + column, column
+
+    def diff(self, node: Node, old: Any, new: Any) -> List[Splice]:
+        if isinstance(node, MappingNode) and not node.flow_style \
+                and isinstance(old, dict) and isinstance(new, dict):
+            return self.diff_mapping(node, old, new)
+        if isinstance(node, SequenceNode) and not node.flow_style \
+                and isinstance(old, list) and isinstance(new, list):
+            return self.diff_sequence(node, old, new)
+        raise _Unpatchable()
+
+    def diff_mapping(self, node: MappingNode, old: Dict, new: Dict) -> List[Splice]:
+        pairs = node.value
+        # Duplicate keys or an emptied mapping cannot be patched in place
+        if not pairs or len(pairs) != len(old) or not new:
+            raise _Unpatchable()
+
+        splices = []
+        for key, (key_node, value_node) in zip(old, pairs):
+            if key not in new:
+                start = self.line_start(key_node.start_mark.index)
+                if self.text[start:key_node.start_mark.index].strip():
+                    # First key of a sequence item, e.g. "- name: ..."
+                    raise _Unpatchable()
+                splices.append((start, self.line_end(self.content_end(value_node)), ''))
+            elif _changed(old[key], new[key]):
+                try:
+                    splices.extend(self.diff(value_node, old[key], new[key]))
+                except _Unpatchable:
+                    column = key_node.start_mark.column
+                    rendered = self.render({key: new[key]}, column)[column:]
+                    splices.append((
+                        key_node.start_mark.index,
+                        self.line_end(self.content_end(value_node)),
+                        rendered,
+                    ))
+
+        added = {key: value for key, value in new.items() if key not in old}
+        if added:
+            end = self.line_end(self.content_end(pairs[-1][1]))
+            splices.append(self.insert(end, self.render(added, pairs[0][0].start_mark.column)))
+        return splices
+
+    def diff_sequence(self, node: SequenceNode, old: List, new: List) -> List[Splice]:
+        items = node.value
+        if not items or len(items) != len(old) or not new:
+            raise _Unpatchable()
+
+        # Align items by name (or value), so removing one item and appending
+        # another leaves the items in between untouched
+        matcher = difflib.SequenceMatcher(
+            None, [_item_key(value) for value in old], [_item_key(value) for value in new], autojunk=False
+        )
+        splices = []
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == 'equal' or (tag == 'replace' and i2 - i1 == j2 - j1):
+                # The same items, possibly edited in place
+                for item, old_value, new_value in zip(items[i1:i2], old[i1:i2], new[j1:j2]):
+                    if _changed(old_value, new_value):
+                        splices.extend(self.diff_item(item, old_value, new_value))
+                continue
+            # Inserted before the removed ones, as both may start at one offset
+            if j2 > j1:
+                splices.append(self.insert_items(items, i1, new[j1:j2]))
+            for item in items[i1:i2]:
+                self.item_dash(item)
+                start = self.line_start(item.start_mark.index)
+                splices.append((start, self.line_end(self.content_end(item)), ''))
+        return splices
+
+    def insert_items(self, items: List[Node], index: int, values: List) -> Splice:
+        """Render values as new items placed before items[index] (or after the last item)."""
+        _dash, column = self.item_dash(items[min(index, len(items) - 1)])
+        if index == 0:
+            at = self.line_start(items[0].start_mark.index)
+        else:
+            # Right after the previous item, above any comment of the next one
+            at = self.line_end(self.content_end(items[index - 1]))
+        return self.insert(at, self.render(values, column))
+
+    def diff_item(self, item: Node, old: Any, new: Any) -> List[Splice]:
+        try:
+            return self.diff(item, old, new)
+        except _Unpatchable:
+            dash, column = self.item_dash(item)
+            rendered = self.render([new], column)[column:]
+            return [(dash, self.line_end(self.content_end(item)), rendered)]
+
+
+def patch_yaml(text: str, node: Node, old: Any, new: Any, **dump_kwargs) -> Optional[str]:
+    """
+    Return text edited so that it parses to new, given its node tree and the
+    data old it originally parsed to. Keyword arguments are passed to
+    dump_yaml when rendering new content. Returns None if the change cannot
+    be patched in, in which case the whole document should be dumped.
+    """
+    if node is None or not _is_tree(node):
+        return None
+
+    try:
+        splices = _Patcher(text, dump_kwargs, _indents_sequences(node)).diff(node, old, new)
+    except _Unpatchable:
+        return None
+
+    # At equal offsets, splices keep the order they were computed in
+    pieces = []
+    cursor = 0
+    for _order, (start, end, replacement) in sorted(
+        enumerate(splices), key=lambda pair: (pair[1][0], pair[0])
+    ):
+        if start < cursor:
+            return None
+        pieces.append(text[cursor:start])
+        pieces.append(replacement)
+        cursor = end
+    pieces.append(text[cursor:])
+    return ''.join(pieces)
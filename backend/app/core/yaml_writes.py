@@ -0,0 +1,216 @@
+"""
+Safe read-modify-write of YAML files in the dbt project.
+
+Every write goes to a temp file in the target's directory and is swapped
+in with os.replace, so readers never see a truncated file. Read-modify-
+write cycles on one path are serialized by a per-path lock, so concurrent
+edits cannot lose each other's updates.
+
+Edits are spliced into the original text where possible (see yaml_patch),
+so comments, key order and untouched regions survive and the cost of
+rendering a change follows the size of the edit, not of the file.
+
+mutate_yaml_file additionally coalesces: mutations that queue up behind
+the same path are applied together, turning N concurrent edits of one
+schema.yml into one parse and one write.
+"""
+import asyncio
+import copy
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+from .yaml_io import dump_yaml
+from .yaml_patch import compose_yaml, patch_yaml
+from .project_index import notify_written
+
+# A mutation edits parsed YAML in place and returns True if it changed it
+Mutation = Callable[[Dict[str, Any]], bool]
+
+_file_locks: Dict[str, threading.Lock] = {}
+_file_locks_guard = threading.Lock()
+
+
+def file_lock(path: str) -> threading.Lock:
+    """Return the lock serializing read-modify-write cycles on path."""
+    key = os.path.abspath(path)
+    with _file_locks_guard:
+        lock = _file_locks.get(key)
+        if lock is None:
+            lock = _file_locks[key] = threading.Lock()
+        return lock
+
+
+def write_text_atomic(path: str, text: str) -> None:
+    """
+    Write text to path, replacing the file atomically, and update the project
+    index with the new content.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        else:
+            # mkstemp creates 0600 files; use the default mode for new files
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    notify_written([path])
+
+
+def run_mutations(
+    data: Dict[str, Any], mutations: List[Mutation], restore: Callable[[], Dict[str, Any]]
+) -> Tuple[Dict[str, Any], List[Tuple[bool, Any]]]:
+    """
+    Apply mutations to a parsed document in order, in place. A mutation that
+    raises may have edited it part-way, so the document is then rebuilt from
+    restore(), which returns it as it was before the first mutation, and the
+    mutations that succeeded are applied again. Nothing is copied unless a
+    mutation fails. Returns the document and (ok, result or exception) per
+    mutation.
+    """
+    outcomes: List[Tuple[bool, Any]] = []
+    for mutation in mutations:
+        try:
+            outcomes.append((True, bool(mutation(data))))
+        except Exception as e:
+            data = restore()
+            for done, (ok, _result) in zip(mutations, outcomes):
+                if ok:
+                    done(data)
+            outcomes.append((False, e))
+    return data, outcomes
+
+
+def write_yaml_atomic(path: str, data: Any, **dump_kwargs) -> None:
+    """Write data as YAML to path, replacing the file atomically."""
+    write_text_atomic(path, dump_yaml(data, **dump_kwargs))
+
+
+def _apply_mutations(path: str, mutations: List[Mutation], dump_kwargs: Dict[str, Any]) -> List[Tuple[bool, Any]]:
+    """
+    Read path once, apply the mutations in order and write it once if any
+    of them changed it, patching the original text when possible. Returns
+    (ok, result or exception) per mutation. A missing file is treated as
+    an empty document.
+    """
+    with file_lock(path):
+        text = ''
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                text = f.read()
+        data, node = compose_yaml(text)
+        data = data or {}
+        original = copy.deepcopy(data) if node is not None else None
+
+        # A failed mutation is undone by parsing the text again
+        data, outcomes = run_mutations(data, mutations, lambda: compose_yaml(text)[0] or {})
+
+        if any(ok and changed for ok, changed in outcomes):
+            patched = patch_yaml(text, node, original, data, **dump_kwargs) if node is not None else None
+            if patched is not None:
+                write_text_atomic(path, patched)
+            else:
+                write_yaml_atomic(path, data, **dump_kwargs)
+        return outcomes
+
+
+def update_yaml_file(path: str, mutation: Mutation, **dump_kwargs) -> bool:
+    """
+    Apply one mutation to a YAML file under its lock, writing it atomically
+    if the mutation changed it. Returns the mutation's result.
+    """
+    ok, result = _apply_mutations(path, [mutation], dump_kwargs)[0]
+    if not ok:
+        raise result
+    return result
+
+
+def update_yaml_file_many(path: str, mutations: List[Mutation], **dump_kwargs) -> List[Tuple[bool, Any]]:
+    """
+    Apply several mutations to a YAML file under its lock with one read and
+    at most one write. A mutation that raises leaves no part of its edit
+    behind. Returns (ok, result or exception) per mutation.
+    """
+    return _apply_mutations(path, mutations, dump_kwargs)
+
+
+class _PendingWrites:
+    """Mutations waiting for one path, and the lock of whoever applies them."""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.queue: List[Tuple[Mutation, asyncio.Future, Dict[str, Any]]] = []
+
+
+_pending: Dict[str, _PendingWrites] = {}
+
+
+def _settle(batch: List[Tuple[Mutation, asyncio.Future, Dict[str, Any]]], work: asyncio.Future) -> None:
+    """Give every caller of a coalesced batch the outcome of its own mutation."""
+    if work.cancelled():
+        outcomes = [(False, asyncio.CancelledError())] * len(batch)
+    elif work.exception() is not None:
+        outcomes = [(False, work.exception())] * len(batch)
+    else:
+        outcomes = work.result()
+    for (_m, f, _k), (ok, result) in zip(batch, outcomes):
+        if f.done():
+            continue
+        if ok:
+            f.set_result(result)
+        elif isinstance(result, asyncio.CancelledError):
+            f.cancel()
+        else:
+            f.set_exception(result)
+
+
+async def mutate_yaml_file(path: str, mutation: Mutation, **dump_kwargs) -> bool:
+    """
+    Apply a mutation to a YAML file without blocking the event loop.
+
+    The mutation is queued for the path; whichever caller next holds the
+    path's lock applies everything queued so far in one read and one write.
+    Returns the mutation's result, or raises the exception it raised.
+    """
+    key = os.path.abspath(path)
+    pending = _pending.get(key)
+    if pending is None:
+        pending = _pending[key] = _PendingWrites()
+
+    future = asyncio.get_running_loop().create_future()
+    pending.queue.append((mutation, future, dump_kwargs))
+
+    try:
+        async with pending.lock:
+            # An empty queue means a batch whose leader was cancelled holds
+            # this mutation; its thread settles the future when done
+            if not future.done() and pending.queue:
+                batch, pending.queue = pending.queue, []
+                # The batch is written with the options of its first mutation
+                work = asyncio.ensure_future(asyncio.to_thread(
+                    _apply_mutations, key, [m for m, _f, _k in batch], batch[0][2]
+                ))
+                work.add_done_callback(lambda done: _settle(batch, done))
+                try:
+                    # The thread cannot be stopped once started, so cancelling
+                    # this caller must not cancel the edits of the others
+                    await asyncio.shield(work)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception:
+                    # _settle has already handed the error to every caller
+                    pass
+    finally:
+        if not pending.queue and not pending.lock.locked() and _pending.get(key) is pending:
+            del _pending[key]
+
+    return await future
@@ -1,17 +1,46 @@
-from fastapi import FastAPI, Response
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.project_settings import router as project_settings_router
 from app.api.sources import router as sources_router
 from app.api.warehouse import router as warehouse_router
 from app.api.models import router as models_router
 from app.api.project import router as project_router
+from app.api.tests import router as tests_router
+from app.api.writes import router as writes_router
+from app.core.project_watcher import stop_project_watcher
+from app.core.project_index import flush_index_caches
+from app.core.parse_pool import shutdown_parse_pool
+from app.core.write_behind import flush_writes
+from app.core.fs_executor import ProjectBusyError, shutdown_fs_executor
+from app.core.warehouse.postgres_pool import close_all_pools
+from app.core.warehouse.client_factory import shutdown_drivers
+from app.core.warehouse.catalog_cache import shutdown_catalog_cache
+from app.core.warehouse.executor import shutdown_warehouse_executor
 
 from app.schemas.project import ProjectSettings
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await flush_writes()
+    await stop_project_watcher()
+    flush_index_caches()
+    shutdown_parse_pool()
+    shutdown_fs_executor()
+    shutdown_catalog_cache()
+    shutdown_warehouse_executor()
+    close_all_pools()
+    shutdown_drivers()
+
+
 app = FastAPI(
     title="DBT Project Manager API",
     description="API for managing DBT projects, sources, models, and tests",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -23,11 +52,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(ProjectBusyError)
+async def project_busy_handler(request: Request, exc: ProjectBusyError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
 app.include_router(project_settings_router, prefix="/api")
 app.include_router(sources_router, prefix="/api")
 app.include_router(warehouse_router, prefix="/api")
 app.include_router(models_router, prefix="/api")
 app.include_router(project_router, prefix="/api")
+app.include_router(tests_router, prefix="/api")
+app.include_router(writes_router, prefix="/api")
 
 # In-memory session storage (for development)
 project_settings = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Literal
 
 
 class BaseRequest(BaseModel):
@@ -10,6 +10,20 @@ class BaseRequest(BaseModel):
     target_name: str
 
 
+class ListQuery(BaseModel):
+    """Pagination, sorting and filtering options for model and source listings"""
+
+    limit: Optional[int] = None  # Page size; None returns every match
+    cursor: Optional[str] = None  # next_cursor of the previous page
+    sort_by: Optional[str] = None
+    sort_desc: bool = False
+    name: Optional[str] = None  # Case-insensitive substring match
+    schema_name: Optional[str] = None
+    path_prefix: Optional[str] = None  # Relative to the models directory
+    has_tests: Optional[bool] = None
+    test_type: Optional[str] = None
+
+
 class ColumnInfo(BaseModel):
     name: str
     type: str
@@ -47,6 +61,39 @@ class RemoveTestRequest(BaseModel):
     column_name: Optional[str] = None
 
 
+class TestOperation(BaseModel):
+    """A single add or remove of a test on a model or source table"""
+
+    action: Literal["add", "remove"]
+    target: Literal["model", "source"]
+    model_path: Optional[str] = None  # For models, relative to the models directory
+    source_name: Optional[str] = None
+    table_name: Optional[str] = None
+    column_name: Optional[str] = None
+    test_config: Optional[Dict[str, Any]] = None  # For add
+    test_name: Optional[str] = None  # For remove
+
+
+class BatchTestRequest(BaseModel):
+    """Request model for applying many test operations at once"""
+
+    dbt_project_path: str
+    operations: List[TestOperation]
+
+
+class TestOperationResult(BaseModel):
+    index: int  # Position of the operation in the request
+    success: bool
+    message: str
+
+
+class BatchTestResponse(BaseModel):
+    """Response model for a batch of test operations"""
+
+    results: List[TestOperationResult]
+    files_written: List[str]
+
+
 class TableColumnsRequest(BaseRequest):
     """Common request model for getting table columns"""
 
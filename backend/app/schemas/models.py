@@ -1,5 +1,6 @@
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional
+from .common import ListQuery
 
 
 class Model(BaseModel):
@@ -9,9 +10,10 @@ class Model(BaseModel):
     table: str
     tests: List[str]
     sql_path: str
+    database: Optional[str] = None
 
 
-class ModelsRequest(BaseModel):
+class ModelsRequest(ListQuery):
     dbt_project_path: str
     profiles_yml_path: str
     target_name: str
@@ -19,6 +21,8 @@ class ModelsRequest(BaseModel):
 
 class ModelsResponse(BaseModel):
     models: List[Model]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
 
 
 class UpdateModelRequest(BaseModel):
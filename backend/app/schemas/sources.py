@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+from .common import ListQuery
 
 
 class Source(BaseModel):
@@ -10,12 +11,14 @@ class Source(BaseModel):
     description: Optional[str] = None
 
 
-class SourcesRequest(BaseModel):
+class SourcesRequest(ListQuery):
     dbt_project_path: str
 
 
 class SourcesResponse(BaseModel):
     sources: List[Source]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
 
 
 class UpdateSourceRequest(BaseModel):
@@ -31,4 +31,27 @@ class CreateSourcesRequest(BaseModel):
 
 class OperationResponse(BaseModel):
     success: bool
-    message: str 
\ No newline at end of file
+    message: str
+
+class CatalogCacheInvalidateRequest(BaseModel):
+    # Without a target, the whole cache is dropped
+    profiles_yml_path: Optional[str] = None
+    target_name: Optional[str] = None
+    profile_name: Optional[str] = None
+    dbt_project_path: Optional[str] = None
+    schema_name: Optional[str] = None
+    table_name: Optional[str] = None
+
+class CatalogCacheStatsResponse(BaseModel):
+    enabled: bool
+    entries: int
+    max_entries: int
+    refreshing: int
+    hits: int
+    stale_hits: int
+    misses: int
+    hit_rate: float
+    refreshes: int
+    refresh_errors: int
+    evictions: int
+    invalidated: Optional[int] = None
@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class PendingWrite(BaseModel):
+    path: str
+    dbt_project_path: str
+    edits: int  # Edits applied in memory but not yet written
+    queued_at: float  # Unix time of the first unwritten edit
+    flush_in_ms: int
+
+
+class WriteStatusResponse(BaseModel):
+    """State of the write-behind queue"""
+
+    write_behind: bool
+    delay_ms: int
+    max_delay_ms: int
+    durable: bool  # True when every edit is on disk
+    pending: List[PendingWrite]
+    flushing: List[str]
+    flushes: int
+    edits_flushed: int
+    last_flush_at: Optional[float] = None
+    last_error: Optional[str] = None
+
+
+class FlushRequest(BaseModel):
+    dbt_project_path: Optional[str] = None  # None flushes every project
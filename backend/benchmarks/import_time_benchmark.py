@@ -0,0 +1,105 @@
+"""
+Measures cold-start import time and resident memory of an API worker, with
+and without loading each warehouse driver.
+
+Every scenario runs in fresh interpreters: the median wall time and peak
+RSS of importing app.main (then the driver) over --runs runs, followed by
+the heaviest modules from a `python -X importtime` run.
+
+Usage (from the backend directory):
+    python -m benchmarks.import_time_benchmark [--runs 5] [--top 10]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child interpreter; prints wall time and peak RSS as JSON
+CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+import app.main
+driver = sys.argv[1]
+if driver:
+    from app.core.warehouse.client_factory import get_driver
+    get_driver(driver)
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+# ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+rss_mb = rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+print(json.dumps({'seconds': elapsed, 'rss_mb': rss_mb}))
+"""
+
+SCENARIOS = [('app only', ''), ('+ postgres', 'postgres'), ('+ bigquery', 'bigquery')]
+
+
+def _run_child(driver: str, *python_flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *python_flags, '-c', CHILD, driver],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+
+
+def measure(driver: str, runs: int):
+    """Median seconds and peak RSS over runs, or None if the driver is not installed."""
+    samples = []
+    for _ in range(runs):
+        result = _run_child(driver)
+        if result.returncode != 0:
+            return None
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return (
+        statistics.median(s['seconds'] for s in samples),
+        statistics.median(s['rss_mb'] for s in samples),
+    )
+
+
+def heaviest_imports(driver: str, top: int):
+    """(cumulative seconds, module) of the slowest top-level imports, from -X importtime."""
+    result = _run_child(driver, '-X', 'importtime')
+    if result.returncode != 0:
+        return []
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        if not cumulative_us.strip().isdigit():
+            continue  # header line
+        # Nested imports are indented further; keep those imported directly
+        name = name[1:]
+        if name.startswith('  ') and not name.startswith('   '):
+            rows.append((int(cumulative_us) / 1e6, name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def run(runs: int, top: int) -> None:
+    print(f"Python {sys.version.split()[0]}, {runs} runs per scenario")
+    print(f"{'scenario':<14}{'import time':>13}{'peak RSS':>12}")
+    for label, driver in SCENARIOS:
+        measured = measure(driver, runs)
+        if measured is None:
+            print(f"{label:<14}{'driver not installed':>25}")
+            continue
+        seconds, rss_mb = measured
+        print(f"{label:<14}{seconds * 1000:>11.0f}ms{rss_mb:>9.1f} MB")
+
+    for label, driver in SCENARIOS:
+        rows = heaviest_imports(driver, top)
+        if not rows:
+            continue
+        print(f"\nHeaviest top-level imports ({label}):")
+        for seconds, name in rows:
+            print(f"{seconds * 1000:>9.1f}ms  {name}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=5, help="Fresh interpreters per scenario")
+    parser.add_argument('--top', type=int, default=10, help="Slowest imports to list per scenario")
+    args = parser.parse_args()
+    run(args.runs, args.top)
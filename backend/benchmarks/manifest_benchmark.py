@@ -0,0 +1,72 @@
+"""
+Compares peak memory and time of streaming manifest.json ingestion against
+json.load, across manifest sizes.
+
+Each measurement runs in a fresh interpreter; peak RSS is reported as the
+growth over the interpreter's RSS before reading the manifest.
+
+Usage (from the backend directory):
+    python -m benchmarks.manifest_benchmark [--models 2000 10000 40000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from .synthetic_project import make_manifest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child interpreter; prints time, RSS growth and records kept as JSON
+CHILD = """
+import json, resource, sys, time
+from app.core.manifest import read_manifest
+
+def rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+reader, path = sys.argv[1], sys.argv[2]
+before = rss_mb()
+start = time.perf_counter()
+if reader == 'stream':
+    index = read_manifest(path)
+    records = len(index.models) + len(index.tests) + len(index.sources)
+else:
+    with open(path) as f:
+        manifest = json.load(f)
+    records = len(manifest['nodes']) + len(manifest['sources'])
+elapsed = time.perf_counter() - start
+print(json.dumps({'seconds': elapsed, 'rss_mb': rss_mb() - before, 'records': records}))
+"""
+
+
+def measure(reader: str, path: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD, reader, path],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(model_counts) -> None:
+    print(f"{'models':>8}{'file':>10}{'reader':>12}{'time':>10}{'peak RSS +':>13}{'records':>10}")
+    with tempfile.TemporaryDirectory() as root:
+        for n_models in model_counts:
+            path = make_manifest(os.path.join(root, f"manifest_{n_models}.json"), n_models)
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            for reader in ('stream', 'json.load'):
+                m = measure(reader, path)
+                print(f"{n_models:>8}{size_mb:>8.0f}MB{reader:>12}{m['seconds']:>9.2f}s"
+                      f"{m['rss_mb']:>10.0f} MB{m['records']:>10}")
+            os.unlink(path)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--models', type=int, nargs='+', default=[2000, 10000, 40000],
+                        help="Manifest sizes to measure, in models")
+    args = parser.parse_args()
+    run(args.models)
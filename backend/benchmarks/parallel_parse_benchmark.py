@@ -0,0 +1,48 @@
+"""
+Measures how a cold project index build scales with the number of parse
+worker processes.
+
+Usage (from the backend directory):
+    python -m benchmarks.parallel_parse_benchmark [--files 2000] [--workers 1 2 4 8]
+"""
+import argparse
+import glob
+import os
+import tempfile
+import time
+from app.core.project_index import parse_file_records
+from app.core.parse_pool import get_parse_pool, shutdown_parse_pool
+from .synthetic_project import make_project
+
+
+def run(n_files: int, worker_counts) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        make_project(root, n_files)
+        paths = glob.glob(os.path.join(root, 'models', '**', '*.yml'), recursive=True)
+        print(f"{len(paths)} schema files, {os.cpu_count()} CPUs")
+        print(f"{'workers':>8}{'wall time':>12}{'speedup':>10}")
+
+        baseline = None
+        for workers in worker_counts:
+            if workers > 1:
+                # Warm the pool so process start-up is not part of the measurement
+                get_parse_pool(workers).submit(int).result()
+
+            start = time.perf_counter()
+            records = parse_file_records(paths, workers=workers)
+            elapsed = time.perf_counter() - start
+            assert len(records) == len(paths)
+
+            baseline = baseline or elapsed
+            print(f"{workers:>8}{elapsed:>11.2f}s{baseline / elapsed:>9.1f}x")
+
+        shutdown_parse_pool()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--files', type=int, default=2000, help="Number of schema files to generate")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help="Worker counts to measure")
+    args = parser.parse_args()
+    run(args.files, args.workers)
@@ -0,0 +1,127 @@
+"""
+Generates synthetic dbt projects for benchmarks.
+"""
+import json
+import os
+from app.core.yaml_io import dump_yaml
+
+
+def schema_document(file_index: int, models_per_file: int = 3, columns_per_model: int = 8) -> dict:
+    """Build a schema document with models, column tests and one source."""
+    models = []
+    for m in range(models_per_file):
+        name = f"model_{file_index}_{m}"
+        models.append({
+            'name': name,
+            'description': f"Synthetic model {name}",
+            'data_tests': [{'dbt_utils.recency': {'datepart': 'day', 'field': 'updated_at', 'interval': 1}}],
+            'columns': [
+                {
+                    'name': f"column_{c}",
+                    'description': f"Column {c} of {name}",
+                    'tests': ['not_null', 'unique'] if c == 0 else [
+                        {'accepted_values': {'values': ['a', 'b', 'c']}}
+                    ],
+                }
+                for c in range(columns_per_model)
+            ],
+        })
+
+    return {
+        'version': 2,
+        'models': models,
+        'sources': [{
+            'name': f"source_{file_index}",
+            'schema': f"raw_{file_index}",
+            'tables': [
+                {'name': f"table_{t}", 'description': f"Raw table {t}", 'tests': ['not_null']}
+                for t in range(3)
+            ],
+        }],
+    }
+
+
+def make_project(root: str, n_files: int = 2000, files_per_dir: int = 50) -> str:
+    """
+    Write a dbt project with n_files schema files (and one SQL file per
+    model) under root. Returns the project path.
+    """
+    models_dir = os.path.join(root, 'models')
+    for i in range(n_files):
+        directory = os.path.join(models_dir, f"dir_{i // files_per_dir}")
+        os.makedirs(directory, exist_ok=True)
+
+        document = schema_document(i)
+        with open(os.path.join(directory, f"schema_{i}.yml"), 'w') as f:
+            dump_yaml(document, f, sort_keys=False)
+
+        for model in document['models']:
+            with open(os.path.join(directory, f"{model['name']}.sql"), 'w') as f:
+                f.write("select 1 as column_0\n")
+
+    with open(os.path.join(root, 'dbt_project.yml'), 'w') as f:
+        dump_yaml({'name': 'synthetic', 'profile': 'synthetic'}, f)
+
+    return root
+
+
+def make_manifest(path: str, n_models: int = 10000, sql_size: int = 2000) -> str:
+    """
+    Write a manifest.json shaped like dbt's for n_models models, with two
+    tests per model, sources, macros and dependency maps. Nodes are written
+    one at a time so large manifests can be generated in little memory.
+    Returns the path.
+    """
+    sql = "select * from upstream where x = 1\n" * (sql_size // 35 + 1)
+
+    def model_node(i: int) -> dict:
+        name = f"model_{i}"
+        return {
+            'resource_type': 'model', 'name': name, 'package_name': 'synthetic',
+            'original_file_path': f"models/dir_{i // 50}/{name}.sql",
+            'database': 'analytics', 'schema': f"schema_{i % 20}", 'alias': name,
+            'raw_code': sql, 'compiled_code': sql,
+            'columns': {f"column_{c}": {'name': f"column_{c}", 'description': '', 'data_type': None}
+                        for c in range(8)},
+            'depends_on': {'nodes': [f"model.synthetic.model_{i - 1}"] if i else [], 'macros': []},
+            'config': {'materialized': 'view', 'tags': [], 'meta': {}},
+        }
+
+    def test_node(i: int, test: str) -> dict:
+        return {
+            'resource_type': 'test', 'name': f"{test}_model_{i}_column_0", 'package_name': 'synthetic',
+            'test_metadata': {'name': test, 'kwargs': {'column_name': 'column_0'}},
+            'attached_node': f"model.synthetic.model_{i}", 'column_name': 'column_0',
+            'raw_code': "{{ test_" + test + "(**_dbt_generic_test_kwargs) }}",
+        }
+
+    with open(path, 'w') as f:
+        f.write('{"metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v12.json"}')
+        f.write(', "nodes": {')
+        first = True
+        for i in range(n_models):
+            entries = [(f"model.synthetic.model_{i}", model_node(i))]
+            entries += [(f"test.synthetic.{t}_model_{i}", test_node(i, t)) for t in ('not_null', 'unique')]
+            for unique_id, node in entries:
+                f.write(('' if first else ', ') + json.dumps(unique_id) + ': ' + json.dumps(node))
+                first = False
+        f.write('}, "sources": {')
+        f.write(', '.join(
+            json.dumps(f"source.synthetic.raw.table_{i}") + ': ' + json.dumps({
+                'source_name': 'raw', 'name': f"table_{i}", 'package_name': 'synthetic',
+                'database': 'raw', 'schema': 'raw', 'identifier': f"table_{i}", 'columns': {},
+            })
+            for i in range(max(1, n_models // 10))
+        ))
+        f.write('}, "macros": {')
+        f.write(', '.join(
+            json.dumps(f"macro.synthetic.macro_{i}") + ': ' + json.dumps({'name': f"macro_{i}", 'macro_sql': sql})
+            for i in range(max(1, n_models // 5))
+        ))
+        f.write('}, "parent_map": {')
+        f.write(', '.join(
+            json.dumps(f"model.synthetic.model_{i}") + ': ' + json.dumps([f"model.synthetic.model_{i - 1}"] if i else [])
+            for i in range(n_models)
+        ))
+        f.write('}, "child_map": {}}')
+    return path
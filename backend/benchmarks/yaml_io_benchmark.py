@@ -0,0 +1,54 @@
+"""
+Compares the libyaml (C) loader/dumper against the pure-Python ones on a
+synthetic 2,000-file dbt project.
+
+Usage (from the backend directory):
+    python -m benchmarks.yaml_io_benchmark [--files 2000]
+"""
+import argparse
+import glob
+import io
+import os
+import tempfile
+import time
+import yaml
+from app.core import yaml_io
+from .synthetic_project import make_project
+
+
+def _time(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run(n_files: int) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        make_project(root, n_files)
+        paths = glob.glob(os.path.join(root, 'models', '**', '*.yml'), recursive=True)
+        contents = []
+        for path in paths:
+            with open(path, 'r') as f:
+                contents.append(f.read())
+
+        print(f"{len(paths)} schema files, {sum(len(c) for c in contents) / 1e6:.1f} MB of YAML")
+        print(f"libyaml available: {yaml_io.LIBYAML_AVAILABLE}")
+
+        documents = []
+        python_parse = _time(lambda: [yaml.load(c, Loader=yaml.SafeLoader) for c in contents])
+        c_parse = _time(lambda: documents.extend(yaml_io.load_yaml(c) for c in contents))
+
+        python_dump = _time(lambda: [
+            yaml.dump(d, io.StringIO(), Dumper=yaml.SafeDumper, sort_keys=False) for d in documents
+        ])
+        c_dump = _time(lambda: [yaml_io.dump_yaml(d, io.StringIO(), sort_keys=False) for d in documents])
+
+        print(f"{'':8}{'pure-python':>14}{'yaml_io':>14}{'speedup':>10}")
+        print(f"{'parse':8}{python_parse:>13.2f}s{c_parse:>13.2f}s{python_parse / c_parse:>9.1f}x")
+        print(f"{'dump':8}{python_dump:>13.2f}s{c_dump:>13.2f}s{python_dump / c_dump:>9.1f}x")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--files', type=int, default=2000, help="Number of schema files to generate")
+    run(parser.parse_args().files)
@@ -0,0 +1,56 @@
+"""
+In-memory stand-in for google.cloud.bigquery.Client that counts the API
+calls made through it. Pass it to BigQueryClient(config, client=...).
+"""
+import json
+import re
+from collections import Counter
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+# `project.dataset`.INFORMATION_SCHEMA.<view>
+_INFORMATION_SCHEMA = re.compile(r'`[^`.]+\.([^`]+)`\.INFORMATION_SCHEMA\.TABLES')
+
+
+class FakeBigQueryClient:
+    """Datasets map to {table name: description}; calls counts calls per method."""
+
+    def __init__(self, datasets: Dict[str, Dict[str, str]], project: str = 'fake-project'):
+        self.datasets = datasets
+        self.project = project
+        self.calls: Counter = Counter()
+        self.queries: List[str] = []
+
+    def list_datasets(self):
+        self.calls['list_datasets'] += 1
+        return [SimpleNamespace(dataset_id=name) for name in self.datasets]
+
+    def list_tables(self, dataset: str):
+        self.calls['list_tables'] += 1
+        return [
+            SimpleNamespace(table_id=name, reference=(dataset, name))
+            for name in self.datasets[dataset]
+        ]
+
+    def get_table(self, reference: Tuple[str, str]):
+        self.calls['get_table'] += 1
+        dataset, name = reference
+        return SimpleNamespace(description=self.datasets[dataset][name], schema=[])
+
+    def query(self, sql: str):
+        self.calls['query'] += 1
+        self.queries.append(sql)
+        match = _INFORMATION_SCHEMA.search(sql)
+        if match is None:
+            raise ValueError(f"Unsupported query: {sql}")
+        tables = self.datasets[match.group(1)]
+        rows = [
+            {'table_name': name, 'description': _option_value(description)}
+            for name, description in sorted(tables.items())
+        ]
+        return SimpleNamespace(result=lambda: rows)
+
+
+def _option_value(description: str) -> Optional[str]:
+    # TABLE_OPTIONS renders strings as quoted literals and has no row without one
+    return json.dumps(description) if description else None
@@ -0,0 +1,70 @@
+"""BigQuery metadata is read with as few API calls as possible."""
+import json
+import os
+
+import pytest
+
+pytest.importorskip('google.cloud.bigquery')
+
+from app.core.warehouse import bigquery_client
+from app.core.warehouse.bigquery_client import BigQueryClient
+from .fake_bigquery import FakeBigQueryClient
+
+DATASETS = {
+    'staging': {'stg_orders': 'Raw orders', 'stg_customers': ''},
+    'analytics': {'orders': 'Daily "orders"', 'customers': 'One row per customer', 'payments': ''},
+}
+
+
+def _client():
+    fake = FakeBigQueryClient(DATASETS)
+    return BigQueryClient({'project': 'fake-project'}, client=fake), fake
+
+
+def test_tables_with_descriptions_take_one_query_per_dataset():
+    client, fake = _client()
+
+    tables = {schema: client.get_tables(schema) for schema in client.get_schemas()}
+
+    assert fake.calls['query'] == len(DATASETS)
+    assert fake.calls['get_table'] == 0
+    assert all('INFORMATION_SCHEMA' in query for query in fake.queries)
+    assert tables['analytics'] == [
+        {'name': 'customers', 'description': 'One row per customer'},
+        {'name': 'orders', 'description': 'Daily "orders"'},
+        {'name': 'payments', 'description': ''},
+    ]
+
+
+def test_catalog_lists_tables_without_queries():
+    client, fake = _client()
+
+    catalog = client.get_catalog()
+
+    assert fake.calls['list_tables'] == len(DATASETS)
+    assert fake.calls['query'] == 0
+    assert fake.calls['get_table'] == 0
+    assert {entry['schema']: sorted(t['name'] for t in entry['tables']) for entry in catalog} == {
+        schema: sorted(tables) for schema, tables in DATASETS.items()
+    }
+
+
+def test_keyfile_is_parsed_once_until_it_changes(tmp_path, monkeypatch):
+    keyfile = tmp_path / 'key.json'
+    keyfile.write_text(json.dumps({'client_email': 'a@fake-project.iam'}))
+    config = {'project': 'fake-project', 'keyfile': str(keyfile)}
+    loads = []
+    load = json.load
+    monkeypatch.setattr(bigquery_client.json, 'load', lambda f: loads.append(f.name) or load(f))
+
+    first = bigquery_client._service_account_info(config)
+    for _ in range(10):
+        assert bigquery_client._service_account_info(config) == first
+    assert len(loads) == 1
+
+    keyfile.write_text(json.dumps({'client_email': 'b@fake-project.iam'}))
+    os.utime(keyfile, ns=(0, 0))
+    info, fingerprint = bigquery_client._service_account_info(config)
+    assert len(loads) == 2
+    assert info['client_email'] == 'b@fake-project.iam'
+    assert fingerprint != first[1]
@@ -0,0 +1,47 @@
+"""Warehouse metadata cache hits are shared, frozen and include empty results."""
+import pytest
+from app.core.warehouse.catalog_cache import CatalogCache
+
+
+def _fetcher(value):
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return value
+    return fetch, calls
+
+
+def test_hits_share_one_frozen_value():
+    cache = CatalogCache()
+    key = ('target', 'tables', 'analytics', None)
+    fetch, calls = _fetcher([{'name': 'orders', 'description': ''}])
+
+    first = cache.get(key, fetch, fetch)
+    second = cache.get(key, fetch, fetch)
+
+    assert len(calls) == 1
+    assert first is second
+    assert first[0]['name'] == 'orders'
+    with pytest.raises(TypeError):
+        first[0]['name'] = 'customers'
+
+
+def test_empty_results_are_cached():
+    cache = CatalogCache()
+    key = ('target', 'schemas', None, None)
+    fetch, calls = _fetcher([])
+
+    for _ in range(3):
+        assert cache.get(key, fetch, fetch) == ()
+    assert len(calls) == 1
+
+
+def test_incomplete_catalog_is_not_cached():
+    cache = CatalogCache()
+    key = ('target', 'catalog', None, None)
+    fetch, calls = _fetcher([{'schema': 'analytics', 'tables': [], 'incomplete': True}])
+
+    cache.get(key, fetch, fetch)
+    cache.get(key, fetch, fetch)
+    assert len(calls) == 2
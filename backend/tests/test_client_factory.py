@@ -0,0 +1,40 @@
+"""Warehouse clients are created off the event loop."""
+import asyncio
+import threading
+
+from app.core.warehouse import client_factory
+from app.core.warehouse.client_factory import aget_client_for_target
+
+PROFILES = """
+demo:
+  target: dev
+  outputs:
+    dev:
+      type: postgres
+      host: localhost
+      user: demo
+      dbname: demo
+"""
+
+
+class _Client:
+    def __init__(self, config):
+        self.config = config
+
+
+def test_driver_is_imported_on_the_warehouse_executor(tmp_path, monkeypatch):
+    profiles = tmp_path / 'profiles.yml'
+    profiles.write_text(PROFILES)
+    threads = []
+
+    def get_driver(warehouse_type):
+        # Stands in for the driver import
+        threads.append(threading.current_thread())
+        return _Client
+
+    monkeypatch.setattr(client_factory, 'get_driver', get_driver)
+
+    client = asyncio.run(aget_client_for_target(str(profiles), 'demo', 'dev'))
+
+    assert client is not None
+    assert threads and threading.current_thread() not in threads
@@ -0,0 +1,59 @@
+"""Mutations coalesced by mutate_yaml_file each get their own outcome."""
+import asyncio
+import threading
+from app.core.yaml_io import load_yaml
+from app.core.yaml_writes import mutate_yaml_file
+
+
+def _blocking(key, value, started, release):
+    def mutation(data):
+        started.set()
+        release.wait(5)
+        data[key] = value
+        return True
+    return mutation
+
+
+def test_cancelled_leader_does_not_cancel_its_batch(tmp_path):
+    path = str(tmp_path / 'schema.yml')
+    first_started, first_release = threading.Event(), threading.Event()
+    batch_started, batch_release = threading.Event(), threading.Event()
+
+    def follower(data):
+        data['models'] = [{'name': 'orders'}]
+        return True
+
+    def failing(data):
+        raise ValueError("invalid test")
+
+    async def run():
+        first = asyncio.ensure_future(
+            mutate_yaml_file(path, _blocking('version', 2, first_started, first_release))
+        )
+        await asyncio.to_thread(first_started.wait, 5)
+        # Queued behind the first write and applied together, led by the first of them
+        leader = asyncio.ensure_future(
+            mutate_yaml_file(path, _blocking('sources', [], batch_started, batch_release))
+        )
+        followers = [
+            asyncio.ensure_future(mutate_yaml_file(path, follower)),
+            asyncio.ensure_future(mutate_yaml_file(path, failing)),
+        ]
+        await asyncio.sleep(0)
+        first_release.set()
+        await first
+        await asyncio.to_thread(batch_started.wait, 5)
+
+        leader.cancel()
+        batch_release.set()
+        results = await asyncio.gather(*followers, return_exceptions=True)
+        return leader, results
+
+    leader, (written, failed) = asyncio.run(run())
+
+    assert leader.cancelled()
+    assert written is True
+    assert isinstance(failed, ValueError)
+    with open(path) as f:
+        # The leader's edit was already being written when it was cancelled
+        assert load_yaml(f) == {'version': 2, 'sources': [], 'models': [{'name': 'orders'}]}
@@ -0,0 +1,39 @@
+"""The project index saves its on-disk cache after cold builds and on flush only."""
+from app.core import project_index
+from app.core.index_cache import IndexCache
+
+
+class CountingCache(IndexCache):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.saves = 0
+
+    def save(self, entries):
+        self.saves += 1
+        super().save(entries)
+
+
+def test_incremental_changes_are_saved_on_flush(tmp_path, monkeypatch):
+    monkeypatch.setattr(project_index, 'INDEX_CACHE_SAVE_DELAY_S', 3600)
+    models_dir = tmp_path / 'project' / 'models'
+    models_dir.mkdir(parents=True)
+    schema = models_dir / 'schema.yml'
+    schema.write_text('version: 2\nmodels:\n- name: orders\n')
+
+    index = project_index.ProjectIndex(str(tmp_path / 'project'))
+    index._cache = cache = CountingCache(index.dbt_project_path, str(tmp_path / 'cache'))
+    index.refresh()
+    assert cache.saves == 1
+
+    for i in range(3):
+        schema.write_text(f"version: 2\nmodels:\n- name: orders\n  description: v{i}\n" + '#' * i)
+        index.apply_changes([str(schema)])
+    assert cache.saves == 1
+
+    index.save_cache()
+    assert cache.saves == 2
+    assert cache.load()[str(schema)][1] == index._records[str(schema)]
+
+    # Nothing new to save
+    index.save_cache()
+    assert cache.saves == 2
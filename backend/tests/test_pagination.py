@@ -0,0 +1,34 @@
+"""Cursor pagination over sorted views."""
+import pytest
+from app.core.pagination import paginate
+
+ITEMS = ['a', 'b', 'c', 'd']
+NAME_KEYS = [(item,) for item in ITEMS]
+TESTS_KEYS = [(i, item) for i, item in enumerate(ITEMS)]
+
+
+def test_pages_resume_after_cursor():
+    page, cursor, total = paginate(ITEMS, NAME_KEYS, limit=3, sort_by='name')
+    assert (page, total) == (['a', 'b', 'c'], 4)
+    page, cursor, total = paginate(ITEMS, NAME_KEYS, limit=3, cursor=cursor, sort_by='name')
+    assert (page, cursor) == (['d'], None)
+
+
+@pytest.mark.parametrize('sort_by, descending', [('tests', False), ('name', True)])
+def test_cursor_rejected_for_other_sort_order(sort_by, descending):
+    _page, cursor, _total = paginate(ITEMS, NAME_KEYS, limit=1, sort_by='name')
+    with pytest.raises(ValueError, match='first page'):
+        paginate(ITEMS, TESTS_KEYS, limit=1, cursor=cursor, descending=descending, sort_by=sort_by)
+
+
+def test_known_total_is_not_recounted():
+    calls = []
+
+    def predicate(item):
+        calls.append(item)
+        return item != 'b'
+
+    page, _cursor, total = paginate(ITEMS, NAME_KEYS, predicate, limit=1, sort_by='name', total=3)
+    assert (page, total) == (['a'], 3)
+    # Only as far as the page and the look-ahead for next_cursor
+    assert calls == ['a', 'b', 'c']
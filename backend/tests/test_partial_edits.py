@@ -0,0 +1,140 @@
+"""A failed edit must not leave part of itself in a file another edit writes."""
+import asyncio
+import copy
+import os
+from app.config.constants import TESTS_YAML_KEY
+from app.core import write_behind
+from app.core.batch import apply_test_batch
+from app.core.yaml_io import load_yaml
+from app.core.yaml_writes import mutate_yaml_file, update_yaml_file
+from app.schemas import common
+
+SCHEMA = """version: 2
+models:
+- name: orders
+  columns:
+  - name: id
+"""
+
+
+def _project(tmp_path):
+    models_dir = tmp_path / 'models'
+    models_dir.mkdir()
+    (models_dir / 'orders.sql').write_text('select 1 as id')
+    (models_dir / 'customers.sql').write_text('select 1 as id')
+    (models_dir / 'schema.yml').write_text(SCHEMA)
+    return str(tmp_path), str(models_dir / 'schema.yml')
+
+
+def _read(path):
+    with open(path) as f:
+        return load_yaml(f)
+
+
+def test_failed_batch_operation_leaves_no_partial_edit(tmp_path):
+    project, schema_path = _project(tmp_path)
+    operations = [
+        # No test_type: used to leave an empty 'customers' entry behind
+        common.TestOperation(action='add', target='model', model_path='customers.sql',
+                             test_config={'config': {'values': ['a']}}),
+        common.TestOperation(action='add', target='model', model_path='orders.sql',
+                             column_name='id', test_config={'test_type': 'not_null'}),
+    ]
+
+    results, files_written = apply_test_batch(project, operations)
+
+    assert [result['success'] for result in results] == [False, True]
+    assert files_written == [schema_path]
+    data = _read(schema_path)
+    assert [model['name'] for model in data['models']] == ['orders']
+    assert data['models'][0]['columns'][0][TESTS_YAML_KEY] == ['not_null']
+
+
+def test_mutation_raising_part_way_is_rolled_back(tmp_path):
+    _project_dir, schema_path = _project(tmp_path)
+
+    def half_done(data):
+        data['models'].append({'name': 'customers', 'description': ''})
+        raise ValueError("invalid test")
+
+    def describe(data):
+        data['models'][0]['description'] = 'Orders'
+        return True
+
+    async def run():
+        return await asyncio.gather(
+            mutate_yaml_file(schema_path, half_done),
+            mutate_yaml_file(schema_path, describe),
+            return_exceptions=True,
+        )
+
+    failed, succeeded = asyncio.run(run())
+
+    assert isinstance(failed, ValueError)
+    assert succeeded is True
+    assert _read(schema_path)['models'] == [
+        {'name': 'orders', 'columns': [{'name': 'id'}], 'description': 'Orders'}
+    ]
+
+
+def test_update_yaml_file_raises_without_writing(tmp_path):
+    _project_dir, schema_path = _project(tmp_path)
+    mtime = os.stat(schema_path).st_mtime_ns
+
+    def half_done(data):
+        data['version'] = 3
+        raise KeyError('test_type')
+
+    try:
+        update_yaml_file(schema_path, half_done)
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("update_yaml_file swallowed the mutation's error")
+
+    assert os.stat(schema_path).st_mtime_ns == mtime
+    assert _read(schema_path)['version'] == 2
+
+
+def test_write_behind_does_not_replay_failed_edit(tmp_path, monkeypatch):
+    project, schema_path = _project(tmp_path)
+    monkeypatch.setattr(write_behind, 'WRITE_BEHIND_ENABLED', True)
+
+    def half_done(data):
+        data['models'].append({'name': 'customers', 'description': ''})
+        raise ValueError("invalid test")
+
+    def describe(data):
+        data['models'][0]['description'] = 'Orders'
+        return True
+
+    async def run():
+        try:
+            await write_behind.submit_mutation(project, schema_path, half_done)
+        except ValueError:
+            pass
+        assert await write_behind.submit_mutation(project, schema_path, describe)
+        await write_behind.flush_writes(project)
+
+    asyncio.run(run())
+
+    assert [model['name'] for model in _read(schema_path)['models']] == ['orders']
+    assert _read(schema_path)['models'][0]['description'] == 'Orders'
+
+
+def test_batch_does_not_copy_the_document_per_operation(tmp_path, monkeypatch):
+    project, schema_path = _project(tmp_path)
+    copies = []
+    deepcopy = copy.deepcopy
+    monkeypatch.setattr(copy, 'deepcopy', lambda value, *args: copies.append(1) or deepcopy(value, *args))
+    operations = [
+        common.TestOperation(action='add', target='model', model_path='orders.sql',
+                             column_name=f"col_{i}", test_config={'test_type': 'not_null'})
+        for i in range(200)
+    ]
+
+    results, _files_written = apply_test_batch(project, operations)
+
+    assert all(result['success'] for result in results)
+    # One copy per file, for patching the original text
+    assert len(copies) == 1
@@ -0,0 +1,33 @@
+"""Files written while the watcher starts still reach the project index."""
+import asyncio
+import pytest
+
+pytest.importorskip('watchfiles')
+
+from app.core.project_index import clear_project_indexes
+from app.core.project_watcher import ProjectWatcher
+
+
+def test_file_written_right_after_start_is_indexed(tmp_path):
+    models_dir = tmp_path / 'models' / 'marts'
+    models_dir.mkdir(parents=True)
+    (models_dir / 'orders.sql').write_text('select 1')
+
+    async def run():
+        watcher = ProjectWatcher(str(tmp_path), debounce_ms=50)
+        await watcher.start()
+        try:
+            (models_dir / 'lost.sql').write_text('select 1')
+            for _ in range(100):
+                await asyncio.sleep(0.05)
+                names = {row.name for row in watcher.index.snapshot().model_rows}
+                if 'lost' in names:
+                    return names
+            return names
+        finally:
+            await watcher.stop()
+
+    try:
+        assert asyncio.run(run()) == {'orders', 'lost'}
+    finally:
+        clear_project_indexes(str(tmp_path))
@@ -0,0 +1,67 @@
+"""Models are matched with warehouse tables the same way with and without streaming."""
+from app.core.models import get_models_with_schema_info, iter_models_with_schema_info
+from app.core.project_index import ModelRow
+
+SCHEMAS = [
+    {'schema': 'staging', 'tables': [{'name': 'ORDERS'}]},
+    {'schema': 'analytics', 'tables': [{'name': 'orders'}, {'name': 'customers'}]},
+]
+
+
+def _rows():
+    return [
+        ModelRow(id=f"model_{i}", name=name, sql_path=f"{name}.sql", tests=[])
+        for i, name in enumerate(['orders', 'customers', 'payments'], 1)
+    ]
+
+
+def _models():
+    return [row.to_model() for row in _rows()]
+
+
+def _relations(models):
+    return sorted((m.name, m.schema, m.table) for m in models)
+
+
+def test_streaming_and_batch_matching_agree():
+    matched = get_models_with_schema_info('', _models(), SCHEMAS)
+    streamed = list(iter_models_with_schema_info(_rows(), iter(SCHEMAS)))
+
+    assert _relations(streamed) == _relations(matched) == [
+        ('customers', 'analytics', 'customers'),
+        ('orders', 'staging', 'ORDERS'),
+        ('payments', '', ''),
+    ]
+    # Matched models stream first, unmatched ones at the end
+    assert [m.name for m in streamed] == ['orders', 'customers', 'payments']
+
+
+class _CountingClient:
+    def __init__(self):
+        self.listed = []
+        self.disconnected = False
+
+    def get_schemas(self):
+        return [schema['schema'] for schema in SCHEMAS]
+
+    def get_tables(self, schema):
+        self.listed.append(schema)
+        return next(s['tables'] for s in SCHEMAS if s['schema'] == schema)
+
+    def disconnect(self):
+        self.disconnected = True
+
+
+def test_stream_lists_tables_schema_by_schema():
+    from app.api.models import _iter_warehouse_schemas
+
+    client = _CountingClient()
+    streamed = iter_models_with_schema_info(_rows(), _iter_warehouse_schemas(client))
+
+    # The first match is sent before the next schema's tables are listed
+    assert next(streamed).name == 'orders'
+    assert client.listed == ['staging']
+
+    assert [m.name for m in streamed] == ['customers', 'payments']
+    assert client.listed == ['staging', 'analytics']
+    assert client.disconnected
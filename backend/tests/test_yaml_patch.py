@@ -0,0 +1,84 @@
+"""patch_yaml splices edits into the original text instead of re-dumping it."""
+import copy
+import pytest
+from app.core.models import apply_add_test_to_schema, apply_remove_test_from_schema
+from app.core.yaml_io import load_yaml
+from app.core.yaml_patch import compose_yaml, patch_yaml
+
+SCHEMA = """version: 2
+models:
+  - name: a
+    tests:
+      - unique
+  # b is the fact table
+  - name: b
+    description: "Keep   this"
+    columns:
+      - name: id  # important
+        tests:
+          - not_null
+  - name: c
+    description: plain
+"""
+
+UNTOUCHED = """  # b is the fact table
+  - name: b
+    description: "Keep   this"
+    columns:
+      - name: id  # important
+        tests:
+          - not_null
+  - name: c
+    description: plain
+"""
+
+
+def _patch(text, mutate):
+    data, node = compose_yaml(text)
+    new = copy.deepcopy(data)
+    mutate(new)
+    patched = patch_yaml(text, node, data, new, default_flow_style=False)
+    assert patched is not None
+    assert load_yaml(patched) == new
+    return patched
+
+
+def test_removal_and_append_in_one_write_keep_the_items_between():
+    def mutate(data):
+        # Removing the only test of a drops its entry
+        assert apply_remove_test_from_schema(data, 'a', 'unique')
+        apply_add_test_to_schema(data, 'e', {'test_type': 'unique'})
+
+    patched = _patch(SCHEMA, mutate)
+
+    assert '- name: a' not in patched
+    assert UNTOUCHED in patched
+    assert patched.index(UNTOUCHED) < patched.index('name: e')
+
+
+LISTS = {
+    'kept': ['a', 'b', 'c', 'd'],
+    'removed and appended': ['a', 'c', 'd', 'e'],
+    'inserted': ['a', 'x', 'b', 'c', 'd'],
+    'first replaced': ['x', 'y', 'b', 'c', 'd'],
+    'reordered': ['d', 'c', 'b', 'a'],
+    'last removed': ['a', 'b', 'c'],
+}
+
+
+@pytest.mark.parametrize('names', LISTS.values(), ids=list(LISTS))
+def test_list_edits_round_trip(names):
+    text = 'models:\n' + ''.join(
+        f"# about {name}\n- name: {name}\n  description: {name} model\n" for name in 'abcd'
+    )
+
+    def mutate(data):
+        by_name = {model['name']: model for model in data['models']}
+        data['models'] = [by_name.get(name, {'name': name}) for name in names]
+
+    patched = _patch(text, mutate)
+
+    for name, following in zip(names, names[1:]):
+        if name + following in 'abcd':
+            # Neighbours that stay neighbours keep their text and comments
+            assert f"- name: {name}\n  description: {name} model\n# about {following}\n" in patched